@@ -0,0 +1,45 @@
+"""Add csv_file_id to bulk_import_jobs
+
+Revision ID: 20261017_000001
+Revises: 20260423_000001
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_000001"
+down_revision: Union[str, None] = "20260423_000001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "bulk_import_jobs",
+        sa.Column("csv_file_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.create_foreign_key(
+        "fk_bulk_import_jobs_csv_file_id",
+        "bulk_import_jobs",
+        "file_entities",
+        ["csv_file_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    # Raw CSV content now lives in object storage; drop any leftover copies
+    op.execute(
+        "UPDATE bulk_import_jobs SET column_mapping = column_mapping - '_csv_content' "
+        "WHERE column_mapping ? '_csv_content'"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "fk_bulk_import_jobs_csv_file_id", "bulk_import_jobs", type_="foreignkey"
+    )
+    op.drop_column("bulk_import_jobs", "csv_file_id")
@@ -0,0 +1,28 @@
+"""Add keyset pagination index on parent_invitations
+
+Revision ID: 20261017_000002
+Revises: 20261017_000001
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_000002"
+down_revision: Union[str, None] = "20261017_000001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_invitations_tenant_created",
+        "parent_invitations",
+        ["tenant_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_invitations_tenant_created", table_name="parent_invitations")
@@ -0,0 +1,37 @@
+"""Extend idx_reports_tenant_date to cover keyset pagination
+
+Revision ID: 20261017_000003
+Revises: 20261017_000002
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_000003"
+down_revision: Union[str, None] = "20261017_000002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_reports_tenant_date", table_name="daily_reports")
+    op.create_index(
+        "idx_reports_tenant_date",
+        "daily_reports",
+        ["tenant_id", "report_date", "created_at", "id"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_reports_tenant_date", table_name="daily_reports")
+    op.create_index(
+        "idx_reports_tenant_date",
+        "daily_reports",
+        ["tenant_id", "report_date"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
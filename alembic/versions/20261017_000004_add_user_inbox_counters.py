@@ -0,0 +1,52 @@
+"""Add user_inbox_counters for O(1) unread message counts
+
+Revision ID: 20261017_000004
+Revises: 20261017_000003
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_000004"
+down_revision: Union[str, None] = "20261017_000003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_inbox_counters",
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "messages_unread",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+    )
+
+    # Seed from the rows the old COUNT query looked at
+    op.execute(
+        """
+        INSERT INTO user_inbox_counters (user_id, messages_unread)
+        SELECT mr.user_id, count(*)
+        FROM message_recipients mr
+        JOIN messages m ON m.id = mr.message_id
+        WHERE mr.is_read = false AND m.deleted_at IS NULL
+        GROUP BY mr.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_inbox_counters")
@@ -0,0 +1,30 @@
+"""Add keyset pagination index on students
+
+Revision ID: 20261017_000005
+Revises: 20261017_000004
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_000005"
+down_revision: Union[str, None] = "20261017_000004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_students_tenant_name",
+        "students",
+        ["tenant_id", "first_name", "last_name", "id"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_students_tenant_name", table_name="students")
@@ -0,0 +1,28 @@
+"""Add keyset pagination index on webhook events
+
+Revision ID: 20261017_000006
+Revises: 20261017_000005
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_000006"
+down_revision: Union[str, None] = "20261017_000005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_webhook_events_endpoint_created",
+        "webhook_events",
+        ["endpoint_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_webhook_events_endpoint_created", table_name="webhook_events")
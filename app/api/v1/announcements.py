@@ -2,7 +2,7 @@
 
 import uuid
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -10,8 +10,14 @@ from app.models.user import Role
 from app.schemas.announcement import AnnouncementCreate, AnnouncementResponse, AnnouncementUpdate
 from app.schemas.common import APIResponse, PaginationMeta
 from app.services.announcement_service import get_announcement_service
+from app.services.cache_service import (
+    ANNOUNCEMENT_LIST_TTL,
+    announcement_version_key,
+    get_cache_service,
+)
 from app.utils.permissions import require_role
-from app.utils.tenant_context import get_current_user_id
+from app.utils.responses import PydanticJSONResponse
+from app.utils.tenant_context import get_current_user_id, get_tenant_id
 
 router = APIRouter()
 
@@ -67,7 +73,22 @@ async def list_announcements(
     page_size: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
 ):
-    """List announcements with optional filters."""
+    """List announcements with optional filters.
+
+    Pages are cached per user (visibility depends on role and classes)
+    under the tenant's announcement version, which writes bump.
+    """
+    tenant_id = get_tenant_id()
+    cache = get_cache_service()
+    version = await cache.get(announcement_version_key(tenant_id)) or "0"
+    cache_key = (
+        f"ann:{tenant_id}:{version}:{get_current_user_id()}:"
+        f"{level}:{severity}:{class_id}:{active_only}:{page}:{page_size}"
+    )
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     service = get_announcement_service()
     announcements, total = await service.get_announcements(
         db,
@@ -81,7 +102,7 @@ async def list_announcements(
 
     total_pages = (total + page_size - 1) // page_size
 
-    return APIResponse(
+    response = PydanticJSONResponse(APIResponse(
         data=[_build_announcement_response(a) for a in announcements],
         pagination=PaginationMeta(
             page=page,
@@ -91,7 +112,9 @@ async def list_announcements(
             has_next=page < total_pages,
             has_prev=page > 1,
         ),
-    )
+    ))
+    await cache.set(cache_key, response.body.decode(), ANNOUNCEMENT_LIST_TTL)
+    return response
 
 
 @router.get("/{announcement_id}", response_model=APIResponse[AnnouncementResponse])
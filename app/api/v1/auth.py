@@ -30,6 +30,7 @@ from app.utils.security import (
     create_password_reset_token,
     decode_password_reset_token,
     hash_password,
+    set_access_token_cookie,
     verify_password,
 )
 from app.rate_limit import limiter
@@ -59,14 +60,7 @@ async def login(
     if body.remember_me:
         cookie_max_age = settings.jwt_refresh_token_expire_days * 24 * 60 * 60
 
-    response.set_cookie(
-        key="access_token",
-        value=login_response.access_token,
-        httponly=True,
-        secure=settings.is_production,
-        samesite="lax",
-        max_age=cookie_max_age,
-    )
+    set_access_token_cookie(response, login_response.access_token, cookie_max_age)
 
     return APIResponse(
         data=login_response,
@@ -102,13 +96,10 @@ async def refresh_token(
     login_response = await auth_service.refresh_token(db, request.refresh_token)
 
     # Update cookie
-    response.set_cookie(
-        key="access_token",
-        value=login_response.access_token,
-        httponly=True,
-        secure=settings.is_production,
-        samesite="lax",
-        max_age=settings.jwt_access_token_expire_minutes * 60,
+    set_access_token_cookie(
+        response,
+        login_response.access_token,
+        settings.jwt_access_token_expire_minutes * 60,
     )
 
     return APIResponse(data=login_response)
@@ -283,11 +274,9 @@ async def verify_invitation(
     the parent registration flow.
     """
     auth_service = get_auth_service()
-    is_valid, invitation = await auth_service.verify_invitation(
-        db, request.code, request.email
-    )
+    verified = await auth_service.verify_invitation(db, request.code, request.email)
 
-    if not is_valid or not invitation:
+    if not verified:
         return APIResponse(
             data=VerifyInvitationResponse(
                 valid=False,
@@ -295,24 +284,7 @@ async def verify_invitation(
             )
         )
 
-    # Get student and school names
-    student_name = None
-    school_name = None
-
-    if invitation.student:
-        student_name = invitation.student.full_name
-    if invitation.tenant:
-        school_name = invitation.tenant.name
-
-    return APIResponse(
-        data=VerifyInvitationResponse(
-            valid=True,
-            student_name=student_name,
-            school_name=school_name,
-            first_name=invitation.first_name if invitation.first_name else None,
-            last_name=invitation.last_name if invitation.last_name else None,
-        )
-    )
+    return APIResponse(data=verified)
 
 
 @router.post("/trial-signup", response_model=APIResponse[None])
@@ -5,7 +5,7 @@ import logging
 import uuid
 
 from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
@@ -69,6 +69,28 @@ def _build_class_list_response(school_class) -> SchoolClassListResponse:
     )
 
 
+def _build_class_list_row_response(row) -> SchoolClassListResponse:
+    """Build class list response from a ClassService.stream_classes row.
+
+    Counts and names are already computed in SQL; no relationships are read.
+    """
+    school_class = row.SchoolClass
+    return SchoolClassListResponse(
+        id=school_class.id,
+        name=school_class.name,
+        description=school_class.description,
+        age_group=school_class.age_group,  # DEPRECATED
+        grade_level=school_class.grade_level,  # DEPRECATED
+        grade_level_id=school_class.grade_level_id,
+        grade_level_name=row.grade_level_name,
+        capacity=school_class.capacity,
+        is_active=school_class.is_active,
+        student_count=row.student_count,
+        teacher_count=row.teacher_count,
+        primary_teacher_name=row.primary_teacher_name,
+    )
+
+
 def _build_class_response(school_class) -> SchoolClassResponse:
     """Build class response with computed fields."""
     student_count = len([s for s in school_class.students if s.deleted_at is None and s.is_active])
@@ -150,7 +172,7 @@ async def list_classes(
     School admins see all classes in their tenant.
     """
     service = get_class_service()
-    classes, total = await service.get_classes(
+    classes, total = await service.stream_classes(
         db,
         is_active=is_active,
         grade_level_id=grade_level_id,
@@ -160,11 +182,12 @@ async def list_classes(
         page=page,
         page_size=page_size,
     )
+    data = [_build_class_list_row_response(row) async for row in classes]
 
     total_pages = (total + page_size - 1) // page_size
 
     return APIResponse(
-        data=[_build_class_list_response(c) for c in classes],
+        data=data,
         pagination=PaginationMeta(
             page=page,
             page_size=page_size,
@@ -518,7 +541,7 @@ async def select_class(
         from app.exceptions import ForbiddenException
         raise ForbiddenException("You are not assigned to this class")
 
-    response = JSONResponse(
+    response = ORJSONResponse(
         content={
             "status": "success",
             "data": {"selected_class_id": str(class_id)},
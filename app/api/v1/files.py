@@ -1,5 +1,6 @@
 """File API endpoints."""
 
+import asyncio
 import uuid
 
 from fastapi import APIRouter, Depends, File, Form, Query, UploadFile
@@ -8,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.models.file_entity import FileCategory
 from app.models.user import Role
-from app.schemas.common import APIResponse, PaginationMeta
+from app.schemas.common import APIResponse
 from app.schemas.file import (
     FileEntityResponse,
     FileListResponse,
@@ -16,11 +17,23 @@ from app.schemas.file import (
     PresignedUrlResponse,
 )
 from app.services.file_service import get_file_service
+from app.utils.pagination import pagination_meta
 from app.utils.permissions import require_role
+from app.utils.responses import PydanticJSONResponse
 
 
 router = APIRouter()
 
+# Categories users may upload and list; IMPORT is internal to bulk imports
+_USER_CATEGORIES = (
+    FileCategory.PHOTO,
+    FileCategory.DOCUMENT,
+    FileCategory.AVATAR,
+    FileCategory.LOGO,
+)
+_CATEGORY_SET = frozenset(c.value for c in _USER_CATEGORIES)
+_CATEGORY_NAMES = ", ".join(c.value for c in _USER_CATEGORIES)
+
 
 def _build_file_response(file_entity, download_url: str | None = None) -> FileUploadResponse:
     """Build file upload response."""
@@ -41,7 +54,11 @@ def _build_file_response(file_entity, download_url: str | None = None) -> FileUp
 
 
 def _build_file_entity_response(file_entity, service) -> FileEntityResponse:
-    """Build full file entity response with download URL."""
+    """Build full file entity response with download URL.
+
+    file_entity.uploader is selectin-loaded by FileService.get_file and
+    get_files, so reading it here does no IO on the async session.
+    """
     download_url = service.generate_presigned_url(file_entity)
     return FileEntityResponse(
         id=file_entity.id,
@@ -61,7 +78,7 @@ def _build_file_entity_response(file_entity, service) -> FileEntityResponse:
     )
 
 
-def _build_file_list_response(file_entity) -> FileListResponse:
+def _build_file_list_response(file_entity, download_url: str | None = None) -> FileListResponse:
     """Build simplified file list response."""
     return FileListResponse(
         id=file_entity.id,
@@ -71,9 +88,27 @@ def _build_file_list_response(file_entity) -> FileListResponse:
         file_category=file_entity.file_category,
         created_at=file_entity.created_at,
         is_image=file_entity.is_image,
+        download_url=download_url,
     )
 
 
+async def _build_file_list_responses(
+    files, service, include_urls: bool
+) -> list[FileListResponse]:
+    """Build list responses for a page of files, signing URLs off the event loop.
+
+    The whole page is signed in one worker-thread hop rather than one
+    thread per URL; signing is cheap per URL, the thread handoff is not.
+    """
+    if not include_urls:
+        return [_build_file_list_response(f) for f in files]
+
+    urls = await asyncio.to_thread(
+        lambda: [service.generate_presigned_url(f) for f in files]
+    )
+    return [_build_file_list_response(f, url) for f, url in zip(files, urls)]
+
+
 @router.post("/upload", response_model=APIResponse[FileUploadResponse])
 @require_role(Role.SCHOOL_ADMIN, Role.TEACHER)
 async def upload_file(
@@ -93,13 +128,13 @@ async def upload_file(
         entity_id: Optional related entity ID
     """
     # Validate category
-    try:
-        category = FileCategory(file_category.upper())
-    except ValueError:
+    category_name = file_category.upper()
+    if category_name not in _CATEGORY_SET:
         return APIResponse(
             status="error",
-            message=f"Invalid file category. Must be one of: {', '.join(c.value for c in FileCategory)}",
+            message=f"Invalid file category. Must be one of: {_CATEGORY_NAMES}",
         )
+    category = FileCategory(category_name)
 
     service = get_file_service()
     file_entity = await service.upload_file(db, file, category, entity_id)
@@ -121,31 +156,31 @@ async def list_files(
     category: str | None = Query(None, description="Filter by category (PHOTO, DOCUMENT, etc.)"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    include_urls: bool = Query(False, description="Include presigned download URLs"),
+    count: bool = Query(True, description="Include total_items/total_pages"),
     db: AsyncSession = Depends(get_db),
 ):
-    """List uploaded files with optional filtering."""
+    """List uploaded files with optional filtering.
+
+    Download URLs are only signed when include_urls is set; signed URLs
+    are served from the file service's presigned URL cache. count=false
+    skips counting the total and only reports has_next/has_prev.
+    """
     file_category = None
-    if category:
-        try:
-            file_category = FileCategory(category.upper())
-        except ValueError:
-            pass
+    if category and category.upper() in _CATEGORY_SET:
+        file_category = FileCategory(category.upper())
 
     service = get_file_service()
-    files, total = await service.get_files(db, category=file_category, page=page, page_size=page_size)
-
-    total_pages = (total + page_size - 1) // page_size
+    files, total = await service.get_files(
+        db, category=file_category, page=page, page_size=page_size, count=count
+    )
+    files, pagination = pagination_meta(files, page, page_size, total)
 
-    return APIResponse(
-        data=[_build_file_list_response(f) for f in files],
-        pagination=PaginationMeta(
-            page=page,
-            page_size=page_size,
-            total_items=total,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_prev=page > 1,
-        ),
+    return PydanticJSONResponse(
+        APIResponse(
+            data=await _build_file_list_responses(files, service, include_urls),
+            pagination=pagination,
+        )
     )
 
 
@@ -3,9 +3,11 @@
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.exceptions import ConflictException
 from app.schemas.grade_level import (
     GradeLevelCreate,
     GradeLevelUpdate,
@@ -13,10 +15,15 @@ from app.schemas.grade_level import (
     GradeLevelListResponse,
 )
 from app.services.grade_level_service import get_grade_level_service
+from app.utils.pagination import pagination_meta
 from app.utils.permissions import require_role
+from app.utils.responses import PydanticJSONResponse
 
 router = APIRouter()
 
+# Validates a page of list rows in one pydantic-core call
+_GRADE_LEVEL_LIST = TypeAdapter(list[GradeLevelListResponse])
+
 
 @router.get("", response_model=dict)
 @require_role("SCHOOL_ADMIN", "TEACHER")
@@ -24,26 +31,21 @@ async def list_grade_levels(
     is_active: bool | None = True,
     page: int = Query(1, ge=1),
     page_size: int = Query(100, ge=1, le=200),
+    count: bool = Query(True, description="Include total_items/total_pages"),
     db: AsyncSession = Depends(get_db),
 ):
     """List all grade levels for the current tenant."""
     service = get_grade_level_service()
-    grade_levels, total = await service.get_grade_levels(
-        db, is_active=is_active, page=page, page_size=page_size
+    grade_levels, total = await service.get_grade_level_rows(
+        db, is_active=is_active, page=page, page_size=page_size, count=count
     )
+    grade_levels, pagination = pagination_meta(grade_levels, page, page_size, total)
 
-    return {
+    return PydanticJSONResponse({
         "status": "success",
-        "data": [GradeLevelListResponse.model_validate(gl) for gl in grade_levels],
-        "pagination": {
-            "page": page,
-            "page_size": page_size,
-            "total_items": total,
-            "total_pages": (total + page_size - 1) // page_size,
-            "has_next": page * page_size < total,
-            "has_prev": page > 1,
-        },
-    }
+        "data": _GRADE_LEVEL_LIST.validate_python(grade_levels, from_attributes=True),
+        "pagination": pagination,
+    })
 
 
 @router.get("/templates", response_model=dict)
@@ -91,14 +93,7 @@ async def create_grade_level(
     """Create a new grade level."""
     service = get_grade_level_service()
 
-    # Check if code already exists
-    existing = await service.get_grade_level_by_code(db, data.code)
-    if existing:
-        raise HTTPException(
-            status_code=409,
-            detail=f"Grade level with code '{data.code}' already exists",
-        )
-
+    # Uniqueness is enforced by the insert itself (ON CONFLICT DO NOTHING)
     grade_level = await service.create_grade_level(
         db,
         name=data.name,
@@ -106,6 +101,11 @@ async def create_grade_level(
         description=data.description,
         display_order=data.display_order,
     )
+    if grade_level is None:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Grade level with code '{data.code}' already exists",
+        )
 
     return {
         "status": "success",
@@ -124,20 +124,15 @@ async def update_grade_level(
     """Update a grade level."""
     service = get_grade_level_service()
 
-    # Check if code is being changed and if it conflicts
-    if data.code:
-        existing = await service.get_grade_level_by_code(db, data.code)
-        if existing and existing.id != grade_level_id:
-            raise HTTPException(
-                status_code=409,
-                detail=f"Grade level with code '{data.code}' already exists",
-            )
-
-    grade_level = await service.update_grade_level(
-        db,
-        grade_level_id,
-        **data.model_dump(exclude_unset=True),
-    )
+    # A code change is checked for conflicts inside the UPDATE itself
+    try:
+        grade_level = await service.update_grade_level(
+            db,
+            grade_level_id,
+            **data.model_dump(exclude_unset=True),
+        )
+    except ConflictException as e:
+        raise HTTPException(status_code=409, detail=e.message)
 
     if not grade_level:
         raise HTTPException(status_code=404, detail="Grade level not found")
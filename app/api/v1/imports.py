@@ -1,11 +1,25 @@
 """Bulk import API endpoints."""
 
+import csv
+import hashlib
 import logging
 from io import BytesIO
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
 from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,32 +35,45 @@ from app.schemas.import_job import (
 )
 from app.services.enrollment_template_service import get_enrollment_template_service
 from app.services.import_service import IMPORT_FIELDS, get_import_service
+from app.utils.pagination import pagination_meta
 from app.utils.permissions import require_role
+from app.utils.responses import PydanticJSONResponse
 from app.utils.tenant_context import get_tenant_id
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# IMPORT_FIELDS is static, so the /fields response is built and rendered once
+_FIELDS_PAYLOAD = {
+    import_type: [
+        ImportFieldInfo(
+            name=name,
+            label=info["label"],
+            required=info.get("required", False),
+        )
+        for name, info in field_defs.items()
+    ]
+    for import_type, field_defs in IMPORT_FIELDS.items()
+}
+_FIELDS_BODY = to_json(APIResponse(status="success", data=_FIELDS_PAYLOAD))
+_FIELDS_ETAG = f'"{hashlib.sha256(_FIELDS_BODY).hexdigest()[:32]}"'
+
+# Validates a page of job rows in one pydantic-core call
+_JOB_LIST = TypeAdapter(list[ImportJobResponse])
+
 
 @router.get("/fields", response_model=APIResponse)
 @require_role("SCHOOL_ADMIN")
-async def get_import_fields():
+async def get_import_fields(request: Request):
     """Get available fields for each import type."""
-    fields = {}
-    for import_type, field_defs in IMPORT_FIELDS.items():
-        fields[import_type] = [
-            ImportFieldInfo(
-                name=name,
-                label=info["label"],
-                required=info.get("required", False),
-            )
-            for name, info in field_defs.items()
-        ]
+    if request.headers.get("if-none-match") == _FIELDS_ETAG:
+        return Response(status_code=304, headers={"ETag": _FIELDS_ETAG})
 
-    return APIResponse(
-        status="success",
-        data=fields,
+    return Response(
+        content=_FIELDS_BODY,
+        media_type="application/json",
+        headers={"ETag": _FIELDS_ETAG},
     )
 
 
@@ -64,21 +91,17 @@ async def upload_csv(
     if not file.filename or not file.filename.endswith(".csv"):
         raise HTTPException(status_code=400, detail="File must be a CSV")
 
-    # Read file content
+    # Parse straight from the spooled upload rather than buffering it
     try:
-        content = await file.read()
-        csv_content = content.decode("utf-8-sig")  # Handle BOM
-    except Exception as e:
+        job, headers, sample_rows, total_rows = await service.create_job(
+            db,
+            file_name=file.filename,
+            import_type=import_type.value,
+            csv_file=file.file,
+        )
+    except (ValueError, csv.Error) as e:
         raise HTTPException(status_code=400, detail=f"Failed to read file: {e}")
 
-    # Create job and get preview
-    job, headers, sample_rows, total_rows = await service.create_job(
-        db,
-        file_name=file.filename,
-        import_type=import_type.value,
-        csv_content=csv_content,
-    )
-
     # Get available fields for this import type
     available_fields = {
         import_type.value: list(IMPORT_FIELDS.get(import_type.value, {}).keys())
@@ -204,14 +227,17 @@ async def upload_enrollment(
         raise HTTPException(status_code=500, detail=f"Failed to process enrollment: {e}")
 
 
-@router.post("/{job_id}/start", response_model=APIResponse)
+@router.post("/{job_id}/start", response_model=APIResponse, status_code=202)
 @require_role("SCHOOL_ADMIN")
 async def start_import(
     job_id: UUID,
     data: ImportJobStart,
     db: AsyncSession = Depends(get_db),
 ):
-    """Start processing an import job with column mapping."""
+    """Start processing an import job with column mapping.
+
+    Returns 202 once the job is queued; poll GET /{job_id} for progress.
+    """
     service = get_import_service()
 
     try:
@@ -235,7 +261,7 @@ async def start_import(
                 completed_at=job.completed_at,
                 created_at=job.created_at,
             ),
-            message=f"Import completed: {job.success_count} succeeded, {job.error_count} failed",
+            message="Import started",
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -254,9 +280,6 @@ async def get_job(
     if not job:
         raise HTTPException(status_code=404, detail="Import job not found")
 
-    # Don't expose CSV content in column_mapping
-    column_mapping = {k: v for k, v in (job.column_mapping or {}).items() if k != "_csv_content"}
-
     return APIResponse(
         status="success",
         data=ImportJobResponse(
@@ -270,7 +293,7 @@ async def get_job(
             success_count=job.success_count,
             error_count=job.error_count,
             errors=job.errors or [],
-            column_mapping=column_mapping,
+            column_mapping=job.column_mapping or {},
             created_by=job.created_by,
             completed_at=job.completed_at,
             created_at=job.created_at,
@@ -297,45 +320,46 @@ async def get_job_errors(
     )
 
 
+@router.get("/{job_id}/errors/stream")
+@require_role("SCHOOL_ADMIN")
+async def stream_job_errors(
+    job_id: UUID,
+    db: AsyncSession = Depends(get_db),
+):
+    """Stream errors from an import job as NDJSON, one error per line."""
+    service = get_import_service()
+
+    if not await service.has_job(db, job_id):
+        raise HTTPException(status_code=404, detail="Import job not found")
+
+    # Resolve the tenant now; the body is streamed after request context is gone
+    errors = service.stream_job_errors(job_id, get_tenant_id())
+
+    return StreamingResponse(
+        (f"{error}\n" async for error in errors),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.get("", response_model=APIResponse)
 @require_role("SCHOOL_ADMIN")
 async def list_jobs(
     page: int = 1,
     page_size: int = 20,
+    count: bool = True,
     db: AsyncSession = Depends(get_db),
 ):
-    """List import jobs."""
+    """List import jobs. count=false skips counting the total."""
     service = get_import_service()
 
-    jobs, total = await service.list_jobs(db, page=page, page_size=page_size)
+    jobs, total = await service.list_job_rows(
+        db, page=page, page_size=page_size, count=count
+    )
+    jobs, pagination = pagination_meta(jobs, page, page_size, total)
 
-    return APIResponse(
+    # errors and column_mapping aren't selected, so they take their defaults
+    return PydanticJSONResponse(APIResponse(
         status="success",
-        data=[
-            ImportJobResponse(
-                id=job.id,
-                tenant_id=job.tenant_id,
-                import_type=job.import_type,
-                file_name=job.file_name,
-                status=job.status,
-                total_rows=job.total_rows,
-                processed_rows=job.processed_rows,
-                success_count=job.success_count,
-                error_count=job.error_count,
-                errors=[],  # Don't include full errors in list
-                column_mapping={},
-                created_by=job.created_by,
-                completed_at=job.completed_at,
-                created_at=job.created_at,
-            )
-            for job in jobs
-        ],
-        pagination={
-            "page": page,
-            "page_size": page_size,
-            "total_items": total,
-            "total_pages": (total + page_size - 1) // page_size,
-            "has_next": page * page_size < total,
-            "has_prev": page > 1,
-        },
-    )
+        data=_JOB_LIST.validate_python(jobs, from_attributes=True),
+        pagination=pagination,
+    ))
@@ -1,31 +1,92 @@
 """Parent invitation API endpoints."""
 
 import logging
+from datetime import datetime
+from urllib.parse import quote_plus
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy import and_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.database import get_db
+from app.models import ParentStudent, Student, User
 from app.schemas.common import APIResponse
 from app.schemas.invitation import (
     InvitationCreate,
     InvitationListResponse,
     InvitationResponse,
+    InvitationStatus,
     InvitationVerify,
     InvitationVerifyResponse,
 )
 from app.services.email_service import get_email_service
-from app.services.invitation_service import get_invitation_service
+from app.services.invitation_service import (
+    INVITATION_LIST_OPTIONS,
+    get_invitation_service,
+)
+from app.services.tenant_service import get_tenant_service
+from app.utils.pagination import decode_cursor, encode_cursor
 from app.utils.permissions import require_role
+from app.utils.responses import PydanticJSONResponse
+from app.utils.tenant_context import get_tenant_id
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 router = APIRouter()
 
+REGISTER_URL_BASE = f"{settings.app_base_url}/register"
+LOGIN_URL = f"{settings.app_base_url}/login"
+
+
+async def _send_invitation_email(
+    to: str,
+    invitation_code: str,
+    tenant_name: str,
+    student_name: str,
+) -> None:
+    """Background task: email a parent their invitation code."""
+    register_url = (
+        f"{REGISTER_URL_BASE}?code={quote_plus(invitation_code)}&email={quote_plus(to)}"
+    )
+    try:
+        await get_email_service().send_parent_invitation(
+            to=to,
+            tenant_name=tenant_name,
+            student_name=student_name,
+            invitation_code=invitation_code,
+            register_url=register_url,
+        )
+    except Exception as e:
+        logger.error(f"Failed to send invitation email: {e}")
+
+
+async def _send_child_linked_email(
+    to: str,
+    parent_name: str,
+    student_name: str,
+    tenant_name: str,
+) -> None:
+    """Background task: tell an existing parent a child was linked to them."""
+    try:
+        await get_email_service().send(
+            to=to,
+            subject=f"A new child has been linked to your {tenant_name} account",
+            template_name="parent_link_child.html",
+            context={
+                "parent_name": parent_name,
+                "student_name": student_name,
+                "tenant_name": tenant_name,
+                "login_url": LOGIN_URL,
+                "app_name": settings.app_name,
+            },
+        )
+    except Exception as e:
+        logger.error(f"Failed to send child-linked email: {e}")
+
 
 @router.get("", response_model=APIResponse)
 @require_role("SCHOOL_ADMIN", "TEACHER")
@@ -34,35 +95,57 @@ async def list_invitations(
     student_id: UUID | None = None,
     page: int = 1,
     page_size: int = 20,
+    cursor: str | None = None,
     db: AsyncSession = Depends(get_db),
 ):
-    """List parent invitations."""
+    """List parent invitations, newest first.
+
+    Pass the previous response's next_cursor as cursor to page by keyset,
+    which stays fast however deep the page; page/total are kept for
+    existing clients but cost an OFFSET scan and a count.
+    """
     service = get_invitation_service()
 
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor, datetime, UUID)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
     invitations, total = await service.list_invitations(
         db,
         status=status,
         student_id=student_id,
         page=page,
         page_size=page_size,
+        options=INVITATION_LIST_OPTIONS,
+        after=after,
     )
-
-    # Enrich with student/creator names
-    from app.models import Student, User
-
+    if total is None:
+        has_more = len(invitations) > page_size
+        invitations = invitations[:page_size]
+    else:
+        has_more = page * page_size < total
+    next_cursor = None
+    if has_more and invitations:
+        next_cursor = encode_cursor(invitations[-1].created_at, invitations[-1].id)
+
+    # Student and creator are eager-loaded, so reading them does no IO.
+    # Rows come straight from the database, so skip per-item validation.
     response_items = []
     for inv in invitations:
-        student = await db.get(Student, inv.student_id)
-        creator = await db.get(User, inv.created_by)
+        student = inv.student
+        creator = inv.created_by_user
 
         response_items.append(
-            InvitationResponse(
+            InvitationResponse.model_construct(
                 id=inv.id,
                 tenant_id=inv.tenant_id,
                 student_id=inv.student_id,
                 email=inv.email,
                 invitation_code=inv.invitation_code,
-                status=inv.status,
+                status=InvitationStatus(inv.status),
                 created_by=inv.created_by,
                 expires_at=inv.expires_at,
                 accepted_at=inv.accepted_at,
@@ -72,90 +155,78 @@ async def list_invitations(
             )
         )
 
-    return APIResponse(
+    return PydanticJSONResponse(APIResponse(
         status="success",
-        data=InvitationListResponse(
+        data=InvitationListResponse.model_construct(
             invitations=response_items,
             total=total,
             page=page,
             page_size=page_size,
+            next_cursor=next_cursor,
         ),
-    )
+    ))
 
 
-@router.post("", response_model=APIResponse)
+@router.post("", response_model=APIResponse, status_code=202)
 @require_role("SCHOOL_ADMIN", "TEACHER")
 async def create_invitation(
     data: InvitationCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
-    """Create a new parent invitation."""
+    """Create a new parent invitation.
+
+    Emails are sent after the response, so SMTP latency doesn't hold it up.
+    """
     service = get_invitation_service()
-    email_service = get_email_service()
 
     try:
         # Check if a parent with this email already exists in the tenant
-        from app.models import ParentStudent, Student, Tenant, User
-        from app.utils.tenant_context import get_tenant_id
-
         tenant_id = get_tenant_id()
-        existing_parent_result = await db.execute(
+        existing_parent = await db.scalar(
             select(User).where(
                 and_(
-                    User.email == data.email.lower(),
+                    User.email == data.email,
                     User.tenant_id == tenant_id,
                     User.role == "PARENT",
                     User.deleted_at.is_(None),
                 )
             )
         )
-        existing_parent = existing_parent_result.scalar_one_or_none()
 
         if existing_parent:
-            # Check if already linked to this student
-            existing_link = await db.execute(
-                select(ParentStudent).where(
-                    and_(
-                        ParentStudent.parent_id == existing_parent.id,
-                        ParentStudent.student_id == data.student_id,
-                    )
+            # Auto-link the existing parent to the student. The unique
+            # (parent_id, student_id) constraint detects an existing link
+            # in the same statement, with no check-then-insert race.
+            linked_id = await db.scalar(
+                pg_insert(ParentStudent)
+                .values(
+                    parent_id=existing_parent.id,
+                    student_id=data.student_id,
+                    relationship_type="PARENT",
+                    is_primary=False,
                 )
+                .on_conflict_do_nothing(index_elements=["parent_id", "student_id"])
+                .returning(ParentStudent.id)
             )
-            if existing_link.scalar_one_or_none():
+            if linked_id is None:
                 raise HTTPException(
                     status_code=400,
                     detail="This parent is already linked to this student",
                 )
-
-            # Auto-link the existing parent to the student
-            parent_student = ParentStudent(
-                parent_id=existing_parent.id,
-                student_id=data.student_id,
-                relationship_type="PARENT",
-                is_primary=False,
-            )
-            db.add(parent_student)
             await db.commit()
 
             # Send "child linked" notification email
             student = await db.get(Student, data.student_id)
-            tenant = await db.get(Tenant, tenant_id)
-            if student and tenant:
-                try:
-                    await email_service.send(
-                        to=existing_parent.email,
-                        subject=f"A new child has been linked to your {tenant.name} account",
-                        template_name="parent_link_child.html",
-                        context={
-                            "parent_name": existing_parent.first_name,
-                            "student_name": f"{student.first_name} {student.last_name}",
-                            "tenant_name": tenant.name,
-                            "login_url": f"{settings.app_base_url}/login",
-                            "app_name": settings.app_name,
-                        },
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to send child-linked email: {e}")
+            tenant_name = await get_tenant_service().get_tenant_name(db, tenant_id)
+            if student and tenant_name:
+                background_tasks.add_task(
+                    _send_child_linked_email,
+                    to=existing_parent.email,
+                    parent_name=existing_parent.first_name,
+                    student_name=f"{student.first_name} {student.last_name}",
+                    tenant_name=tenant_name,
+                )
 
             return APIResponse(
                 status="success",
@@ -172,28 +243,19 @@ async def create_invitation(
             last_name=data.last_name,
         )
 
-        # Get student and tenant info for email
-        student = await db.get(Student, invitation.student_id)
-        tenant = await db.get(Tenant, invitation.tenant_id)
+        # Student is eager-loaded; the tenant name comes from the cache
+        student = invitation.student
+        tenant_name = await get_tenant_service().get_tenant_name(db, invitation.tenant_id)
 
         # Send invitation email
-        if student and tenant:
-            from urllib.parse import urlencode
-            params = urlencode({
-                "code": invitation.invitation_code,
-                "email": invitation.email,
-            })
-            register_url = f"{settings.app_base_url}/register?{params}"
-            try:
-                await email_service.send_parent_invitation(
-                    to=invitation.email,
-                    tenant_name=tenant.name,
-                    student_name=f"{student.first_name} {student.last_name}",
-                    invitation_code=invitation.invitation_code,
-                    register_url=register_url,
-                )
-            except Exception as e:
-                logger.error(f"Failed to send invitation email: {e}")
+        if student and tenant_name:
+            background_tasks.add_task(
+                _send_invitation_email,
+                to=invitation.email,
+                invitation_code=invitation.invitation_code,
+                tenant_name=tenant_name,
+                student_name=f"{student.first_name} {student.last_name}",
+            )
 
         return APIResponse(
             status="success",
@@ -209,7 +271,7 @@ async def create_invitation(
                 created_at=invitation.created_at,
                 student_name=f"{student.first_name} {student.last_name}" if student else None,
             ),
-            message="Invitation created and email sent",
+            message="Invitation created; the email is on its way",
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -244,10 +306,9 @@ async def get_invitation(
     if not invitation:
         raise HTTPException(status_code=404, detail="Invitation not found")
 
-    from app.models import Student, User
-
-    student = await db.get(Student, invitation.student_id)
-    creator = await db.get(User, invitation.created_by)
+    # Eager-loaded relationships; no further queries
+    student = invitation.student
+    creator = invitation.created_by_user
 
     return APIResponse(
         status="success",
@@ -287,45 +348,34 @@ async def cancel_invitation(
     )
 
 
-@router.post("/{invitation_id}/resend", response_model=APIResponse)
+@router.post("/{invitation_id}/resend", response_model=APIResponse, status_code=202)
 @require_role("SCHOOL_ADMIN", "TEACHER")
 async def resend_invitation(
     invitation_id: UUID,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Resend an invitation email with a new code."""
     service = get_invitation_service()
-    email_service = get_email_service()
 
     try:
         invitation = await service.resend_invitation(db, invitation_id)
         if not invitation:
             raise HTTPException(status_code=404, detail="Invitation not found")
 
-        # Get student and tenant info for email
-        from app.models import Student, Tenant
-
-        student = await db.get(Student, invitation.student_id)
-        tenant = await db.get(Tenant, invitation.tenant_id)
+        # Student is eager-loaded; the tenant name comes from the cache
+        student = invitation.student
+        tenant_name = await get_tenant_service().get_tenant_name(db, invitation.tenant_id)
 
         # Send invitation email
-        if student and tenant:
-            from urllib.parse import urlencode
-            params = urlencode({
-                "code": invitation.invitation_code,
-                "email": invitation.email,
-            })
-            register_url = f"{settings.app_base_url}/register?{params}"
-            try:
-                await email_service.send_parent_invitation(
-                    to=invitation.email,
-                    tenant_name=tenant.name,
-                    student_name=f"{student.first_name} {student.last_name}",
-                    invitation_code=invitation.invitation_code,
-                    register_url=register_url,
-                )
-            except Exception as e:
-                logger.error(f"Failed to send invitation email: {e}")
+        if student and tenant_name:
+            background_tasks.add_task(
+                _send_invitation_email,
+                to=invitation.email,
+                invitation_code=invitation.invitation_code,
+                tenant_name=tenant_name,
+                student_name=f"{student.first_name} {student.last_name}",
+            )
 
         return APIResponse(
             status="success",
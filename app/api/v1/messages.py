@@ -2,7 +2,7 @@
 
 import uuid
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -17,14 +17,14 @@ from app.schemas.message import (
 )
 from app.services.message_service import get_message_service
 from app.utils.permissions import require_role
-from app.utils.tenant_context import get_current_user_id
+from app.utils.responses import PydanticJSONResponse
 
 router = APIRouter()
 
 
 def _build_message_response(message) -> MessageResponse:
-    """Build a message response from a Message model."""
-    return MessageResponse(
+    """Build a message response from a Message model, unvalidated."""
+    return MessageResponse.model_construct(
         id=message.id,
         sender_id=message.sender_id,
         sender_name=(
@@ -43,10 +43,7 @@ def _build_message_response(message) -> MessageResponse:
         class_name=message.school_class.name if message.school_class else None,
         parent_message_id=message.parent_message_id,
         status=message.status,
-        is_read=any(
-            r.is_read for r in message.recipients
-            if r.user_id == get_current_user_id()
-        ) if message.recipients else True,
+        is_read=message.read_by_current_user,
         created_at=message.created_at,
         updated_at=message.updated_at,
     )
@@ -59,14 +56,18 @@ async def list_conversations(
     page_size: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
 ):
-    """List conversations (inbox)."""
+    """List conversations (inbox).
+
+    The rows are built from database projections, so they are constructed
+    without validation and serialized straight by pydantic-core.
+    """
     service = get_message_service()
     conversations, total = await service.get_conversations(db, page=page, page_size=page_size)
 
     total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
-    return APIResponse(
-        data=[ConversationSummary(**c) for c in conversations],
+    return PydanticJSONResponse(APIResponse(
+        data=[ConversationSummary.model_construct(**c) for c in conversations],
         pagination=PaginationMeta(
             page=page,
             page_size=page_size,
@@ -75,7 +76,7 @@ async def list_conversations(
             has_next=page < total_pages,
             has_prev=page > 1,
         ),
-    )
+    ))
 
 
 @router.get("/unread-count", response_model=APIResponse[UnreadCountResponse])
@@ -116,7 +117,7 @@ async def get_thread(
 
     total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
-    return APIResponse(
+    return PydanticJSONResponse(APIResponse(
         data=[_build_message_response(m) for m in messages],
         pagination=PaginationMeta(
             page=page,
@@ -126,18 +127,23 @@ async def get_thread(
             has_next=page < total_pages,
             has_prev=page > 1,
         ),
-    )
+    ))
 
 
 @router.post("", response_model=APIResponse[MessageResponse])
 @require_role(Role.SCHOOL_ADMIN, Role.TEACHER, Role.PARENT)
 async def send_message(
     data: MessageCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
-    """Send a new message."""
+    """Send a new message.
+
+    Notifications (in-app, email, WebSocket) go out after the response.
+    """
     service = get_message_service()
-    message = await service.send_message(db, data.model_dump())
+    message, recipient_id = await service.send_message(db, data.model_dump())
+    background_tasks.add_task(service.send_message_notifications, message, recipient_id)
     return APIResponse(
         data=_build_message_response(message),
         message="Message sent",
@@ -149,11 +155,16 @@ async def send_message(
 async def reply_to_thread(
     thread_id: uuid.UUID,
     data: MessageReply,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
-    """Reply to a conversation thread."""
+    """Reply to a conversation thread.
+
+    Notifications (in-app, email, WebSocket) go out after the response.
+    """
     service = get_message_service()
-    message = await service.reply_to_thread(db, thread_id, data.body)
+    message, recipient_id = await service.reply_to_thread(db, thread_id, data.body)
+    background_tasks.add_task(service.send_message_notifications, message, recipient_id)
     return APIResponse(
         data=_build_message_response(message),
         message="Reply sent",
@@ -1,7 +1,7 @@
 """Report API endpoints."""
 
 import uuid
-from datetime import date
+from datetime import date, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,8 +20,15 @@ from app.schemas.report import (
     ReportTemplateUpdate,
     ReportUpdate,
 )
-from app.services.report_service import get_report_service
+from app.services.report_service import (
+    cache_template_response,
+    get_cached_template_response,
+    get_report_service,
+)
+from app.utils.pagination import decode_cursor, encode_cursor, pagination_meta
 from app.utils.permissions import require_role
+from app.utils.responses import PydanticJSONResponse
+from app.utils.tenant_context import get_tenant_id
 
 router = APIRouter()
 
@@ -140,10 +147,11 @@ async def list_templates(
         page_size=page_size,
     )
 
-    return {
-        "status": "success",
-        "data": [_build_template_list_item(t) for t in templates],
-        "pagination": PaginationMeta(
+    # List items are plain dicts shaped like ReportTemplateListResponse;
+    # serialize them directly rather than revalidating every row.
+    return PydanticJSONResponse(APIResponse(
+        data=[_build_template_list_item(t) for t in templates],
+        pagination=PaginationMeta(
             page=page,
             page_size=page_size,
             total_items=total,
@@ -151,7 +159,7 @@ async def list_templates(
             has_next=page * page_size < total,
             has_prev=page > 1,
         ),
-    }
+    ))
 
 
 @router.post("/templates", response_model=APIResponse[ReportTemplateResponse])
@@ -181,10 +189,9 @@ async def get_templates_for_student(
     service = get_report_service()
     templates = await service.get_templates_for_student(db, student_id)
 
-    return {
-        "status": "success",
-        "data": [_build_template_list_item(t) for t in templates],
-    }
+    return PydanticJSONResponse(APIResponse(
+        data=[_build_template_list_item(t) for t in templates],
+    ))
 
 
 @router.get("/templates/{template_id}", response_model=APIResponse[ReportTemplateResponse])
@@ -193,16 +200,22 @@ async def get_template(
     template_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
-    """Get a specific report template."""
-    service = get_report_service()
-    template = await service.get_template(db, template_id)
+    """Get a specific report template (cached in-process)."""
+    tenant_id = get_tenant_id()
+    response = get_cached_template_response(tenant_id, template_id)
+    if response is None:
+        service = get_report_service()
+        template = await service.get_template(db, template_id)
 
-    if not template:
-        raise HTTPException(status_code=404, detail="Template not found")
+        if not template:
+            raise HTTPException(status_code=404, detail="Template not found")
+
+        response = _build_template_response(template)
+        cache_template_response(tenant_id, template_id, response)
 
     return {
         "status": "success",
-        "data": _build_template_response(template),
+        "data": response,
     }
 
 
@@ -259,9 +272,21 @@ async def list_reports(
     status: str | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="pagination.next_cursor of the previous page"),
     db: AsyncSession = Depends(get_db),
 ):
-    """List reports with optional filters."""
+    """List reports with optional filters.
+
+    Passing cursor pages by keyset, which stays fast however deep the
+    page; page-number paging still works but costs an OFFSET scan.
+    """
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor, date, datetime, uuid.UUID)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
     service = get_report_service()
     reports, total = await service.get_reports(
         db,
@@ -272,20 +297,16 @@ async def list_reports(
         status=status,
         page=page,
         page_size=page_size,
+        after=after,
     )
+    reports, pagination = pagination_meta(reports, page, page_size, total)
+    if pagination.has_next and reports:
+        last = reports[-1]
+        pagination.next_cursor = encode_cursor(
+            last["report_date"], last["created_at"], last["id"]
+        )
 
-    return {
-        "status": "success",
-        "data": reports,
-        "pagination": PaginationMeta(
-            page=page,
-            page_size=page_size,
-            total_items=total,
-            total_pages=(total + page_size - 1) // page_size,
-            has_next=page * page_size < total,
-            has_prev=page > 1,
-        ),
-    }
+    return PydanticJSONResponse(APIResponse(data=reports, pagination=pagination))
 
 
 @router.post("", response_model=APIResponse[ReportResponse])
@@ -334,10 +355,9 @@ async def get_student_reports(
         page_size=page_size,
     )
 
-    return {
-        "status": "success",
-        "data": reports,
-        "pagination": PaginationMeta(
+    return PydanticJSONResponse(APIResponse(
+        data=reports,
+        pagination=PaginationMeta(
             page=page,
             page_size=page_size,
             total_items=total,
@@ -345,7 +365,7 @@ async def get_student_reports(
             has_next=page * page_size < total,
             has_prev=page > 1,
         ),
-    }
+    ))
 
 
 @router.get("/stats", response_model=APIResponse)
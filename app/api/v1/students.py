@@ -1,14 +1,13 @@
 """Student API endpoints."""
 
 import uuid
-from datetime import date
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.user import Role
-from app.schemas.common import APIResponse, PaginationMeta
+from app.schemas.common import APIResponse
 from app.schemas.student import (
     LinkParentRequest,
     ParentInfo,
@@ -19,23 +18,20 @@ from app.schemas.student import (
     StudentUpdate,
 )
 from app.services.student_service import get_student_service
+from app.utils.pagination import decode_cursor, encode_cursor, pagination_meta
 from app.utils.permissions import require_role
+from app.utils.responses import PydanticJSONResponse
 from app.utils.tenant_context import get_current_user_id, get_current_user_role
 
 router = APIRouter()
 
 
 def _build_student_list_response(student) -> StudentListResponse:
-    """Build student list response with computed fields."""
-    # Get effective grade level from class
-    effective_grade_level_id = None
-    effective_grade_level_name = None
-    if student.school_class and student.school_class.grade_level_id:
-        effective_grade_level_id = student.school_class.grade_level_id
-        if hasattr(student.school_class, 'grade_level_rel') and student.school_class.grade_level_rel:
-            effective_grade_level_name = student.school_class.grade_level_rel.name
-
-    return StudentListResponse(
+    """Build a student list item from a Student model, unvalidated.
+
+    Computed fields come from model properties.
+    """
+    return StudentListResponse.model_construct(
         id=student.id,
         first_name=student.first_name,
         last_name=student.last_name,
@@ -44,77 +40,35 @@ def _build_student_list_response(student) -> StudentListResponse:
         class_id=student.class_id,
         is_active=student.is_active,
         photo_path=student.photo_path,
-        full_name=f"{student.first_name} {student.last_name}",
-        class_name=student.school_class.name if student.school_class else None,
-        effective_grade_level_id=effective_grade_level_id,
-        effective_grade_level_name=effective_grade_level_name,
+        full_name=student.full_name,
+        class_name=student.class_name,
+        effective_grade_level_id=student.effective_grade_level_id,
+        effective_grade_level_name=student.effective_grade_level_name,
     )
 
 
 def _build_student_response(student) -> StudentResponse:
-    """Build student response with computed fields."""
-    age = None
-    if student.date_of_birth:
-        today = date.today()
-        age = today.year - student.date_of_birth.year
-        if (today.month, today.day) < (student.date_of_birth.month, student.date_of_birth.day):
-            age -= 1
-
-    # Get effective grade level from class
-    effective_grade_level_id = None
-    effective_grade_level_name = None
-    if student.school_class and student.school_class.grade_level_id:
-        effective_grade_level_id = student.school_class.grade_level_id
-        if hasattr(student.school_class, 'grade_level_rel') and student.school_class.grade_level_rel:
-            effective_grade_level_name = student.school_class.grade_level_rel.name
-
-    return StudentResponse(
-        id=student.id,
-        tenant_id=student.tenant_id,
-        first_name=student.first_name,
-        last_name=student.last_name,
-        date_of_birth=student.date_of_birth,
-        gender=student.gender,
-        age_group=student.age_group,  # DEPRECATED
-        grade_level=student.grade_level,  # DEPRECATED
-        class_id=student.class_id,
-        medical_info=student.medical_info,
-        allergies=student.allergies,
-        emergency_contacts=student.emergency_contacts or [],
-        notes=student.notes,
-        is_active=student.is_active,
-        enrollment_date=student.enrollment_date,
-        created_at=student.created_at,
-        updated_at=student.updated_at,
-        full_name=f"{student.first_name} {student.last_name}",
-        age=age,
-        class_name=student.school_class.name if student.school_class else None,
-        effective_grade_level_id=effective_grade_level_id,
-        effective_grade_level_name=effective_grade_level_name,
-    )
+    """Build student response; computed fields come from model properties."""
+    return StudentResponse.model_validate(student)
 
 
 def _build_student_detail_response(student) -> StudentDetailResponse:
     """Build detailed student response with parents."""
-    base = _build_student_response(student)
-
-    parents = []
-    for ps in student.parent_students:
-        if ps.parent:
-            parents.append(ParentInfo(
-                id=ps.parent.id,
-                first_name=ps.parent.first_name,
-                last_name=ps.parent.last_name,
-                email=ps.parent.email,
-                phone=ps.parent.phone,
-                relationship_type=ps.relationship_type,
-                is_primary=ps.is_primary,
-            ))
-
-    return StudentDetailResponse(
-        **base.model_dump(),
-        parents=parents,
-    )
+    detail = StudentDetailResponse.model_validate(student)
+    detail.parents = [
+        ParentInfo(
+            id=ps.parent.id,
+            first_name=ps.parent.first_name,
+            last_name=ps.parent.last_name,
+            email=ps.parent.email,
+            phone=ps.parent.phone,
+            relationship_type=ps.relationship_type,
+            is_primary=ps.is_primary,
+        )
+        for ps in student.parent_students
+        if ps.parent
+    ]
+    return detail
 
 
 @router.get("", response_model=APIResponse[list[StudentListResponse]])
@@ -127,13 +81,24 @@ async def list_students(
     search: str | None = Query(None, description="Search by name"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(None, description="pagination.next_cursor of the previous page"),
     db: AsyncSession = Depends(get_db),
 ):
     """List students with optional filters.
 
     Teachers only see students in their assigned classes.
     School admins see all students in their tenant.
+
+    Passing cursor pages by keyset, which stays fast however deep the
+    page; page-number paging still works but costs an OFFSET scan.
     """
+    after = None
+    if cursor:
+        try:
+            after = decode_cursor(cursor, str, str, uuid.UUID)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
     # Sanitize class_id and grade_level_id: empty string → None
     parsed_class_id = None
     if class_id and class_id.strip():
@@ -159,21 +124,17 @@ async def list_students(
         search=search,
         page=page,
         page_size=page_size,
+        after=after,
     )
+    students, pagination = pagination_meta(students, page, page_size, total)
+    if pagination.has_next and students:
+        last = students[-1]
+        pagination.next_cursor = encode_cursor(last.first_name, last.last_name, last.id)
 
-    total_pages = (total + page_size - 1) // page_size
-
-    return APIResponse(
+    return PydanticJSONResponse(APIResponse(
         data=[_build_student_list_response(s) for s in students],
-        pagination=PaginationMeta(
-            page=page,
-            page_size=page_size,
-            total_items=total,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_prev=page > 1,
-        ),
-    )
+        pagination=pagination,
+    ))
 
 
 @router.post("", response_model=APIResponse[StudentResponse])
@@ -185,7 +146,6 @@ async def create_student(
     """Create a new student."""
     service = get_student_service()
     student = await service.create_student(db, data)
-    await db.commit()
 
     return APIResponse(
         data=_build_student_response(student),
@@ -203,9 +163,9 @@ async def get_my_children(
     service = get_student_service()
     students = await service.get_my_children(db, parent_id)
 
-    return APIResponse(
+    return PydanticJSONResponse(APIResponse(
         data=[_build_student_list_response(s) for s in students],
-    )
+    ))
 
 
 @router.get("/{student_id}", response_model=APIResponse[StudentDetailResponse])
@@ -219,18 +179,16 @@ async def get_student(
     Parents can only view their own children.
     """
     role = get_current_user_role()
-    user_id = get_current_user_id()
     service = get_student_service()
 
-    student = await service.get_student(db, student_id)
-
     # Parents can only view their own children
     if role == Role.PARENT.value:
-        parent_ids = [ps.parent_id for ps in student.parent_students]
-        if user_id not in parent_ids:
+        if not await service.is_child_of(db, student_id, get_current_user_id()):
             from app.exceptions import ForbiddenException
             raise ForbiddenException("You can only view your own children")
 
+    student = await service.get_student(db, student_id)
+
     return APIResponse(data=_build_student_detail_response(student))
 
 
@@ -244,7 +202,6 @@ async def update_student(
     """Update a student."""
     service = get_student_service()
     student = await service.update_student(db, student_id, data)
-    await db.commit()
 
     return APIResponse(
         data=_build_student_response(student),
@@ -261,7 +218,6 @@ async def delete_student(
     """Soft delete a student (school admin only)."""
     service = get_student_service()
     await service.delete_student(db, student_id)
-    await db.commit()
 
     return APIResponse(message="Student deleted successfully")
 
@@ -302,7 +258,6 @@ async def link_parent(
     """Link a parent to a student."""
     service = get_student_service()
     link = await service.link_parent(db, student_id, data)
-    await db.commit()
 
     return APIResponse(
         data={"id": str(link.id), "linked": True},
@@ -320,6 +275,5 @@ async def unlink_parent(
     """Unlink a parent from a student (school admin only)."""
     service = get_student_service()
     await service.unlink_parent(db, student_id, parent_id)
-    await db.commit()
 
     return APIResponse(message="Parent unlinked successfully")
@@ -20,6 +20,7 @@ from app.schemas.timetable import (
     TimetableListItem,
     TimetableResponse,
 )
+from app.services.student_service import get_student_service
 from app.services.timetable_service import get_timetable_service
 from app.utils.permissions import require_role
 from app.utils.tenant_context import get_current_user_id, get_current_user_role
@@ -324,23 +325,16 @@ async def for_student(
     db: AsyncSession = Depends(get_db),
 ):
     """Return the active timetable for a student's class."""
-    from app.models import ParentStudent
-
     service = get_timetable_service()
     await service._require_feature_enabled(db)
 
     # Parents can only view their own children
     role = get_current_user_role()
     if role == Role.PARENT.value:
-        user_id = get_current_user_id()
-        from sqlalchemy import select
-        check = await db.execute(
-            select(ParentStudent).where(
-                ParentStudent.parent_id == user_id,
-                ParentStudent.student_id == student_id,
-            )
+        is_child = await get_student_service().is_child_of(
+            db, student_id, get_current_user_id()
         )
-        if not check.scalar_one_or_none():
+        if not is_child:
             raise ForbiddenException("You can only view your own children")
 
     timetable = await service.get_student_timetable(db, student_id)
@@ -3,20 +3,19 @@
 import logging
 import uuid
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends
 from pydantic import BaseModel, EmailStr, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.database import get_db
-from app.models import Tenant
 from app.schemas.common import APIResponse
 from app.services.email_service import get_email_service
 from app.services.teacher_invitation_service import get_teacher_invitation_service
+from app.services.tenant_service import get_tenant_service
 from app.services.user_service import get_user_service
 from app.utils.permissions import require_role
 from app.utils.security import create_password_reset_token
-from app.utils.tenant_context import get_tenant_id
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -41,10 +40,45 @@ class SetPasswordRequest(BaseModel):
     password: str = Field(..., min_length=8)
 
 
+async def _send_teacher_invitation_email(
+    to: str,
+    tenant_name: str,
+    teacher_name: str,
+    invitation_code: str,
+) -> None:
+    """Background task: email a teacher their registration code."""
+    register_url = f"{settings.app_base_url}/register/teacher?code={invitation_code}"
+    try:
+        await get_email_service().send_teacher_invitation(
+            to=to,
+            tenant_name=tenant_name,
+            teacher_name=teacher_name,
+            invitation_code=invitation_code,
+            register_url=register_url,
+            expires_in_days=settings.invitation_code_expiry_days,
+        )
+    except Exception:
+        logger.exception("Failed to send teacher invitation email")
+
+
+async def _send_password_reset_email(to: str, user_name: str, reset_url: str) -> None:
+    """Background task: email a teacher a password reset link."""
+    try:
+        await get_email_service().send_password_reset(
+            to=to,
+            user_name=user_name,
+            reset_url=reset_url,
+            expires_in_hours=24,
+        )
+    except Exception:
+        logger.exception("Failed to send password reset email")
+
+
 @router.post("/teachers/invite")
 @require_role("SCHOOL_ADMIN")
 async def invite_teacher(
     data: InviteTeacherRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Invite a teacher by email. Sends an invitation email with a registration code."""
@@ -63,25 +97,18 @@ async def invite_teacher(
             message=str(e),
         )
 
-    # Send invitation email
-    tenant = await db.get(Tenant, get_tenant_id())
-    tenant_name = tenant.name if tenant else "Your School"
-    register_url = (
-        f"{settings.app_base_url}/register/teacher?code={invitation.invitation_code}"
+    # Send invitation email; the invitation is already committed
+    tenant_name = (
+        await get_tenant_service().get_tenant_name(db, invitation.tenant_id)
+        or "Your School"
+    )
+    background_tasks.add_task(
+        _send_teacher_invitation_email,
+        to=invitation.email,
+        tenant_name=tenant_name,
+        teacher_name=data.first_name,
+        invitation_code=invitation.invitation_code,
     )
-
-    email_service = get_email_service()
-    try:
-        await email_service.send_teacher_invitation(
-            to=invitation.email,
-            tenant_name=tenant_name,
-            teacher_name=data.first_name,
-            invitation_code=invitation.invitation_code,
-            register_url=register_url,
-            expires_in_days=settings.invitation_code_expiry_days,
-        )
-    except Exception:
-        logger.exception("Failed to send teacher invitation email")
 
     return APIResponse(
         status="success",
@@ -114,6 +141,7 @@ async def cancel_teacher_invitation(
 @require_role("SCHOOL_ADMIN")
 async def resend_teacher_invitation(
     invitation_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Resend a teacher invitation with a new code."""
@@ -128,24 +156,17 @@ async def resend_teacher_invitation(
         return APIResponse(status="error", message="Invitation not found")
 
     # Send email again
-    tenant = await db.get(Tenant, get_tenant_id())
-    tenant_name = tenant.name if tenant else "Your School"
-    register_url = (
-        f"{settings.app_base_url}/register/teacher?code={invitation.invitation_code}"
+    tenant_name = (
+        await get_tenant_service().get_tenant_name(db, invitation.tenant_id)
+        or "Your School"
+    )
+    background_tasks.add_task(
+        _send_teacher_invitation_email,
+        to=invitation.email,
+        tenant_name=tenant_name,
+        teacher_name=invitation.first_name,
+        invitation_code=invitation.invitation_code,
     )
-
-    email_service = get_email_service()
-    try:
-        await email_service.send_teacher_invitation(
-            to=invitation.email,
-            tenant_name=tenant_name,
-            teacher_name=invitation.first_name,
-            invitation_code=invitation.invitation_code,
-            register_url=register_url,
-            expires_in_days=settings.invitation_code_expiry_days,
-        )
-    except Exception:
-        logger.exception("Failed to resend teacher invitation email")
 
     return APIResponse(
         status="success",
@@ -263,6 +284,7 @@ async def admin_set_teacher_password(
 @require_role("SCHOOL_ADMIN")
 async def admin_send_reset_email(
     teacher_id: str,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Admin sends a password reset email to a teacher."""
@@ -279,20 +301,12 @@ async def admin_send_reset_email(
     reset_token = create_password_reset_token(teacher.id)
     reset_url = f"{settings.app_base_url}/reset-password?token={reset_token}"
 
-    email_service = get_email_service()
-    try:
-        await email_service.send_password_reset(
-            to=teacher.email,
-            user_name=teacher.first_name,
-            reset_url=reset_url,
-            expires_in_hours=24,
-        )
-    except Exception:
-        logger.exception("Failed to send password reset email")
-        return APIResponse(
-            status="error",
-            message="Failed to send reset email. Please try again.",
-        )
+    background_tasks.add_task(
+        _send_password_reset_email,
+        to=teacher.email,
+        user_name=teacher.first_name,
+        reset_url=reset_url,
+    )
 
     return APIResponse(
         status="success",
@@ -1,9 +1,10 @@
 """Webhook API endpoints."""
 
 import logging
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -12,18 +13,65 @@ from app.schemas.webhook import (
     WebhookEndpointCreate,
     WebhookEndpointResponse,
     WebhookEndpointUpdate,
+    WebhookEventBrief,
     WebhookEventResponse,
+    WebhookEventStatus,
     WebhookTestRequest,
     WebhookTestResponse,
 )
 from app.services.webhook_service import get_webhook_service
+from app.utils.pagination import decode_cursor, encode_cursor, pagination_meta
 from app.utils.permissions import require_role
+from app.utils.responses import PydanticJSONResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+def _build_endpoint_response(endpoint) -> WebhookEndpointResponse:
+    """Build a webhook endpoint response from a WebhookEndpoint model, unvalidated."""
+    return WebhookEndpointResponse.model_construct(
+        id=endpoint.id,
+        tenant_id=endpoint.tenant_id,
+        url=endpoint.url,
+        events=endpoint.events,
+        is_active=endpoint.is_active,
+        created_at=endpoint.created_at,
+        updated_at=endpoint.updated_at,
+    )
+
+
+def _build_event_brief(event) -> WebhookEventBrief:
+    """Build a webhook event summary from a row of the brief columns, unvalidated."""
+    return WebhookEventBrief.model_construct(
+        id=event.id,
+        event_type=event.event_type,
+        status=WebhookEventStatus(event.status),
+        attempts=event.attempts,
+        last_attempt_at=event.last_attempt_at,
+        response_code=event.response_code,
+        created_at=event.created_at,
+    )
+
+
+def _build_event_response(event) -> WebhookEventResponse:
+    """Build a webhook event response from a WebhookEvent model, unvalidated."""
+    return WebhookEventResponse.model_construct(
+        id=event.id,
+        endpoint_id=event.endpoint_id,
+        event_type=event.event_type,
+        payload=event.payload,
+        # Stored as a plain string; the schema serializes the enum
+        status=WebhookEventStatus(event.status),
+        attempts=event.attempts,
+        last_attempt_at=event.last_attempt_at,
+        response_code=event.response_code,
+        response_body=event.response_body,
+        created_at=event.created_at,
+    )
+
+
 @router.get("", response_model=APIResponse)
 @require_role("SCHOOL_ADMIN")
 async def list_endpoints(
@@ -34,21 +82,10 @@ async def list_endpoints(
 
     endpoints = await service.list_endpoints(db)
 
-    return APIResponse(
+    return PydanticJSONResponse(APIResponse(
         status="success",
-        data=[
-            WebhookEndpointResponse(
-                id=ep.id,
-                tenant_id=ep.tenant_id,
-                url=ep.url,
-                events=ep.events,
-                is_active=ep.is_active,
-                created_at=ep.created_at,
-                updated_at=ep.updated_at,
-            )
-            for ep in endpoints
-        ],
-    )
+        data=[_build_endpoint_response(ep) for ep in endpoints],
+    ))
 
 
 @router.post("", response_model=APIResponse)
@@ -69,15 +106,7 @@ async def create_endpoint(
 
     return APIResponse(
         status="success",
-        data=WebhookEndpointResponse(
-            id=endpoint.id,
-            tenant_id=endpoint.tenant_id,
-            url=endpoint.url,
-            events=endpoint.events,
-            is_active=endpoint.is_active,
-            created_at=endpoint.created_at,
-            updated_at=endpoint.updated_at,
-        ),
+        data=_build_endpoint_response(endpoint),
         message="Webhook endpoint created",
     )
 
@@ -97,15 +126,7 @@ async def get_endpoint(
 
     return APIResponse(
         status="success",
-        data=WebhookEndpointResponse(
-            id=endpoint.id,
-            tenant_id=endpoint.tenant_id,
-            url=endpoint.url,
-            events=endpoint.events,
-            is_active=endpoint.is_active,
-            created_at=endpoint.created_at,
-            updated_at=endpoint.updated_at,
-        ),
+        data=_build_endpoint_response(endpoint),
     )
 
 
@@ -132,15 +153,7 @@ async def update_endpoint(
 
     return APIResponse(
         status="success",
-        data=WebhookEndpointResponse(
-            id=endpoint.id,
-            tenant_id=endpoint.tenant_id,
-            url=endpoint.url,
-            events=endpoint.events,
-            is_active=endpoint.is_active,
-            created_at=endpoint.created_at,
-            updated_at=endpoint.updated_at,
-        ),
+        data=_build_endpoint_response(endpoint),
         message="Webhook endpoint updated",
     )
 
@@ -169,31 +182,35 @@ async def delete_endpoint(
 async def get_endpoint_events(
     endpoint_id: UUID,
     limit: int = 50,
+    cursor: str | None = Query(None, description="pagination.next_cursor of the previous page"),
+    brief: bool = Query(False, description="Leave out each event's payload and response body"),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get recent events for a webhook endpoint."""
+    """Get recent events for a webhook endpoint, newest first."""
+    before = None
+    if cursor:
+        try:
+            before = decode_cursor(cursor, datetime, UUID)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
     service = get_webhook_service()
 
-    events = await service.get_endpoint_events(db, endpoint_id, limit=limit)
+    # One extra event tells pagination_meta whether there is a next page
+    events = await service.get_endpoint_events(
+        db, endpoint_id, limit=limit + 1, before=before, brief=brief
+    )
+    events, pagination = pagination_meta(events, 1, limit, None)
+    if pagination.has_next and events:
+        last = events[-1]
+        pagination.next_cursor = encode_cursor(last.created_at, last.id)
 
-    return APIResponse(
+    build = _build_event_brief if brief else _build_event_response
+    return PydanticJSONResponse(APIResponse(
         status="success",
-        data=[
-            WebhookEventResponse(
-                id=ev.id,
-                endpoint_id=ev.endpoint_id,
-                event_type=ev.event_type,
-                payload=ev.payload,
-                status=ev.status,
-                attempts=ev.attempts,
-                last_attempt_at=ev.last_attempt_at,
-                response_code=ev.response_code,
-                response_body=ev.response_body,
-                created_at=ev.created_at,
-            )
-            for ev in events
-        ],
-    )
+        data=[build(ev) for ev in events],
+        pagination=pagination,
+    ))
 
 
 @router.post("/{endpoint_id}/test", response_model=APIResponse)
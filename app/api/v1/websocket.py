@@ -2,15 +2,21 @@
 
 import logging
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from app.services.realtime_service import get_connection_manager
+from app.services.realtime_service import encode_event, get_connection_manager
 from app.utils.security import decode_token
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["websocket"])
 
+PONG = encode_event({"type": "pong"})
+# Keepalive pings as browsers (JSON.stringify) and Python clients encode
+# them; matched as strings so the common frame skips JSON decoding
+PING_FRAMES = frozenset({'{"type":"ping"}', '{"type": "ping"}'})
+
 
 @router.websocket("/ws/{token}")
 async def websocket_endpoint(websocket: WebSocket, token: str):
@@ -43,23 +49,28 @@ async def websocket_endpoint(websocket: WebSocket, token: str):
         await manager.connect(websocket, user_id, tenant_id)
 
         # Send initial connection success message
-        await websocket.send_json({
+        await websocket.send_text(encode_event({
             "type": "connected",
             "data": {
                 "message": "WebSocket connection established",
                 "user_id": user_id,
             },
-        })
+        }))
 
         # Keep connection alive and handle incoming messages
         while True:
             try:
                 # Wait for incoming messages (ping/pong, client events, etc.)
-                data = await websocket.receive_json()
+                text = await websocket.receive_text()
+                if text in PING_FRAMES:
+                    await websocket.send_text(PONG)
+                    continue
+
+                data = orjson.loads(text)
 
                 # Handle client-side events
                 if data.get("type") == "ping":
-                    await websocket.send_json({"type": "pong"})
+                    await websocket.send_text(PONG)
                 elif data.get("type") == "mark_read":
                     # Client can send events to mark notifications as read, etc.
                     # These would be processed here
@@ -2,6 +2,7 @@
 
 import logging
 
+import orjson
 from fastapi import APIRouter, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +15,30 @@ settings = get_settings()
 
 router = APIRouter(prefix="/whatsapp", tags=["whatsapp"])
 
+# Pre-encoded acknowledgement for every accepted webhook delivery
+OK_ACK = b'{"status":"ok"}'
+
+
+async def _read_body(request: Request, limit: int) -> bytes:
+    """Read the request body, rejecting anything over limit bytes with a 413.
+
+    request.body() buffers whatever the client sends; this refuses an
+    oversized body from its Content-Length up front, or as soon as the
+    stream passes the limit, and joins the chunks once.
+    """
+    length = request.headers.get("content-length", "")
+    if length.isdigit() and int(length) > limit:
+        raise HTTPException(status_code=413, detail="Payload too large")
+
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > limit:
+            raise HTTPException(status_code=413, detail="Payload too large")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
 
 @router.get("/webhook")
 async def verify_webhook(
@@ -48,7 +73,7 @@ async def receive_webhook(request: Request):
     whatsapp_service = get_whatsapp_service()
 
     # Get raw body for signature verification
-    body_bytes = await request.body()
+    body_bytes = await _read_body(request, settings.max_upload_size_bytes)
 
     # Verify HMAC signature
     signature = request.headers.get("X-Hub-Signature-256", "")
@@ -56,10 +81,10 @@ async def receive_webhook(request: Request):
         logger.warning("Invalid WhatsApp webhook signature")
         raise HTTPException(status_code=403, detail="Invalid signature")
 
-    # Parse the webhook payload
+    # Parse the body already read for the signature check
     try:
-        body = await request.json()
-    except Exception as e:
+        body = orjson.loads(body_bytes)
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse WhatsApp webhook body: {e}")
         raise HTTPException(status_code=400, detail="Invalid JSON")
 
@@ -74,8 +99,9 @@ async def receive_webhook(request: Request):
             await process_inbound_message(msg)
 
     # Always return 200 OK to acknowledge receipt
-    # Meta will retry if we don't acknowledge
-    return {"status": "ok"}
+    # Meta will retry if we don't acknowledge. A fresh Response each time:
+    # middleware adds headers to it, so it cannot be shared.
+    return Response(content=OK_ACK, media_type="application/json")
 
 
 async def process_inbound_message(msg: dict):
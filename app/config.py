@@ -1,6 +1,6 @@
 """Application configuration using pydantic-settings."""
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Literal
 
 from pydantic import field_validator
@@ -54,7 +54,17 @@ class Settings(BaseSettings):
     # Database
     database_url: str
     database_pool_size: int = 20
-    database_max_overflow: int = 10
+    database_max_overflow: int = 40
+    database_pool_timeout: int = 30  # seconds to wait for a free connection
+    database_pool_recycle: int = 1800  # seconds
+    database_pool_pre_ping: bool = True
+    # Postgres-side TCP keepalives (seconds); 0 keeps the server default
+    database_tcp_keepalives_idle: int = 60
+    database_tcp_keepalives_interval: int = 10
+    # asyncpg prepared statement cache; set to 0 behind a transaction pooler
+    database_statement_cache_size: int = 1024
+    # SQLAlchemy compiled SQL cache (entries, shared by the engine)
+    database_query_cache_size: int = 1200
 
     # Redis (optional for local dev)
     redis_url: str | None = None
@@ -133,10 +143,15 @@ class Settings(BaseSettings):
         """Check if running in production mode."""
         return self.app_env == "production"
 
-    @property
-    def supported_languages_list(self) -> list[str]:
-        """Get supported languages as a list."""
-        return [lang.strip() for lang in self.supported_languages.split(",")]
+    @cached_property
+    def supported_languages_list(self) -> tuple[str, ...]:
+        """Get supported languages, in configured order (parsed once)."""
+        return tuple(lang.strip() for lang in self.supported_languages.split(","))
+
+    @cached_property
+    def supported_languages_set(self) -> frozenset[str]:
+        """Get supported languages for membership checks."""
+        return frozenset(self.supported_languages_list)
 
     @property
     def max_upload_size_bytes(self) -> int:
@@ -2,6 +2,7 @@
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -19,9 +20,31 @@ def create_engine() -> AsyncEngine:
     # Use NullPool in development for easier debugging
     pool_class = NullPool if settings.is_development else None
 
+    # SQLAlchemy's asyncpg dialect keeps its own per-connection LRU of
+    # prepared statements in front of asyncpg's; size the two together
+    connect_args = {
+        "statement_cache_size": settings.database_statement_cache_size,
+        "prepared_statement_cache_size": settings.database_statement_cache_size,
+    }
+    if not settings.database_statement_cache_size:
+        # Behind PgBouncer (transaction mode) server connections are shared,
+        # so prepared statement names must not collide between clients
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+    if settings.database_tcp_keepalives_idle:
+        # Keepalive traffic stops load balancers and NAT dropping idle pooled
+        # connections, which otherwise fail on their next checkout
+        connect_args["server_settings"] = {
+            "tcp_keepalives_idle": str(settings.database_tcp_keepalives_idle),
+            "tcp_keepalives_interval": str(settings.database_tcp_keepalives_interval),
+        }
+
     engine_kwargs = {
         "echo": settings.app_debug,
         "future": True,
+        "connect_args": connect_args,
+        # The default 500 entries is too small once every list endpoint's
+        # filter combinations are cached; misses recompile the SELECT
+        "query_cache_size": settings.database_query_cache_size,
     }
 
     if pool_class:
@@ -29,7 +52,11 @@ def create_engine() -> AsyncEngine:
     else:
         engine_kwargs["pool_size"] = settings.database_pool_size
         engine_kwargs["max_overflow"] = settings.database_max_overflow
-        engine_kwargs["pool_pre_ping"] = True
+        engine_kwargs["pool_timeout"] = settings.database_pool_timeout
+        # Recycling bounds connection age; pre-ping catches connections a
+        # failover or dropped keepalive killed since their last use
+        engine_kwargs["pool_recycle"] = settings.database_pool_recycle
+        engine_kwargs["pool_pre_ping"] = settings.database_pool_pre_ping
 
     return create_async_engine(settings.async_database_url, **engine_kwargs)
 
@@ -48,7 +75,12 @@ async_session_factory = async_sessionmaker(
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency that yields a database session."""
+    """Dependency that yields a database session.
+
+    The session is the request's unit of work: it commits once the endpoint
+    returns (before the response is sent) and rolls back if it raises, so
+    endpoints only need to flush.
+    """
     async with async_session_factory() as session:
         try:
             yield session
@@ -74,6 +106,24 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def get_pool_stats() -> dict[str, int] | None:
+    """Get connection pool usage, or None when pooling is disabled.
+
+    The pool is saturated (requests queue for up to pool_timeout) once
+    checked_out reaches size + max_overflow.
+    """
+    pool = engine.pool
+    if isinstance(pool, NullPool):
+        return None
+    return {
+        "size": pool.size(),
+        "max_overflow": settings.database_max_overflow,
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "checked_in": pool.checkedin(),
+    }
+
+
 async def init_db() -> None:
     """Initialize database (create tables if needed)."""
     from app.models.base import Base
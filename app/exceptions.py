@@ -4,7 +4,7 @@ import logging
 import traceback
 
 from fastapi import Request
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from starlette.templating import Jinja2Templates
 
 logger = logging.getLogger(__name__)
@@ -102,7 +102,7 @@ def create_exception_handlers(templates: Jinja2Templates):
         )
 
         if wants_json(request):
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=402,
                 content={
                     "status": "error",
@@ -134,7 +134,7 @@ def create_exception_handlers(templates: Jinja2Templates):
             }
             if hasattr(exc, "errors"):
                 content["errors"] = exc.errors
-            return JSONResponse(status_code=exc.status_code, content=content)
+            return ORJSONResponse(status_code=exc.status_code, content=content)
 
         # HTML error page
         try:
@@ -160,7 +160,7 @@ def create_exception_handlers(templates: Jinja2Templates):
         logger.warning(f"ValidationException on {request.method} {request.url.path}: {exc.errors}")
 
         if wants_json(request):
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=exc.status_code,
                 content={
                     "status": "error",
@@ -198,7 +198,7 @@ def create_exception_handlers(templates: Jinja2Templates):
         logger.error("".join(tb_lines))
 
         if wants_json(request):
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={
                     "status": "error",
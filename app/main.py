@@ -5,7 +5,7 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.cors import CORSMiddleware
@@ -14,13 +14,14 @@ from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.config import settings
-from app.database import close_db
+from app.database import close_db, get_pool_stats
 from app.exceptions import (
     ClassUpException,
     ValidationException,
     create_exception_handlers,
 )
 from app.rate_limit import limiter
+from app.utils.permissions import require_super_admin
 from app.templates_config import templates
 
 # Configure logging - force DEBUG level for development
@@ -60,6 +61,22 @@ def create_app() -> FastAPI:
         except Exception:
             logger.exception("Startup audit purge failed (non-fatal)")
 
+        # Imports run as in-process tasks; fail any a previous process left stuck
+        try:
+            from app.database import get_db_context
+            from app.services.import_service import get_import_service
+            async with get_db_context() as db:
+                failed = await get_import_service().fail_stale_jobs(db)
+                await db.commit()
+                if failed:
+                    logger.info(f"Startup import recovery failed {failed} stale jobs")
+        except Exception:
+            logger.exception("Startup import recovery failed (non-fatal)")
+
+        # Compile email templates now rather than on the first send
+        from app.services.email_service import get_email_service
+        get_email_service()
+
         yield
         logger.info(f"Shutting down {settings.app_name}")
         await close_db()
@@ -72,6 +89,9 @@ def create_app() -> FastAPI:
         redoc_url="/api/redoc" if settings.app_debug else None,
         openapi_url="/api/openapi.json" if settings.app_debug else None,
         lifespan=lifespan,
+        # orjson serializes UUIDs/datetimes natively and is several times
+        # faster than stdlib json for the nested list payloads.
+        default_response_class=ORJSONResponse,
     )
 
     # Rate limiting
@@ -156,8 +176,14 @@ def register_routers(app: FastAPI):
     # otherwise shadow /health and make Railway's healthcheck fail.
     @app.get("/health", tags=["Health"])
     async def health_check():
-        """Health check endpoint for load balancers and monitoring."""
-        return {"status": "healthy", "app": settings.app_name, "env": settings.app_env}
+        """Liveness check for load balancers; unauthenticated, so it reports nothing else."""
+        return {"status": "healthy"}
+
+    @app.get("/metrics", tags=["Health"])
+    @require_super_admin()
+    async def metrics():
+        """Runtime metrics for monitoring (connection pool saturation). Super admin only."""
+        return {"db_pool": get_pool_stats()}
 
     @app.get("/", include_in_schema=False)
     async def root(request: Request):
@@ -22,7 +22,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
     """
 
     # Paths that don't require authentication
-    EXEMPT_PATHS = {
+    EXEMPT_PATHS = frozenset({
         "/",
         "/login",
         "/register",
@@ -41,13 +41,14 @@ class AuthMiddleware(BaseHTTPMiddleware):
         "/api/v1/paystack/webhook",
         "/api/v1/plans",
         "/api/v1/auth/trial-signup",
-    }
+    })
 
-    # Path prefixes that don't require authentication
-    EXEMPT_PREFIXES = {
+    # Path prefixes that don't require authentication (a tuple, so a single
+    # str.startswith call checks them all)
+    EXEMPT_PREFIXES = (
         "/static/",
         "/favicon",
-    }
+    )
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request and extract authentication context."""
@@ -90,14 +91,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
 
     def _is_exempt_path(self, path: str) -> bool:
         """Check if the path is exempt from authentication."""
-        if path in self.EXEMPT_PATHS:
-            return True
-
-        for prefix in self.EXEMPT_PREFIXES:
-            if path.startswith(prefix):
-                return True
-
-        return False
+        return path in self.EXEMPT_PATHS or path.startswith(self.EXEMPT_PREFIXES)
 
     def _extract_token(self, request: Request) -> str | None:
         """Extract JWT token from request.
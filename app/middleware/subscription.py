@@ -16,7 +16,7 @@ from app.utils.tenant_context import get_tenant_id_or_none, get_current_user_rol
 logger = logging.getLogger(__name__)
 
 # Paths that bypass subscription checks
-EXEMPT_PATHS = {
+EXEMPT_PATHS = frozenset({
     "/",
     "/login",
     "/register",
@@ -37,7 +37,7 @@ EXEMPT_PATHS = {
     "/api/v1/invitations/verify",
     "/api/v1/whatsapp/webhook",
     "/api/v1/paystack/webhook",
-}
+})
 
 EXEMPT_PREFIXES = (
     "/static/",
@@ -59,7 +59,7 @@ class SubscriptionMiddleware(BaseHTTPMiddleware):
         path = request.url.path
 
         # Skip exempt paths
-        if path in EXEMPT_PATHS or any(path.startswith(p) for p in EXEMPT_PREFIXES):
+        if path in EXEMPT_PATHS or path.startswith(EXEMPT_PREFIXES):
             return await call_next(request)
 
         # Only check tenant-scoped users (not SUPER_ADMIN, not unauthenticated)
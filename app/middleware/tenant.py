@@ -63,18 +63,18 @@ class TenantMiddleware(BaseHTTPMiddleware):
         """
         # Query parameter
         lang = request.query_params.get("lang")
-        if lang and lang in settings.supported_languages_list:
+        if lang and lang in settings.supported_languages_set:
             return lang
 
         # Cookie
         lang = request.cookies.get("language")
-        if lang and lang in settings.supported_languages_list:
+        if lang and lang in settings.supported_languages_set:
             return lang
 
         # Accept-Language header
         accept_lang = request.headers.get("Accept-Language", "")
         for lang in self._parse_accept_language(accept_lang):
-            if lang in settings.supported_languages_list:
+            if lang in settings.supported_languages_set:
                 return lang
 
         # Default
@@ -19,7 +19,14 @@ from app.models.grade_level import GradeLevel
 from app.models.file_entity import FileEntity, FileCategory
 from app.models.invitation import ParentInvitation, InvitationStatus, generate_invitation_code
 from app.models.teacher_invitation import TeacherInvitation
-from app.models.message import Message, MessageAttachment, MessageRecipient, MessageStatus, MessageType
+from app.models.message import (
+    Message,
+    MessageAttachment,
+    MessageRecipient,
+    MessageStatus,
+    MessageType,
+    UserInboxCounter,
+)
 from app.models.notification import Notification, NotificationType
 from app.models.announcement import Announcement, AnnouncementDismissal, AnnouncementLevel, AnnouncementSeverity
 from app.models.photo_share import PhotoShare, PhotoShareFile, PhotoShareTag
@@ -111,6 +118,7 @@ __all__ = [
     "MessageAttachment",
     "MessageType",
     "MessageStatus",
+    "UserInboxCounter",
     # Notification
     "Notification",
     "NotificationType",
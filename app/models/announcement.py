@@ -6,7 +6,7 @@ from enum import Enum
 
 from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from app.models.base import Base, TenantScopedModel, TimestampMixin
 
@@ -79,6 +79,10 @@ class Announcement(TenantScopedModel):
         nullable=False,
     )
 
+    # Truncated body for banners, loaded with with_expression (see
+    # AnnouncementService.get_active_announcements)
+    body_preview: Mapped[str | None] = query_expression()
+
     # Relationships
     tenant = relationship("Tenant", lazy="selectin")
     school_class = relationship("SchoolClass", lazy="selectin")
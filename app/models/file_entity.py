@@ -2,6 +2,7 @@
 
 import uuid
 from enum import Enum
+from functools import cached_property
 
 from sqlalchemy import BigInteger, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID
@@ -17,6 +18,7 @@ class FileCategory(str, Enum):
     DOCUMENT = "DOCUMENT"
     AVATAR = "AVATAR"
     LOGO = "LOGO"
+    IMPORT = "IMPORT"  # Bulk import CSVs, not user-facing
 
 
 class FileEntity(TenantScopedModel):
@@ -45,12 +47,14 @@ class FileEntity(TenantScopedModel):
     # Relationships
     uploader = relationship("User", lazy="selectin")
 
-    @property
+    # Derived display values are cached per instance; content_type and
+    # file_size never change after upload.
+    @cached_property
     def is_image(self) -> bool:
         """Check if file is an image."""
         return self.content_type.startswith("image/")
 
-    @property
+    @cached_property
     def is_pdf(self) -> bool:
         """Check if file is a PDF."""
         return self.content_type == "application/pdf"
@@ -62,7 +66,7 @@ class FileEntity(TenantScopedModel):
             return self.original_name.rsplit(".", 1)[-1].lower()
         return ""
 
-    @property
+    @cached_property
     def file_size_human(self) -> str:
         """Get human-readable file size."""
         size = self.file_size
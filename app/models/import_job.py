@@ -73,6 +73,11 @@ class BulkImportJob(Base, TimestampMixin):
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=False,
     )
+    csv_file_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("file_entities.id", ondelete="SET NULL"),
+        nullable=True,
+    )
     completed_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
         nullable=True,
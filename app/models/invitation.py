@@ -41,6 +41,8 @@ class ParentInvitation(Base, TimestampMixin):
             "tenant_id",
             postgresql_where=text("status = 'PENDING'"),
         ),
+        # Keyset pagination of a tenant's invitations, newest first
+        Index("idx_invitations_tenant_created", "tenant_id", "created_at", "id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -88,7 +90,8 @@ class ParentInvitation(Base, TimestampMixin):
     )
 
     # Relationships
-    tenant = relationship("Tenant", lazy="selectin")
+    # Only the tenant name is ever needed; see TenantService.get_tenant_name
+    tenant = relationship("Tenant", lazy="raise")
     student = relationship("Student", lazy="selectin")
     created_by_user = relationship("User", lazy="selectin")
 
@@ -5,7 +5,7 @@ from enum import Enum
 
 from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from app.models.base import Base, TenantScopedModel, TimestampMixin
 
@@ -77,6 +77,9 @@ class Message(TenantScopedModel):
     is_read: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     status: Mapped[str] = mapped_column(String(20), default="SENT", nullable=False)
 
+    # Per-viewer read state, loaded with with_expression (see MessageService)
+    read_by_current_user: Mapped[bool | None] = query_expression()
+
     # Relationships
     sender = relationship("User", foreign_keys=[sender_id], lazy="selectin")
     student = relationship("Student", lazy="selectin")
@@ -160,3 +163,26 @@ class MessageAttachment(Base, TimestampMixin):
     # Relationships
     message = relationship("Message", back_populates="attachments")
     file_entity = relationship("FileEntity", lazy="selectin")
+
+
+class UserInboxCounter(Base):
+    """Running unread message count per user.
+
+    Maintained by MessageService in the same transaction as the recipient
+    rows it summarizes, so the unread badge is a primary key lookup rather
+    than a COUNT over message_recipients.
+    """
+
+    __tablename__ = "user_inbox_counters"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    messages_unread: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default=text("0"),
+    )
@@ -163,10 +163,13 @@ class DailyReport(TenantScopedModel):
             "report_date",
             name="uq_report_student_template_date",
         ),
+        # Also the keyset for report lists: (report_date, created_at, id)
         Index(
             "idx_reports_tenant_date",
             "tenant_id",
             "report_date",
+            "created_at",
+            "id",
             postgresql_where=text("deleted_at IS NULL"),
         ),
         Index(
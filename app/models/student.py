@@ -11,6 +11,7 @@ from sqlalchemy import (
     Index,
     String,
     Text,
+    UniqueConstraint,
     text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
@@ -71,6 +72,15 @@ class Student(TenantScopedModel):
             "age_group",
             postgresql_where=text("deleted_at IS NULL"),
         ),
+        # Matches the student list order, so keyset pages are index seeks
+        Index(
+            "idx_students_tenant_name",
+            "tenant_id",
+            "first_name",
+            "last_name",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
     )
 
     first_name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -149,6 +159,11 @@ class Student(TenantScopedModel):
                 return ps
         return self.parent_students[0] if self.parent_students else None
 
+    @property
+    def class_name(self) -> str | None:
+        """Get the name of the student's class."""
+        return self.school_class.name if self.school_class else None
+
     @property
     def effective_grade_level_id(self) -> uuid.UUID | None:
         """Get the grade level ID from the student's class.
@@ -190,6 +205,8 @@ class ParentStudent(Base, TimestampMixin):
     __table_args__ = (
         Index("idx_parent_students_parent", "parent_id"),
         Index("idx_parent_students_student", "student_id"),
+        # Backs the duplicate-link check in create_invitation
+        UniqueConstraint("parent_id", "student_id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -68,7 +68,8 @@ class TeacherInvitation(Base, TimestampMixin):
     )
 
     # Relationships
-    tenant = relationship("Tenant", lazy="selectin")
+    # Only the tenant name is ever needed; see TenantService.get_tenant_name
+    tenant = relationship("Tenant", lazy="raise")
     created_by_user = relationship("User", lazy="selectin")
 
     @property
@@ -99,11 +99,12 @@ class WebhookEndpoint(Base, TimestampMixin):
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
 
     # Relationships
+    # Unbounded delivery history; page it with WebhookService.get_endpoint_events
     webhook_events = relationship(
         "WebhookEvent",
         back_populates="endpoint",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="noload",
     )
 
     def subscribes_to(self, event_type: str) -> bool:
@@ -121,6 +122,8 @@ class WebhookEvent(Base):
             "status",
             postgresql_where=text("status IN ('PENDING', 'FAILED')"),
         ),
+        # Keyset pagination of an endpoint's events, newest first
+        Index("idx_webhook_events_endpoint_created", "endpoint_id", "created_at", "id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -154,7 +157,8 @@ class WebhookEvent(Base):
     )
 
     # Relationships
-    endpoint = relationship("WebhookEndpoint", back_populates="webhook_events", lazy="selectin")
+    # Delivery is always handed the endpoint explicitly
+    endpoint = relationship("WebhookEndpoint", back_populates="webhook_events", lazy="raise")
 
     def record_attempt(
         self, success: bool, response_code: int | None = None, response_body: str | None = None
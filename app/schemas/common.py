@@ -14,10 +14,12 @@ class PaginationMeta(BaseModel):
 
     page: int
     page_size: int
-    total_items: int
-    total_pages: int
+    total_items: int | None = None  # None when the count was skipped
+    total_pages: int | None = None
     has_next: bool
     has_prev: bool
+    # Keyset endpoints: pass back as ?cursor= to fetch the next page
+    next_cursor: str | None = None
 
 
 class APIResponse(BaseModel, Generic[T]):
@@ -14,6 +14,7 @@ class FileCategory(str, Enum):
     DOCUMENT = "DOCUMENT"
     AVATAR = "AVATAR"
     LOGO = "LOGO"
+    IMPORT = "IMPORT"  # Bulk import CSVs, not user-facing
 
 
 class FileUploadResponse(BaseModel):
@@ -73,6 +74,7 @@ class FileListResponse(BaseModel):
     created_at: datetime
     is_image: bool = False
     thumbnail_url: str | None = None
+    download_url: str | None = None  # Only populated with ?include_urls=true
 
 
 class PresignedUrlResponse(BaseModel):
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
 
 
 class InvitationStatus(str, Enum):
@@ -23,6 +23,11 @@ class InvitationCreate(BaseModel):
     first_name: str = ""
     last_name: str = ""
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        return v.strip().lower()
+
 
 class InvitationVerify(BaseModel):
     """Schema for verifying an invitation code."""
@@ -76,6 +81,7 @@ class InvitationListResponse(BaseModel):
     """Response for listing invitations."""
 
     invitations: list[InvitationResponse]
-    total: int
+    total: int | None  # None for cursor pages, which skip the count
     page: int
     page_size: int
+    next_cursor: str | None = None
@@ -67,7 +67,7 @@ class StudentResponse(StudentBase):
     created_at: datetime
     updated_at: datetime
 
-    # Computed fields
+    # Computed fields, read from Student model properties
     full_name: str | None = None
     age: int | None = None
     class_name: str | None = None
@@ -90,7 +90,7 @@ class StudentListResponse(BaseModel):
     is_active: bool
     photo_path: str | None
 
-    # Computed/joined fields
+    # Computed/joined fields, read from Student model properties
     full_name: str | None = None
     class_name: str | None = None
     # Grade level inherited from class
@@ -61,23 +61,28 @@ class WebhookEndpointResponse(BaseModel):
     updated_at: datetime
 
 
-class WebhookEventResponse(BaseModel):
-    """Schema for webhook event response."""
+class WebhookEventBrief(BaseModel):
+    """Schema for a webhook event's delivery summary, without its bodies."""
 
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
-    endpoint_id: UUID
     event_type: str
-    payload: dict
     status: WebhookEventStatus
     attempts: int
     last_attempt_at: datetime | None = None
     response_code: int | None = None
-    response_body: str | None = None
     created_at: datetime
 
 
+class WebhookEventResponse(WebhookEventBrief):
+    """Schema for webhook event response."""
+
+    endpoint_id: UUID
+    payload: dict
+    response_body: str | None = None
+
+
 class WebhookTestRequest(BaseModel):
     """Schema for testing a webhook."""
 
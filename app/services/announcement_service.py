@@ -7,16 +7,21 @@ from datetime import datetime, timezone
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, joinedload, noload, selectinload, with_expression
 
 from app.models.announcement import Announcement, AnnouncementDismissal, AnnouncementSeverity
 from app.models.school_class import TeacherClass
 from app.models.student import ParentStudent, Student
 from app.models.user import User
+from app.services.cache_service import announcement_version_key, get_cache_service
+from app.utils.pagination import paginate
 from app.utils.tenant_context import get_current_user_id, get_current_user_role, get_tenant_id
 
 logger = logging.getLogger(__name__)
 
+# Characters of the body shown on dashboard banners
+BANNER_PREVIEW_LENGTH = 120
+
 
 class AnnouncementService:
     """Service for managing announcements."""
@@ -62,7 +67,8 @@ class AnnouncementService:
 
         db.add(announcement)
         await db.commit()
-        await db.refresh(announcement)
+        announcement = await self._load_announcement(db, announcement.id)
+        await get_cache_service().incr(announcement_version_key(tenant_id))
 
         # Send notifications in background (don't fail the create)
         try:
@@ -150,21 +156,12 @@ class AnnouncementService:
                 )
             )
 
-        # Count
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await db.execute(count_query)).scalar() or 0
-
         # Order and paginate
         query = query.order_by(
             Announcement.is_pinned.desc(),
             Announcement.created_at.desc(),
         )
-        query = query.offset((page - 1) * page_size).limit(page_size)
-
-        result = await db.execute(query)
-        announcements = list(result.scalars().all())
-
-        return announcements, total
+        return await paginate(db, query, page, page_size)
 
     async def get_active_announcements(
         self,
@@ -172,7 +169,12 @@ class AnnouncementService:
         user_id: uuid.UUID,
         class_ids: list[uuid.UUID],
     ) -> list[Announcement]:
-        """Get active, non-dismissed announcements for dashboard banners."""
+        """Get active, non-dismissed announcements for dashboard banners.
+
+        Banners show at most BANNER_PREVIEW_LENGTH characters, so the body
+        is left unloaded and body_preview carries one character more than
+        that (enough to tell whether to add an ellipsis).
+        """
         tenant_id = get_tenant_id()
 
         # Subquery for dismissed announcement IDs
@@ -182,14 +184,24 @@ class AnnouncementService:
             .subquery()
         )
 
-        query = select(Announcement).where(
-            Announcement.tenant_id == tenant_id,
-            Announcement.deleted_at.is_(None),
-            or_(
-                Announcement.expires_at.is_(None),
-                Announcement.expires_at > datetime.now(timezone.utc),
-            ),
-            Announcement.id.notin_(select(dismissed_subq)),
+        query = (
+            select(Announcement)
+            .options(
+                defer(Announcement.body, raiseload=True),
+                with_expression(
+                    Announcement.body_preview,
+                    func.substr(Announcement.body, 1, BANNER_PREVIEW_LENGTH + 1),
+                ),
+            )
+            .where(
+                Announcement.tenant_id == tenant_id,
+                Announcement.deleted_at.is_(None),
+                or_(
+                    Announcement.expires_at.is_(None),
+                    Announcement.expires_at > datetime.now(timezone.utc),
+                ),
+                Announcement.id.notin_(select(dismissed_subq)),
+            )
         )
 
         # Filter by scope: SCHOOL-level OR CLASS-level for user's classes
@@ -243,7 +255,8 @@ class AnnouncementService:
                 setattr(announcement, key, value)
 
         await db.commit()
-        await db.refresh(announcement)
+        announcement = await self._load_announcement(db, announcement_id)
+        await get_cache_service().incr(announcement_version_key(announcement.tenant_id))
         return announcement
 
     async def delete_announcement(
@@ -263,6 +276,7 @@ class AnnouncementService:
 
         announcement.deleted_at = datetime.now(timezone.utc)
         await db.commit()
+        await get_cache_service().incr(announcement_version_key(announcement.tenant_id))
         return True
 
     async def dismiss_announcement(
@@ -291,6 +305,28 @@ class AnnouncementService:
 
     # ============== Private Helpers ==============
 
+    async def _load_announcement(
+        self,
+        db: AsyncSession,
+        announcement_id: uuid.UUID,
+    ) -> Announcement:
+        """Reload a just-written announcement with what the response needs.
+
+        One joined SELECT, where refresh() would re-run the selectin loads
+        for tenant, class and creator as three more round trips.
+        """
+        result = await db.execute(
+            select(Announcement)
+            .options(
+                joinedload(Announcement.creator),
+                joinedload(Announcement.school_class),
+                noload(Announcement.tenant),
+            )
+            .where(Announcement.id == announcement_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one()
+
     async def _get_teacher_class_ids(
         self,
         db: AsyncSession,
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload
 
 from app.config import settings
 from app.exceptions import (
@@ -13,7 +14,15 @@ from app.exceptions import (
     UnauthorizedException,
     ValidationException,
 )
-from app.models import ParentInvitation, ParentStudent, User, Role, InvitationStatus
+from app.models import (
+    InvitationStatus,
+    ParentInvitation,
+    ParentStudent,
+    Role,
+    Student,
+    Tenant,
+    User,
+)
 from app.models.teacher_invitation import TeacherInvitation
 from app.schemas.auth import (
     LoginRequest,
@@ -21,6 +30,7 @@ from app.schemas.auth import (
     RegisterRequest,
     RegisterResponse,
     UserProfile,
+    VerifyInvitationResponse,
 )
 from app.utils.security import (
     create_access_token,
@@ -225,14 +235,16 @@ class AuthService:
         # Send email notifications
         try:
             from app.services.email_service import get_email_service
-            from app.models import Tenant
+            from app.services.tenant_service import get_tenant_service
 
             email_service = get_email_service()
             teacher_name = f"{user.first_name} {user.last_name}"
 
             # Get tenant name for emails
-            tenant = await db.get(Tenant, invitation.tenant_id)
-            tenant_name = tenant.name if tenant else "Your School"
+            tenant_name = (
+                await get_tenant_service().get_tenant_name(db, invitation.tenant_id)
+                or "Your School"
+            )
 
             # Welcome email to the teacher
             await email_service.send_welcome_email(
@@ -340,34 +352,61 @@ class AuthService:
 
     async def verify_invitation(
         self, db: AsyncSession, code: str, email: str
-    ) -> tuple[bool, ParentInvitation | None]:
+    ) -> VerifyInvitationResponse | None:
         """Verify an invitation code and email combination.
 
+        Student and school names are projected in the same query, and the
+        invitation's selectin relationships are suppressed so verifying a
+        code doesn't pull in the whole tenant graph.
+
         Args:
             db: Database session
             code: Invitation code
             email: Email address
 
         Returns:
-            Tuple of (is_valid, invitation or None)
+            VerifyInvitationResponse if valid, None otherwise
         """
-        stmt = select(ParentInvitation).where(
-            ParentInvitation.invitation_code == code.upper(),
-            ParentInvitation.email == email,
-            ParentInvitation.status == InvitationStatus.PENDING.value,
+        stmt = (
+            select(
+                ParentInvitation,
+                Student.first_name,
+                Student.last_name,
+                Tenant.name,
+            )
+            .outerjoin(Student, Student.id == ParentInvitation.student_id)
+            .outerjoin(Tenant, Tenant.id == ParentInvitation.tenant_id)
+            .options(noload("*"))
+            .where(
+                ParentInvitation.invitation_code == code.upper(),
+                ParentInvitation.email == email,
+                ParentInvitation.status == InvitationStatus.PENDING.value,
+            )
         )
         result = await db.execute(stmt)
-        invitation = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if not invitation:
-            return False, None
+        if not row:
+            return None
+
+        invitation, student_first, student_last, school_name = row
 
         if invitation.is_expired:
             invitation.mark_expired()
             await db.commit()
-            return False, None
-
-        return True, invitation
+            return None
+
+        student_name = None
+        if student_first is not None:
+            student_name = f"{student_first} {student_last}"
+
+        return VerifyInvitationResponse(
+            valid=True,
+            student_name=student_name,
+            school_name=school_name,
+            first_name=invitation.first_name or None,
+            last_name=invitation.last_name or None,
+        )
 
     async def _get_user_by_email(
         self, db: AsyncSession, email: str, tenant_id: uuid.UUID | None = None
@@ -0,0 +1,97 @@
+"""Optional Redis read-through cache for hot, cheap-to-rebuild reads.
+
+Without REDIS_URL every get is a miss and writes are no-ops, so callers
+always fall back to the database. Redis errors are logged and treated the
+same way: the cache must never fail a request.
+"""
+
+import logging
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+ANNOUNCEMENT_LIST_TTL = 60  # seconds
+
+
+def announcement_version_key(tenant_id) -> str:
+    """Cache key for a tenant's announcement list version.
+
+    Announcement lists are scoped per user, so instead of deleting every
+    cached page on a change the version is bumped and embedded in list keys.
+    """
+    return f"ann_ver:{tenant_id}"
+
+
+class CacheService:
+    """Thin async wrapper around an optional Redis client."""
+
+    def __init__(self):
+        """Initialize the cache service."""
+        self._redis = None
+
+    def _client(self):
+        """Get or create the Redis client, or None when Redis isn't configured."""
+        if self._redis is None and settings.redis_available:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(
+                settings.redis_url,
+                encoding="utf-8",
+                decode_responses=True,
+            )
+        return self._redis
+
+    async def get(self, key: str) -> str | None:
+        """Get a cached value, or None on a miss."""
+        client = self._client()
+        if client is None:
+            return None
+        try:
+            return await client.get(key)
+        except Exception as e:
+            logger.warning(f"Cache get failed for {key}: {e}")
+            return None
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        """Cache a value for ttl seconds."""
+        client = self._client()
+        if client is None:
+            return
+        try:
+            await client.set(key, value, ex=ttl)
+        except Exception as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+
+    async def delete(self, *keys: str) -> None:
+        """Drop cached values (one round trip however many keys)."""
+        client = self._client()
+        if client is None or not keys:
+            return
+        try:
+            await client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Cache delete failed for {len(keys)} keys: {e}")
+
+    async def incr(self, key: str) -> None:
+        """Increment a counter, e.g. to invalidate versioned keys."""
+        client = self._client()
+        if client is None:
+            return
+        try:
+            await client.incr(key)
+        except Exception as e:
+            logger.warning(f"Cache incr failed for {key}: {e}")
+
+
+# Singleton instance
+_cache_service: CacheService | None = None
+
+
+def get_cache_service() -> CacheService:
+    """Get the cache service singleton."""
+    global _cache_service
+    if _cache_service is None:
+        _cache_service = CacheService()
+    return _cache_service
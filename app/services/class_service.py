@@ -1,14 +1,15 @@
 """School class service for CRUD operations."""
 
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload, selectinload
 
 from app.exceptions import ConflictException, ForbiddenException, NotFoundException
-from app.models import SchoolClass, Student, TeacherClass, User
+from app.models import GradeLevel, SchoolClass, Student, TeacherClass, User
 from app.models.user import Role
 from app.schemas.school_class import (
     AssignTeacherRequest,
@@ -17,34 +18,28 @@ from app.schemas.school_class import (
 )
 from app.utils.tenant_context import get_current_user_id, get_current_user_role, get_tenant_id
 
+# Rows fetched per round-trip when streaming class lists
+STREAM_BATCH_SIZE = 20
+
 
 class ClassService:
     """Service for managing school classes."""
 
-    async def get_classes(
+    def _classes_query(
         self,
-        db: AsyncSession,
         is_active: bool | None = True,
-        age_group: str | None = None,  # DEPRECATED: Use grade_level_id
-        grade_level: str | None = None,  # DEPRECATED: Use grade_level_id
+        age_group: str | None = None,
+        grade_level: str | None = None,
         grade_level_id: uuid.UUID | None = None,
         search: str | None = None,
-        page: int = 1,
-        page_size: int = 20,
-    ) -> tuple[list[SchoolClass], int]:
-        """Get list of classes with optional filters."""
+    ) -> Select:
+        """Build the filtered, tenant/role-scoped class query (unpaginated, no loader options)."""
         tenant_id = get_tenant_id()
         role = get_current_user_role()
         user_id = get_current_user_id()
 
-        query = (
-            select(SchoolClass)
-            .where(SchoolClass.tenant_id == tenant_id, SchoolClass.deleted_at.is_(None))
-            .options(
-                selectinload(SchoolClass.students),
-                selectinload(SchoolClass.teacher_classes).selectinload(TeacherClass.teacher),
-                selectinload(SchoolClass.grade_level_rel),
-            )
+        query = select(SchoolClass).where(
+            SchoolClass.tenant_id == tenant_id, SchoolClass.deleted_at.is_(None)
         )
 
         # Teachers only see their assigned classes
@@ -68,6 +63,32 @@ class ClassService:
                 | (SchoolClass.description.ilike(search_term))
             )
 
+        return query
+
+    async def get_classes(
+        self,
+        db: AsyncSession,
+        is_active: bool | None = True,
+        age_group: str | None = None,  # DEPRECATED: Use grade_level_id
+        grade_level: str | None = None,  # DEPRECATED: Use grade_level_id
+        grade_level_id: uuid.UUID | None = None,
+        search: str | None = None,
+        page: int = 1,
+        page_size: int = 20,
+    ) -> tuple[list[SchoolClass], int]:
+        """Get list of classes with optional filters."""
+        query = self._classes_query(
+            is_active=is_active,
+            age_group=age_group,
+            grade_level=grade_level,
+            grade_level_id=grade_level_id,
+            search=search,
+        ).options(
+            selectinload(SchoolClass.students),
+            selectinload(SchoolClass.teacher_classes).selectinload(TeacherClass.teacher),
+            selectinload(SchoolClass.grade_level_rel),
+        )
+
         # Get total count
         count_query = select(func.count()).select_from(query.subquery())
         total = (await db.execute(count_query)).scalar() or 0
@@ -81,6 +102,87 @@ class ClassService:
 
         return classes, total
 
+    async def stream_classes(
+        self,
+        db: AsyncSession,
+        is_active: bool | None = True,
+        age_group: str | None = None,  # DEPRECATED: Use grade_level_id
+        grade_level: str | None = None,  # DEPRECATED: Use grade_level_id
+        grade_level_id: uuid.UUID | None = None,
+        search: str | None = None,
+        page: int = 1,
+        page_size: int = 20,
+    ) -> tuple[AsyncIterator[Row], int]:
+        """List-view variant of get_classes that yields projected rows in batches.
+
+        Each row is (SchoolClass, student_count, teacher_count,
+        primary_teacher_name, grade_level_name). The counts and names are
+        computed in SQL, so no relationships are loaded. Rows are fetched
+        through a server-side cursor in chunks of STREAM_BATCH_SIZE; the
+        iterator must be consumed while the session is still open.
+        """
+        query = self._classes_query(
+            is_active=is_active,
+            age_group=age_group,
+            grade_level=grade_level,
+            grade_level_id=grade_level_id,
+            search=search,
+        )
+
+        count_query = select(func.count()).select_from(query.subquery())
+        total = (await db.execute(count_query)).scalar() or 0
+
+        # correlate(SchoolClass) keeps the subqueries' TeacherClass independent
+        # of the outer TeacherClass join used to scope teachers.
+        student_count = (
+            select(func.count(Student.id))
+            .where(
+                Student.class_id == SchoolClass.id,
+                Student.deleted_at.is_(None),
+                Student.is_active == True,
+            )
+            .correlate(SchoolClass)
+            .scalar_subquery()
+        )
+        teacher_count = (
+            select(func.count(TeacherClass.id))
+            .where(TeacherClass.class_id == SchoolClass.id)
+            .correlate(SchoolClass)
+            .scalar_subquery()
+        )
+        # Primary teacher, falling back to any assigned teacher
+        primary_teacher_name = (
+            select(func.concat(User.first_name, " ", User.last_name))
+            .join(TeacherClass, TeacherClass.teacher_id == User.id)
+            .where(TeacherClass.class_id == SchoolClass.id)
+            .order_by(TeacherClass.is_primary.desc(), TeacherClass.assigned_at)
+            .limit(1)
+            .correlate(SchoolClass)
+            .scalar_subquery()
+        )
+
+        query = (
+            query.add_columns(
+                student_count.label("student_count"),
+                teacher_count.label("teacher_count"),
+                primary_teacher_name.label("primary_teacher_name"),
+                GradeLevel.name.label("grade_level_name"),
+            )
+            .outerjoin(GradeLevel, GradeLevel.id == SchoolClass.grade_level_id)
+            .options(noload("*"))
+            .order_by(SchoolClass.name)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+
+        async def _iter() -> AsyncIterator[Row]:
+            result = await db.stream(query)
+            async for row in result:
+                yield row
+
+        return _iter(), total
+
     async def get_class(
         self,
         db: AsyncSession,
@@ -50,10 +50,16 @@ class EmailService:
     def __init__(self):
         """Initialize the email service."""
         templates_path = Path(__file__).parent.parent / "templates" / "emails"
+        # Templates only change on deploy, so compile them all once here and
+        # skip the per-render mtime check outside development
         self.jinja_env = Environment(
             loader=FileSystemLoader(str(templates_path)),
             autoescape=select_autoescape(["html", "xml"]),
+            auto_reload=settings.is_development,
+            cache_size=-1,
         )
+        for template_name in self.jinja_env.list_templates(extensions=["html"]):
+            self.jinja_env.get_template(template_name)
 
     def _render_template(self, template_name: str, context: dict[str, Any]) -> str:
         """Render an email template with the given context."""
@@ -1,11 +1,16 @@
 """File service for managing file uploads and R2 storage."""
 
+import asyncio
 import io
 import logging
 import mimetypes
+import tempfile
+import threading
+import time
 import urllib.parse
 import uuid
 from datetime import datetime
+from typing import BinaryIO
 
 try:
     import magic  # type: ignore
@@ -16,8 +21,9 @@ import boto3
 from PIL import Image
 from botocore.config import Config
 from botocore.exceptions import ClientError
+from cachetools import TTLCache
 from fastapi import UploadFile
-from sqlalchemy import func, select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -25,6 +31,8 @@ from app.config import settings
 from app.exceptions import ForbiddenException, NotFoundException, ValidationException
 from app.models import FileEntity, User
 from app.models.file_entity import FileCategory
+from app.services.s3_signer import presign_get
+from app.utils.pagination import paginate
 from app.utils.tenant_context import get_current_user_id, get_tenant_id
 
 logger = logging.getLogger(__name__)
@@ -33,6 +41,20 @@ logger = logging.getLogger(__name__)
 PHOTO_MAX_DIMENSION = 1920
 # JPEG quality for compressed photos (85 is a good balance of quality/size)
 PHOTO_JPEG_QUALITY = 85
+# Downloads larger than this spill from memory to a temporary file
+DOWNLOAD_SPOOL_MAX_SIZE = 5 * 1024 * 1024
+
+
+# Presigned URLs are reused within a window of half their lifetime, so a
+# cached URL always has at least expires_in/2 seconds of validity left.
+# The TTL only bounds how long entries linger; correctness comes from the
+# window bucket in the cache key.
+PRESIGNED_URL_CACHE_SIZE = 10_000
+PRESIGNED_URL_CACHE_TTL = 1800
+_presigned_url_cache: TTLCache = TTLCache(
+    maxsize=PRESIGNED_URL_CACHE_SIZE, ttl=PRESIGNED_URL_CACHE_TTL
+)
+_presigned_url_cache_lock = threading.Lock()
 
 
 # Allowed MIME types for each category
@@ -265,6 +287,88 @@ class FileService:
 
         return file_entity
 
+    async def store_file(
+        self,
+        db: AsyncSession,
+        file_obj: BinaryIO,
+        original_name: str,
+        content_type: str,
+        category: FileCategory,
+    ) -> FileEntity:
+        """Stream an internal file to R2 and create a FileEntity record.
+
+        Unlike upload_file this does not buffer the file or apply the
+        category MIME rules; callers validate the content themselves.
+
+        Args:
+            db: Database session
+            file_obj: Binary file object to upload (read from the start)
+            original_name: Original file name
+            content_type: MIME type to store with the object
+            category: File category
+
+        Returns:
+            Created FileEntity
+        """
+        tenant_id = get_tenant_id()
+        user_id = get_current_user_id()
+
+        file_obj.seek(0, io.SEEK_END)
+        file_size = file_obj.tell()
+        file_obj.seek(0)
+
+        storage_path = self._generate_storage_path(
+            tenant_id, category, None, uuid.uuid4(), self._get_extension(original_name)
+        )
+
+        try:
+            await asyncio.to_thread(
+                self.s3_client.upload_fileobj,
+                file_obj,
+                settings.r2_bucket_name,
+                storage_path,
+                ExtraArgs={"ContentType": content_type},
+            )
+        except ClientError as e:
+            raise ValidationException([{
+                "field": "file",
+                "message": f"Failed to upload file: {str(e)}",
+            }])
+
+        file_entity = FileEntity(
+            tenant_id=tenant_id,
+            storage_path=storage_path,
+            original_name=original_name,
+            content_type=content_type,
+            file_size=file_size,
+            file_category=category.value,
+            uploaded_by=user_id,
+        )
+
+        db.add(file_entity)
+        await db.flush()
+
+        return file_entity
+
+    async def open_file(self, file_entity: FileEntity) -> BinaryIO:
+        """Download a stored file into a spooled temporary file.
+
+        The caller owns the returned file object and should close it.
+        """
+        buffer = tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_MAX_SIZE)
+        try:
+            await asyncio.to_thread(
+                self.s3_client.download_fileobj,
+                settings.r2_bucket_name,
+                file_entity.storage_path,
+                buffer,
+            )
+        except ClientError:
+            buffer.close()
+            raise NotFoundException("File")
+        buffer.seek(0)
+        return buffer
+
     async def get_file(
         self,
         db: AsyncSession,
@@ -279,6 +383,7 @@ class FileService:
                 FileEntity.id == file_id,
                 FileEntity.tenant_id == tenant_id,
                 FileEntity.deleted_at.is_(None),
+                FileEntity.file_category != FileCategory.IMPORT.value,
             )
             .options(selectinload(FileEntity.uploader))
         )
@@ -291,14 +396,81 @@ class FileService:
 
         return file_entity
 
+    async def get_import_file(
+        self,
+        db: AsyncSession,
+        tenant_id: uuid.UUID,
+        file_id: uuid.UUID,
+    ) -> FileEntity:
+        """Get a bulk import CSV by ID.
+
+        Import CSVs are hidden from get_file and get_files; only the import
+        service reads them, so the tenant is passed in rather than taken
+        from the request context.
+        """
+        query = select(FileEntity).where(
+            FileEntity.id == file_id,
+            FileEntity.tenant_id == tenant_id,
+            FileEntity.deleted_at.is_(None),
+            FileEntity.file_category == FileCategory.IMPORT.value,
+        )
+
+        result = await db.execute(query)
+        file_entity = result.scalar_one_or_none()
+
+        if not file_entity:
+            raise NotFoundException("File")
+
+        return file_entity
+
+    async def discard_import_file(
+        self,
+        db: AsyncSession,
+        tenant_id: uuid.UUID,
+        file_id: uuid.UUID,
+    ) -> None:
+        """Discard a bulk import CSV once its job has finished.
+
+        The entity is soft deleted and, unlike delete_file, the R2 object is
+        removed straight away: import CSVs hold student personal data and are
+        never recovered.
+        """
+        result = await db.execute(
+            update(FileEntity)
+            .where(
+                FileEntity.id == file_id,
+                FileEntity.tenant_id == tenant_id,
+                FileEntity.file_category == FileCategory.IMPORT.value,
+                FileEntity.deleted_at.is_(None),
+            )
+            .values(deleted_at=datetime.utcnow())
+            .returning(FileEntity.storage_path)
+        )
+        storage_path = result.scalar_one_or_none()
+        if storage_path is None:
+            return
+
+        try:
+            await asyncio.to_thread(
+                self.s3_client.delete_object,
+                Bucket=settings.r2_bucket_name,
+                Key=storage_path,
+            )
+        except ClientError:
+            logger.exception(f"Failed to delete import file {storage_path} from R2")
+
     async def get_files(
         self,
         db: AsyncSession,
         category: FileCategory | None = None,
         page: int = 1,
         page_size: int = 20,
-    ) -> tuple[list[FileEntity], int]:
-        """Get a list of files with optional filtering."""
+        count: bool = True,
+    ) -> tuple[list[FileEntity], int | None]:
+        """Get a list of files with optional filtering.
+
+        With count=False the total is skipped; see paginate.
+        """
         tenant_id = get_tenant_id()
 
         query = (
@@ -306,6 +478,7 @@ class FileService:
             .where(
                 FileEntity.tenant_id == tenant_id,
                 FileEntity.deleted_at.is_(None),
+                FileEntity.file_category != FileCategory.IMPORT.value,
             )
             .options(selectinload(FileEntity.uploader))
         )
@@ -313,18 +486,8 @@ class FileService:
         if category:
             query = query.where(FileEntity.file_category == category.value)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await db.execute(count_query)).scalar() or 0
-
-        # Apply pagination and ordering
         query = query.order_by(FileEntity.created_at.desc())
-        query = query.offset((page - 1) * page_size).limit(page_size)
-
-        result = await db.execute(query)
-        files = list(result.scalars().all())
-
-        return files, total
+        return await paginate(db, query, page, page_size, count=count)
 
     async def get_photos(
         self,
@@ -345,18 +508,8 @@ class FileService:
             .options(selectinload(FileEntity.uploader))
         )
 
-        # Count query
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await db.execute(count_query)).scalar() or 0
-
-        # Apply pagination
         query = query.order_by(FileEntity.created_at.desc())
-        query = query.offset((page - 1) * page_size).limit(page_size)
-
-        result = await db.execute(query)
-        photos = list(result.scalars().all())
-
-        return photos, total
+        return await paginate(db, query, page, page_size)
 
     async def get_documents(
         self,
@@ -377,18 +530,8 @@ class FileService:
             .options(selectinload(FileEntity.uploader))
         )
 
-        # Count query
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await db.execute(count_query)).scalar() or 0
-
-        # Apply pagination
         query = query.order_by(FileEntity.created_at.desc())
-        query = query.offset((page - 1) * page_size).limit(page_size)
-
-        result = await db.execute(query)
-        documents = list(result.scalars().all())
-
-        return documents, total
+        return await paginate(db, query, page, page_size)
 
     def generate_presigned_url(
         self,
@@ -406,27 +549,38 @@ class FileService:
         Returns:
             Presigned URL string
         """
-        try:
-            # Sanitize filename for Content-Disposition header (RFC 5987)
-            safe_name = file_entity.original_name.replace('"', '_').replace('\\', '_')
-            encoded_name = urllib.parse.quote(file_entity.original_name, safe='')
-            if inline:
-                disposition = f"inline; filename=\"{safe_name}\"; filename*=UTF-8''{encoded_name}"
-            else:
-                disposition = f"attachment; filename=\"{safe_name}\"; filename*=UTF-8''{encoded_name}"
-
-            url = self.s3_client.generate_presigned_url(
-                "get_object",
-                Params={
-                    "Bucket": settings.r2_bucket_name,
-                    "Key": file_entity.storage_path,
-                    "ResponseContentDisposition": disposition,
-                },
-                ExpiresIn=expires_in,
-            )
-            return url
-        except ClientError:
-            return ""
+        window = max(expires_in // 2, 1)
+        cache_key = (
+            file_entity.storage_path,
+            file_entity.original_name,
+            inline,
+            expires_in,
+            int(time.time()) // window,
+        )
+        with _presigned_url_cache_lock:
+            cached = _presigned_url_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Sanitize filename for Content-Disposition header (RFC 5987)
+        safe_name = file_entity.original_name.replace('"', '_').replace('\\', '_')
+        encoded_name = urllib.parse.quote(file_entity.original_name, safe='')
+        if inline:
+            disposition = f"inline; filename=\"{safe_name}\"; filename*=UTF-8''{encoded_name}"
+        else:
+            disposition = f"attachment; filename=\"{safe_name}\"; filename*=UTF-8''{encoded_name}"
+
+        # Signed locally; no botocore request model per URL
+        url = presign_get(
+            settings.r2_bucket_name,
+            file_entity.storage_path,
+            expires_in,
+            response_content_disposition=disposition,
+        )
+
+        with _presigned_url_cache_lock:
+            _presigned_url_cache[cache_key] = url
+        return url
 
     async def delete_file(
         self,
@@ -502,6 +656,13 @@ class FileService:
         entity_part = str(entity_id) if entity_id else "general"
         return f"{tenant_id}/{category.value}/{entity_part}/{file_uuid}{file_ext}"
 
+# Singleton instance; shares one lazily created S3 client across requests
+_file_service: FileService | None = None
+
+
 def get_file_service() -> FileService:
-    """Get file service instance."""
-    return FileService()
+    """Get the file service singleton."""
+    global _file_service
+    if _file_service is None:
+        _file_service = FileService()
+    return _file_service
@@ -4,11 +4,15 @@ import uuid
 from datetime import datetime
 from typing import List, Tuple
 
-from sqlalchemy import select, func
+from sqlalchemy import Row, Select, exists, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.exceptions import ConflictException
 from app.models.grade_level import GradeLevel
 from app.models.tenant import EducationType
+from app.utils.pagination import paginate
 from app.utils.tenant_context import get_tenant_id
 
 
@@ -76,18 +80,11 @@ DEFAULT_GRADE_LEVELS = {
 class GradeLevelService:
     """Service for managing grade level configuration."""
 
-    async def get_grade_levels(
-        self,
-        db: AsyncSession,
-        is_active: bool | None = True,
-        page: int = 1,
-        page_size: int = 100,
-    ) -> Tuple[List[GradeLevel], int]:
-        """Get all grade levels for the current tenant."""
+    def _grade_levels_query(self, *columns, is_active: bool | None) -> Select:
+        """Build the tenant's grade level list query for the given columns."""
         tenant_id = get_tenant_id()
 
-        # Base query
-        query = select(GradeLevel).where(
+        query = select(*columns).where(
             GradeLevel.tenant_id == tenant_id,
             GradeLevel.deleted_at.is_(None),
         )
@@ -96,18 +93,43 @@ class GradeLevelService:
         if is_active is not None:
             query = query.where(GradeLevel.is_active == is_active)
 
-        # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await db.execute(count_query)).scalar() or 0
+        return query.order_by(GradeLevel.display_order, GradeLevel.name)
 
-        # Apply pagination and ordering
-        query = query.order_by(GradeLevel.display_order, GradeLevel.name)
-        query = query.offset((page - 1) * page_size).limit(page_size)
+    async def get_grade_levels(
+        self,
+        db: AsyncSession,
+        is_active: bool | None = True,
+        page: int = 1,
+        page_size: int = 100,
+    ) -> Tuple[List[GradeLevel], int]:
+        """Get all grade levels for the current tenant."""
+        query = self._grade_levels_query(GradeLevel, is_active=is_active)
+        return await paginate(db, query, page, page_size)
 
-        result = await db.execute(query)
-        grade_levels = list(result.scalars().all())
+    async def get_grade_level_rows(
+        self,
+        db: AsyncSession,
+        is_active: bool | None = True,
+        page: int = 1,
+        page_size: int = 100,
+        count: bool = True,
+    ) -> Tuple[List[Row], int | None]:
+        """Get the grade level list columns as plain rows.
 
-        return grade_levels, total
+        For read-only list responses: selects only the listed columns, so no
+        ORM instances are built or added to the identity map. With
+        count=False the total is skipped; see paginate.
+        """
+        query = self._grade_levels_query(
+            GradeLevel.id,
+            GradeLevel.name,
+            GradeLevel.code,
+            GradeLevel.description,
+            GradeLevel.display_order,
+            GradeLevel.is_active,
+            is_active=is_active,
+        )
+        return await paginate(db, query, page, page_size, scalars=False, count=count)
 
     async def get_grade_level(
         self, db: AsyncSession, grade_level_id: uuid.UUID
@@ -144,21 +166,37 @@ class GradeLevelService:
         code: str,
         description: str | None = None,
         display_order: int = 0,
-    ) -> GradeLevel:
-        """Create a new grade level."""
+    ) -> GradeLevel | None:
+        """Create a new grade level unless its code is already taken.
+
+        Uses INSERT ... ON CONFLICT DO NOTHING against the partial
+        (tenant_id, code) unique index, so the uniqueness check and the
+        insert are a single round-trip.
+
+        Returns:
+            The created GradeLevel, or None if the code already exists
+        """
         tenant_id = get_tenant_id()
 
-        grade_level = GradeLevel(
-            tenant_id=tenant_id,
-            name=name,
-            code=code.upper(),
-            description=description,
-            display_order=display_order,
-            is_active=True,
+        stmt = (
+            pg_insert(GradeLevel)
+            .values(
+                tenant_id=tenant_id,
+                name=name,
+                code=code.upper(),
+                description=description,
+                display_order=display_order,
+                is_active=True,
+            )
+            .on_conflict_do_nothing(
+                index_elements=[GradeLevel.tenant_id, GradeLevel.code],
+                index_where=GradeLevel.deleted_at.is_(None),
+            )
+            .returning(GradeLevel)
         )
-        db.add(grade_level)
+        result = await db.execute(stmt)
+        grade_level = result.scalar_one_or_none()
         await db.commit()
-        await db.refresh(grade_level)
         return grade_level
 
     async def update_grade_level(
@@ -167,19 +205,62 @@ class GradeLevelService:
         grade_level_id: uuid.UUID,
         **kwargs,
     ) -> GradeLevel | None:
-        """Update a grade level."""
-        grade_level = await self.get_grade_level(db, grade_level_id)
-        if not grade_level:
-            return None
+        """Update a grade level.
+
+        When the code changes, the uniqueness check is folded into the
+        UPDATE as a NOT EXISTS guard; only a zero-row result costs a
+        follow-up lookup to tell "not found" from "code taken".
+
+        Returns:
+            The updated GradeLevel, or None if not found
+
+        Raises:
+            ConflictException: If another grade level already uses the code
+        """
+        tenant_id = get_tenant_id()
 
+        values = {}
         for key, value in kwargs.items():
-            if hasattr(grade_level, key) and value is not None:
+            if hasattr(GradeLevel, key) and value is not None:
                 if key == "code":
                     value = value.upper()
-                setattr(grade_level, key, value)
+                values[key] = value
+
+        if not values:
+            return await self.get_grade_level(db, grade_level_id)
+
+        stmt = update(GradeLevel).where(
+            GradeLevel.id == grade_level_id,
+            GradeLevel.tenant_id == tenant_id,
+            GradeLevel.deleted_at.is_(None),
+        )
+        if "code" in values:
+            other = aliased(GradeLevel)
+            stmt = stmt.where(
+                ~exists().where(
+                    other.tenant_id == tenant_id,
+                    other.code == values["code"],
+                    other.id != grade_level_id,
+                    other.deleted_at.is_(None),
+                )
+            )
+        stmt = (
+            stmt.values(**values)
+            .returning(GradeLevel)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+
+        result = await db.execute(stmt)
+        grade_level = result.scalar_one_or_none()
+
+        if grade_level is None:
+            if "code" in values and await self.get_grade_level(db, grade_level_id):
+                raise ConflictException(
+                    f"Grade level with code '{kwargs['code']}' already exists"
+                )
+            return None
 
         await db.commit()
-        await db.refresh(grade_level)
         return grade_level
 
     async def delete_grade_level(
@@ -1,16 +1,23 @@
 """Bulk CSV import service."""
 
+import asyncio
 import csv
 import io
 import logging
-from datetime import date, datetime, timezone
-from typing import Any
+import re
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, BinaryIO
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, and_, func, insert, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database import get_db_context
 from app.models import BulkImportJob, SchoolClass, Student, User
+from app.models.file_entity import FileCategory
+from app.services.file_service import get_file_service
+from app.utils.pagination import paginate
 from app.utils.tenant_context import get_current_user_id, get_tenant_id
 
 logger = logging.getLogger(__name__)
@@ -51,6 +58,98 @@ IMPORT_FIELDS = {
 }
 
 
+# Number of sample rows returned in the upload preview
+PREVIEW_ROW_COUNT = 5
+# Bytes read per chunk when counting CSV rows
+ROW_COUNT_CHUNK_SIZE = 1024 * 1024
+# The end of a non-empty line: a content byte, then CRLF, CR or LF
+_LINE_END = re.compile(rb"[^\r\n](?:\r\n?|\n)")
+# Validated student rows are inserted with one executemany per batch
+IMPORT_BATCH_SIZE = 1000
+# Errors fetched per round-trip when streaming a job's error list
+ERRORS_STREAM_BATCH_SIZE = 500
+# A running job commits progress every 50 rows; one silent this long lost its task
+STALE_PROCESSING_AFTER = timedelta(minutes=15)
+# Uploads whose column mapping was never submitted
+STALE_PENDING_AFTER = timedelta(days=1)
+
+# Running import tasks; holds strong references so they aren't garbage
+# collected mid-run
+_background_imports: set[asyncio.Task] = set()
+
+
+def _count_csv_rows(csv_file: BinaryIO) -> int | None:
+    """Count data rows by scanning for line endings.
+
+    The regex scan runs in C, orders of magnitude faster than iterating a
+    csv.reader. Only line endings that close a non-empty line are counted,
+    because csv.DictReader skips blank lines. Only valid when no field can
+    contain an embedded newline, so returns None as soon as a quote
+    character is seen.
+    """
+    lines = 0
+    tail = b""
+    while chunk := csv_file.read(ROW_COUNT_CHUNK_SIZE):
+        if b'"' in chunk:
+            return None
+        data = tail + chunk
+        lines += len(_LINE_END.findall(data))
+        # Carry a trailing content byte so a line ending at the start of the
+        # next chunk is still matched
+        tail = data[-1:].strip(b"\r\n")
+
+    # A final non-empty line without a trailing newline is still a row
+    if tail:
+        lines += 1
+    return max(lines - 1, 0)  # Minus the header
+
+
+def _parse_csv_preview(csv_file: BinaryIO) -> tuple[list[str], list[dict], int]:
+    """Read headers, sample rows and the row count from an uploaded CSV.
+
+    Decodes incrementally through a TextIOWrapper over the upload's spooled
+    file, so only one buffer's worth of text is resident at a time instead
+    of the whole file as both bytes and str. The row count comes from a
+    byte scan when the file has no quoted fields, and from the csv reader
+    otherwise.
+    """
+    total_rows = _count_csv_rows(csv_file)
+    csv_file.seek(0)
+
+    text = io.TextIOWrapper(csv_file, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
+        headers = reader.fieldnames or []
+
+        if total_rows is not None:
+            sample_rows = [dict(row) for _, row in zip(range(PREVIEW_ROW_COUNT), reader)]
+        else:
+            sample_rows = []
+            total_rows = 0
+            for row in reader:
+                if total_rows < PREVIEW_ROW_COUNT:
+                    sample_rows.append(dict(row))
+                total_rows += 1
+    finally:
+        # Hand the underlying file back to the caller un-closed
+        text.detach()
+
+    return list(headers), sample_rows, total_rows
+
+
+def _read_csv_sample(csv_file: BinaryIO, sample_count: int) -> tuple[list[str], list[dict]]:
+    """Read headers and the first few rows of a CSV without scanning the rest."""
+    text = io.TextIOWrapper(csv_file, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
+        headers = reader.fieldnames or []
+        sample_rows = [dict(row) for _, row in zip(range(sample_count), reader)]
+    finally:
+        text.detach()
+
+    return list(headers), sample_rows
+
+
 class ImportService:
     """Service for handling bulk CSV imports."""
 
@@ -63,23 +162,32 @@ class ImportService:
         db: AsyncSession,
         file_name: str,
         import_type: str,
-        csv_content: str,
+        csv_file: BinaryIO,
     ) -> tuple[BulkImportJob, list[str], list[dict], int]:
-        """Create an import job and return preview data."""
+        """Create an import job and return preview data.
+
+        Args:
+            csv_file: Binary file object positioned at the start of the CSV
+                (e.g. UploadFile.file). Raises ValueError if it isn't UTF-8.
+        """
         tenant_id = get_tenant_id()
         user_id = get_current_user_id()
 
-        # Parse CSV to get headers and preview
-        reader = csv.DictReader(io.StringIO(csv_content))
-        headers = reader.fieldnames or []
+        # Parse CSV to get headers and preview. This is a pure-Python loop
+        # over every row, so keep it off the event loop.
+        headers, sample_rows, total_rows = await asyncio.to_thread(
+            _parse_csv_preview, csv_file
+        )
 
-        # Get sample rows (up to 5)
-        sample_rows = []
-        total_rows = 0
-        for i, row in enumerate(reader):
-            total_rows += 1
-            if i < 5:
-                sample_rows.append(dict(row))
+        # Keep the raw CSV in object storage until processing; the job row
+        # only references it
+        csv_entity = await get_file_service().store_file(
+            db,
+            csv_file,
+            original_name=file_name,
+            content_type="text/csv",
+            category=FileCategory.IMPORT,
+        )
 
         # Create job record
         job = BulkImportJob(
@@ -89,8 +197,7 @@ class ImportService:
             status="PENDING",
             total_rows=total_rows,
             created_by=user_id,
-            # Store CSV content in column_mapping temporarily until processing
-            column_mapping={"_csv_content": csv_content},
+            csv_file_id=csv_entity.id,
         )
 
         db.add(job)
@@ -115,13 +222,53 @@ class ImportService:
         )
         return result.scalar_one_or_none()
 
+    async def has_job(self, db: AsyncSession, job_id: UUID) -> bool:
+        """Check an import job exists for the current tenant without loading it."""
+        tenant_id = get_tenant_id()
+
+        result = await db.execute(
+            select(BulkImportJob.id).where(
+                BulkImportJob.id == job_id,
+                BulkImportJob.tenant_id == tenant_id,
+            )
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def stream_job_errors(
+        self,
+        job_id: UUID,
+        tenant_id: UUID,
+    ) -> AsyncIterator[str]:
+        """Yield a job's errors one at a time, each as JSON text.
+
+        The errors array is unnested in Postgres and read through a
+        server-side cursor, so memory stays flat however many errors the
+        job has. Uses its own session because it is consumed while the
+        response body streams, after the request's session has closed.
+        """
+        query = (
+            select(func.jsonb_array_elements_text(BulkImportJob.errors))
+            .where(
+                BulkImportJob.id == job_id,
+                BulkImportJob.tenant_id == tenant_id,
+            )
+            .execution_options(yield_per=ERRORS_STREAM_BATCH_SIZE)
+        )
+        async with get_db_context() as db:
+            async for error in await db.stream_scalars(query):
+                yield error
+
     async def start_import(
         self,
         db: AsyncSession,
         job_id: UUID,
         column_mapping: dict[str, str | None],
     ) -> BulkImportJob:
-        """Start processing an import job with the given column mapping."""
+        """Start processing an import job with the given column mapping.
+
+        Marks the job PROCESSING and hands the work to a background task;
+        callers poll the job for progress.
+        """
         job = await self.get_job(db, job_id)
         if not job:
             raise ValueError("Import job not found")
@@ -129,32 +276,116 @@ class ImportService:
         if job.status != "PENDING":
             raise ValueError("Job has already been started")
 
-        # Get CSV content and clear it from mapping
-        csv_content = job.column_mapping.get("_csv_content", "")
+        if job.csv_file_id is None:
+            raise ValueError("Import file is no longer available")
+
         job.column_mapping = column_mapping
         job.status = "PROCESSING"
         await db.commit()
 
-        # Process the import
-        try:
-            await self._process_import(db, job, csv_content, column_mapping)
-        except Exception as e:
-            logger.error(f"Import job {job_id} failed: {e}")
-            job.status = "FAILED"
-            job.errors = [{"row": 0, "field": None, "message": str(e)}]
-            await db.commit()
+        # The task inherits a copy of the current tenant/user context
+        task = asyncio.create_task(self._run_import(job.id))
+        _background_imports.add(task)
+        task.add_done_callback(_background_imports.discard)
 
         return job
 
+    async def _run_import(self, job_id: UUID) -> None:
+        """Process a started import job in its own session."""
+        async with get_db_context() as db:
+            job = await self.get_job(db, job_id)
+            if not job:
+                logger.error(f"Import job {job_id} disappeared before processing")
+                return
+
+            tenant_id = job.tenant_id
+            csv_file_id = job.csv_file_id
+            try:
+                csv_file = await self.open_job_csv(db, job)
+                with csv_file:
+                    await self._process_import(db, job, csv_file, job.column_mapping)
+            except Exception as e:
+                logger.error(f"Import job {job_id} failed: {e}")
+                await db.rollback()
+                job = await db.get(BulkImportJob, job_id, populate_existing=True)
+                job.status = "FAILED"
+                job.errors = [{"row": 0, "field": None, "message": str(e)}]
+                job.completed_at = datetime.now(timezone.utc)
+
+            # The CSV holds student personal data; keep it only while the job runs
+            await get_file_service().discard_import_file(db, tenant_id, csv_file_id)
+            await db.commit()
+
+    async def fail_stale_jobs(self, db: AsyncSession) -> int:
+        """Fail jobs left behind by a restart and discard their CSVs.
+
+        Imports run as in-process tasks, so a restart mid-import leaves the
+        job PROCESSING with nothing to finish it. Runs across all tenants at
+        startup. Returns the number of jobs failed.
+        """
+        now = datetime.now(timezone.utc)
+        result = await db.execute(
+            select(BulkImportJob).where(
+                or_(
+                    and_(
+                        BulkImportJob.status == "PROCESSING",
+                        BulkImportJob.updated_at < now - STALE_PROCESSING_AFTER,
+                    ),
+                    and_(
+                        BulkImportJob.status == "PENDING",
+                        BulkImportJob.updated_at < now - STALE_PENDING_AFTER,
+                    ),
+                )
+            )
+        )
+        jobs = result.scalars().all()
+
+        file_service = get_file_service()
+        for job in jobs:
+            message = (
+                "Import was interrupted by a server restart. Please upload the file again."
+                if job.status == "PROCESSING"
+                else "Import was never started. Please upload the file again."
+            )
+            job.errors = [*job.errors, {"row": 0, "field": None, "value": "", "message": message}]
+            job.error_count = len(job.errors)
+            job.status = "FAILED"
+            job.completed_at = now
+            if job.csv_file_id is not None:
+                await file_service.discard_import_file(db, job.tenant_id, job.csv_file_id)
+
+        await db.flush()
+        return len(jobs)
+
+    async def open_job_csv(self, db: AsyncSession, job: BulkImportJob) -> BinaryIO:
+        """Download a job's uploaded CSV. The caller closes the returned file."""
+        file_service = get_file_service()
+        csv_entity = await file_service.get_import_file(db, job.tenant_id, job.csv_file_id)
+        return await file_service.open_file(csv_entity)
+
+    async def get_job_sample(
+        self,
+        db: AsyncSession,
+        job: BulkImportJob,
+        sample_count: int = 3,
+    ) -> tuple[list[str], list[dict]]:
+        """Get the CSV headers and first few rows of a job's upload."""
+        if job.csv_file_id is None:
+            return [], []
+
+        csv_file = await self.open_job_csv(db, job)
+        with csv_file:
+            return await asyncio.to_thread(_read_csv_sample, csv_file, sample_count)
+
     async def _process_import(
         self,
         db: AsyncSession,
         job: BulkImportJob,
-        csv_content: str,
+        csv_file: BinaryIO,
         column_mapping: dict[str, str | None],
     ):
         """Process the actual import."""
-        reader = csv.DictReader(io.StringIO(csv_content))
+        reader = csv.DictReader(io.TextIOWrapper(csv_file, encoding="utf-8-sig", newline=""))
         errors = []
         success_count = 0
         processed_count = 0
@@ -165,17 +396,27 @@ class ImportService:
             if sys_field:
                 field_to_csv[sys_field] = csv_col
 
+        # Students are validated row by row but inserted in batches
+        pending_students: list[tuple[int, dict[str, Any]]] = []
+        class_ids = {}
+        if job.import_type == "STUDENTS" and "class_name" in field_to_csv:
+            # Rows are streamed, so resolve every class name up front
+            class_ids = await self._get_class_ids_by_name(db, job.tenant_id)
+
         for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
             processed_count += 1
             try:
                 if job.import_type == "STUDENTS":
-                    await self._import_student_row(db, job.tenant_id, row, field_to_csv)
-                elif job.import_type == "TEACHERS":
-                    await self._import_teacher_row(db, job.tenant_id, row, field_to_csv)
-                elif job.import_type == "PARENTS":
-                    await self._import_parent_row(db, job.tenant_id, row, field_to_csv)
-
-                success_count += 1
+                    values = self._build_student_values(
+                        job.tenant_id, row, field_to_csv, class_ids
+                    )
+                    pending_students.append((row_num, values))
+                else:
+                    if job.import_type == "TEACHERS":
+                        await self._import_teacher_row(db, job.tenant_id, row, field_to_csv)
+                    elif job.import_type == "PARENTS":
+                        await self._import_parent_row(db, job.tenant_id, row, field_to_csv)
+                    success_count += 1
             except Exception as e:
                 errors.append({
                     "row": row_num,
@@ -184,6 +425,10 @@ class ImportService:
                     "message": str(e),
                 })
 
+            if len(pending_students) >= IMPORT_BATCH_SIZE:
+                success_count += await self._insert_student_batch(db, pending_students, errors)
+                pending_students = []
+
             # Update progress periodically
             if processed_count % 50 == 0:
                 job.processed_rows = processed_count
@@ -191,6 +436,9 @@ class ImportService:
                 job.error_count = len(errors)
                 await db.commit()
 
+        if pending_students:
+            success_count += await self._insert_student_batch(db, pending_students, errors)
+
         # Final update
         job.processed_rows = processed_count
         job.success_count = success_count
@@ -200,14 +448,92 @@ class ImportService:
         job.completed_at = datetime.now(timezone.utc)
         await db.commit()
 
+    async def _insert_student_batch(
+        self,
+        db: AsyncSession,
+        batch: list[tuple[int, dict[str, Any]]],
+        errors: list[dict],
+    ) -> int:
+        """Insert validated student rows with a single executemany.
+
+        The batch runs in a savepoint. If the database rejects it, the batch
+        is retried row by row, each in its own savepoint, so only the rows
+        the database refuses are reported as errors.
+
+        Returns:
+            Number of rows inserted
+        """
+        try:
+            async with db.begin_nested():
+                await db.execute(insert(Student), [values for _, values in batch])
+        except Exception as e:
+            logger.warning(f"Student batch insert failed, retrying row by row: {e}")
+        else:
+            return len(batch)
+
+        inserted = 0
+        for row_num, values in batch:
+            try:
+                async with db.begin_nested():
+                    await db.execute(insert(Student), values)
+            except Exception as e:
+                name = f"{values.get('first_name', '')} {values.get('last_name', '')}".strip()
+                errors.append({"row": row_num, "field": None, "value": name, "message": str(e)})
+            else:
+                inserted += 1
+        return inserted
+
+    async def _get_class_ids_by_name(
+        self,
+        db: AsyncSession,
+        tenant_id: UUID,
+        names: set[str] | None = None,
+    ) -> dict[str, UUID | None]:
+        """Resolve class names to IDs with a single query.
+
+        Loads every class of the tenant when names is None. A name shared
+        by more than one class maps to None so rows using it can be
+        reported as ambiguous.
+        """
+        query = select(SchoolClass.name, SchoolClass.id).where(
+            SchoolClass.tenant_id == tenant_id,
+            SchoolClass.deleted_at.is_(None),
+        )
+        if names is not None:
+            if not names:
+                return {}
+            query = query.where(SchoolClass.name.in_(names))
+
+        class_ids: dict[str, UUID | None] = {}
+        for name, class_id in await db.execute(query):
+            class_ids[name] = None if name in class_ids else class_id
+        return class_ids
+
     async def _import_student_row(
         self,
         db: AsyncSession,
         tenant_id: UUID,
         row: dict,
         field_to_csv: dict[str, str],
+        class_ids: dict[str, UUID | None],
     ):
         """Import a single student row."""
+        values = self._build_student_values(tenant_id, row, field_to_csv, class_ids)
+        db.add(Student(**values))
+        await db.flush()
+
+    def _build_student_values(
+        self,
+        tenant_id: UUID,
+        row: dict,
+        field_to_csv: dict[str, str],
+        class_ids: dict[str, UUID | None],
+    ) -> dict[str, Any]:
+        """Validate a student row and return the column values to insert.
+
+        Args:
+            class_ids: Class name -> ID lookup from _get_class_ids_by_name
+        """
         # Get values using mapping
         def get_val(field: str) -> str | None:
             csv_col = field_to_csv.get(field)
@@ -238,17 +564,10 @@ class ImportService:
         # Find class by name
         class_id = None
         class_name = get_val("class_name")
-        if class_name:
-            result = await db.execute(
-                select(SchoolClass).where(
-                    SchoolClass.tenant_id == tenant_id,
-                    SchoolClass.name == class_name,
-                    SchoolClass.deleted_at.is_(None),
-                )
-            )
-            school_class = result.scalar_one_or_none()
-            if school_class:
-                class_id = school_class.id
+        if class_name and class_name in class_ids:
+            class_id = class_ids[class_name]
+            if class_id is None:
+                raise ValueError(f"More than one class is named '{class_name}'")
 
         # Build emergency contacts
         emergency_contacts = []
@@ -261,23 +580,20 @@ class ImportService:
                 "relationship": "Emergency Contact",
             })
 
-        student = Student(
-            tenant_id=tenant_id,
-            first_name=first_name,
-            last_name=last_name,
-            date_of_birth=dob,
-            gender=get_val("gender"),
-            age_group=get_val("age_group"),
-            grade_level=get_val("grade_level"),
-            class_id=class_id,
-            medical_info=get_val("medical_info"),
-            allergies=get_val("allergies"),
-            emergency_contacts=emergency_contacts,
-            enrollment_date=date.today(),
-        )
-
-        db.add(student)
-        await db.flush()
+        return {
+            "tenant_id": tenant_id,
+            "first_name": first_name,
+            "last_name": last_name,
+            "date_of_birth": dob,
+            "gender": get_val("gender"),
+            "age_group": get_val("age_group"),
+            "grade_level": get_val("grade_level"),
+            "class_id": class_id,
+            "medical_info": get_val("medical_info"),
+            "allergies": get_val("allergies"),
+            "emergency_contacts": emergency_contacts,
+            "enrollment_date": date.today(),
+        }
 
     async def _import_teacher_row(
         self,
@@ -398,24 +714,49 @@ class ImportService:
         page_size: int = 20,
     ) -> tuple[list[BulkImportJob], int]:
         """List import jobs for the current tenant."""
-        from sqlalchemy import func
-
         tenant_id = get_tenant_id()
 
-        query = select(BulkImportJob).where(BulkImportJob.tenant_id == tenant_id)
-
-        # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await db.execute(count_query)).scalar() or 0
+        query = (
+            select(BulkImportJob)
+            .where(BulkImportJob.tenant_id == tenant_id)
+            .order_by(BulkImportJob.created_at.desc())
+        )
+        return await paginate(db, query, page, page_size)
 
-        # Apply pagination
-        query = query.order_by(BulkImportJob.created_at.desc())
-        query = query.offset((page - 1) * page_size).limit(page_size)
+    async def list_job_rows(
+        self,
+        db: AsyncSession,
+        page: int = 1,
+        page_size: int = 20,
+        count: bool = True,
+    ) -> tuple[list[Row], int | None]:
+        """List import job summaries as plain rows.
 
-        result = await db.execute(query)
-        jobs = list(result.scalars().all())
+        Leaves out the errors and column_mapping JSONB columns, which list
+        responses don't include. With count=False the total is skipped; see
+        paginate.
+        """
+        tenant_id = get_tenant_id()
 
-        return jobs, total
+        query = (
+            select(
+                BulkImportJob.id,
+                BulkImportJob.tenant_id,
+                BulkImportJob.import_type,
+                BulkImportJob.file_name,
+                BulkImportJob.status,
+                BulkImportJob.total_rows,
+                BulkImportJob.processed_rows,
+                BulkImportJob.success_count,
+                BulkImportJob.error_count,
+                BulkImportJob.created_by,
+                BulkImportJob.completed_at,
+                BulkImportJob.created_at,
+            )
+            .where(BulkImportJob.tenant_id == tenant_id)
+            .order_by(BulkImportJob.created_at.desc())
+        )
+        return await paginate(db, query, page, page_size, scalars=False, count=count)
 
     async def create_and_process_enrollment(
         self,
@@ -461,6 +802,17 @@ class ImportService:
         # This makes _import_student_row read row[field_name] directly
         field_to_csv = {col[0]: col[0] for col in ENROLLMENT_COLUMNS}
 
+        # Resolve every referenced class name in one query
+        class_ids = await self._get_class_ids_by_name(
+            db,
+            tenant_id,
+            names={
+                name.strip()
+                for row_data in rows
+                if (name := row_data.get("class_name")) and name.strip()
+            },
+        )
+
         errors = []
         success_count = 0
         processed_count = 0
@@ -470,7 +822,9 @@ class ImportService:
             processed_count += 1
 
             try:
-                await self._import_student_row(db, tenant_id, row_data, field_to_csv)
+                await self._import_student_row(
+                    db, tenant_id, row_data, field_to_csv, class_ids
+                )
                 success_count += 1
             except Exception as e:
                 errors.append({
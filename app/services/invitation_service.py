@@ -3,19 +3,31 @@
 import logging
 import secrets
 import string
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
 
 from app.config import get_settings
 from app.models import ParentInvitation, Student, Tenant, User
+from app.utils.pagination import paginate
 from app.utils.tenant_context import get_current_user_id, get_tenant_id
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Loader options for invitation lists that show student and creator names.
+# selectinload fetches each relationship for the whole page with one
+# "WHERE id IN (...)" query.
+INVITATION_LIST_OPTIONS = (
+    selectinload(ParentInvitation.student),
+    selectinload(ParentInvitation.created_by_user),
+)
+
 
 class InvitationService:
     """Service for managing parent invitations."""
@@ -104,11 +116,20 @@ class InvitationService:
         db: AsyncSession,
         invitation_id: UUID,
     ) -> ParentInvitation | None:
-        """Get an invitation by ID."""
+        """Get an invitation by ID, with its student and creator.
+
+        Both are many-to-one, so joining them keeps this a single query
+        instead of one per selectin relationship.
+        """
         tenant_id = get_tenant_id()
 
         result = await db.execute(
-            select(ParentInvitation).where(
+            select(ParentInvitation)
+            .options(
+                joinedload(ParentInvitation.student),
+                joinedload(ParentInvitation.created_by_user),
+            )
+            .where(
                 and_(
                     ParentInvitation.id == invitation_id,
                     ParentInvitation.tenant_id == tenant_id,
@@ -244,11 +265,26 @@ class InvitationService:
         student_id: UUID | None = None,
         page: int = 1,
         page_size: int = 20,
-    ) -> tuple[list[ParentInvitation], int]:
-        """List invitations with optional filters."""
+        options: Sequence[ExecutableOption] = (),
+        after: tuple[datetime, UUID] | None = None,
+    ) -> tuple[list[ParentInvitation], int | None]:
+        """List invitations with optional filters, newest first.
+
+        Args:
+            options: Loader options for the invitations query, so callers
+                can eager-load exactly the relationships they render
+            after: (created_at, id) of the last invitation already seen.
+                Fetches the next page by keyset instead of OFFSET, so deep
+                pages cost the same as the first; page is ignored, the
+                total is skipped and up to page_size + 1 items are returned
+        """
         tenant_id = get_tenant_id()
 
-        query = select(ParentInvitation).where(ParentInvitation.tenant_id == tenant_id)
+        query = (
+            select(ParentInvitation)
+            .where(ParentInvitation.tenant_id == tenant_id)
+            .options(*options)
+        )
 
         if status:
             query = query.where(ParentInvitation.status == status)
@@ -256,18 +292,15 @@ class InvitationService:
         if student_id:
             query = query.where(ParentInvitation.student_id == student_id)
 
-        # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await db.execute(count_query)).scalar() or 0
-
-        # Apply pagination and ordering
-        query = query.order_by(ParentInvitation.created_at.desc())
-        query = query.offset((page - 1) * page_size).limit(page_size)
-
-        result = await db.execute(query)
-        invitations = list(result.scalars().all())
-
-        return invitations, total
+        query = query.order_by(
+            ParentInvitation.created_at.desc(), ParentInvitation.id.desc()
+        )
+        if after is not None:
+            query = query.where(
+                tuple_(ParentInvitation.created_at, ParentInvitation.id) < after
+            )
+            return await paginate(db, query, 1, page_size, count=False)
+        return await paginate(db, query, page, page_size)
 
     async def expire_old_invitations(self, db: AsyncSession) -> int:
         """Mark expired invitations as EXPIRED. Returns count of updated."""
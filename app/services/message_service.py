@@ -2,20 +2,66 @@
 
 import logging
 import uuid
-from datetime import datetime, timezone
 
-from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy import and_, case, exists, false, func, or_, select, true, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload, with_expression
 
-from app.models.message import Message, MessageRecipient, MessageType
+from app.database import get_db_context
+from app.models.message import Message, MessageRecipient, MessageType, UserInboxCounter
 from app.models.school_class import SchoolClass, TeacherClass
 from app.models.student import ParentStudent, Student
 from app.models.user import User
+from app.services.tenant_service import get_tenant_service
+from app.utils.pagination import paginate
 from app.utils.tenant_context import get_current_user_id, get_current_user_role, get_tenant_id
 
 logger = logging.getLogger(__name__)
 
+# Loader options for messages rendered by the API's message builder. The
+# model's selectin defaults cascade (sender -> tenant, student -> tenant,
+# class -> grade level, recipient -> user -> tenant ...); load just what is
+# rendered and raise on anything else, so a new access shows up in
+# development instead of as extra queries per page.
+MESSAGE_RESPONSE_OPTIONS = (
+    selectinload(Message.sender).raiseload("*"),
+    # Student pages also show the class name; the class is usually already
+    # in the identity map from Message.school_class, so this rarely queries
+    selectinload(Message.student).options(
+        selectinload(Student.school_class).raiseload("*"),
+        raiseload("*"),
+    ),
+    selectinload(Message.school_class).raiseload("*"),
+    raiseload("*"),
+)
+
+
+def _read_by_user(user_id: uuid.UUID):
+    """SQL for whether user_id has read a message.
+
+    Messages without recipients count as read; otherwise it is the user's
+    own recipient row (unique per message), or False if they have none.
+    """
+    own_read = (
+        select(MessageRecipient.is_read)
+        .where(
+            MessageRecipient.message_id == Message.id,
+            MessageRecipient.user_id == user_id,
+        )
+        .scalar_subquery()
+    )
+    has_recipients = exists().where(MessageRecipient.message_id == Message.id)
+    return case((~has_recipients, true()), else_=func.coalesce(own_read, false()))
+
+
+def _message_response_options() -> tuple:
+    """MESSAGE_RESPONSE_OPTIONS plus the current user's read state."""
+    return (
+        *MESSAGE_RESPONSE_OPTIONS,
+        with_expression(Message.read_by_current_user, _read_by_user(get_current_user_id())),
+    )
+
 
 class MessageService:
     """Service for student-scoped teacher-parent messaging."""
@@ -24,8 +70,12 @@ class MessageService:
         self,
         db: AsyncSession,
         data: dict,
-    ) -> Message:
-        """Send a new message (always starts a new thread)."""
+    ) -> tuple[Message, uuid.UUID]:
+        """Send a new message (always starts a new thread).
+
+        Returns:
+            Tuple of (message, recipient ID) for send_message_notifications
+        """
         tenant_id = get_tenant_id()
         sender_id = get_current_user_id()
         role = get_current_user_role()
@@ -61,24 +111,23 @@ class MessageService:
             user_id=recipient_id,
         )
         db.add(recipient)
+        await self._adjust_unread(db, recipient_id, 1)
         await db.commit()
-        await db.refresh(message)
-
-        # Notifications (don't fail the send)
-        try:
-            await self._send_message_notifications(db, message, recipient_id)
-        except Exception as e:
-            logger.error(f"Failed to send message notifications: {e}")
+        message = await self._load_message(db, message.id)
 
-        return message
+        return message, recipient_id
 
     async def reply_to_thread(
         self,
         db: AsyncSession,
         thread_id: uuid.UUID,
         body: str,
-    ) -> Message:
-        """Reply to an existing thread (identified by root message ID)."""
+    ) -> tuple[Message, uuid.UUID]:
+        """Reply to an existing thread (identified by root message ID).
+
+        Returns:
+            Tuple of (message, recipient ID) for send_message_notifications
+        """
         tenant_id = get_tenant_id()
         sender_id = get_current_user_id()
         role = get_current_user_role()
@@ -86,7 +135,7 @@ class MessageService:
         # Load the root message to get student_id and determine the other user
         root_msg = await db.execute(
             select(Message)
-            .options(selectinload(Message.recipients))
+            .options(selectinload(Message.recipients).raiseload("*"), raiseload("*"))
             .where(
                 Message.id == thread_id,
                 Message.tenant_id == tenant_id,
@@ -129,15 +178,11 @@ class MessageService:
             user_id=other_user_id,
         )
         db.add(recipient)
+        await self._adjust_unread(db, other_user_id, 1)
         await db.commit()
-        await db.refresh(message)
-
-        try:
-            await self._send_message_notifications(db, message, other_user_id)
-        except Exception as e:
-            logger.error(f"Failed to send reply notifications: {e}")
+        message = await self._load_message(db, message.id)
 
-        return message
+        return message, other_user_id
 
     async def get_conversations(
         self,
@@ -180,27 +225,35 @@ class MessageService:
             .group_by(thread_id_expr)
         )
 
-        # Count total threads
-        count_q = select(func.count()).select_from(threads_q.subquery())
-        total = (await db.execute(count_q)).scalar() or 0
-
-        # Paginated
+        # Paginated; the window count runs over the grouped rows, i.e. threads
         threads_q = threads_q.order_by(func.max(Message.created_at).desc())
-        threads_q = threads_q.offset((page - 1) * page_size).limit(page_size)
-        thread_rows = (await db.execute(threads_q)).all()
+        thread_rows, total = await paginate(db, threads_q, page, page_size, scalars=False)
 
         if not thread_rows:
             return [], total
 
         thread_ids = [row.thread_id for row in thread_rows]
 
-        # Fetch root messages (gives us student_id, subject, sender, recipient)
-        root_msgs_result = await db.execute(
-            select(Message)
-            .options(selectinload(Message.recipients))
-            .where(Message.id.in_(thread_ids))
+        # Everything below is column-only selects: the inbox renders a few
+        # scalars per thread, so no Message/Student/User objects are built.
+
+        # Root messages (student, subject, sender and first recipient)
+        first_recipient = (
+            select(MessageRecipient.user_id)
+            .where(MessageRecipient.message_id == Message.id)
+            .limit(1)
+            .scalar_subquery()
         )
-        root_msgs = {m.id: m for m in root_msgs_result.scalars().all()}
+        root_rows = (await db.execute(
+            select(
+                Message.id,
+                Message.student_id,
+                Message.sender_id,
+                Message.subject,
+                first_recipient.label("recipient_id"),
+            ).where(Message.id.in_(thread_ids))
+        )).all()
+        root_msgs = {r.id: r for r in root_rows}
 
         # Determine other_user per thread
         other_user_map: dict[uuid.UUID, uuid.UUID | None] = {}
@@ -212,23 +265,35 @@ class MessageService:
             if root.student_id:
                 student_ids_set.add(root.student_id)
             if root.sender_id == user_id:
-                other_user_map[tid] = root.recipients[0].user_id if root.recipients else None
+                other_user_map[tid] = root.recipient_id
             else:
                 other_user_map[tid] = root.sender_id
 
         student_ids = list(student_ids_set)
         other_user_ids = list({uid for uid in other_user_map.values() if uid})
 
-        # Batch-fetch students and users
+        # Batch-fetch students (with class name) and users
         students_result = await db.execute(
-            select(Student).where(Student.id.in_(student_ids))
+            select(
+                Student.id,
+                func.concat_ws(" ", Student.first_name, Student.last_name).label("name"),
+                Student.photo_path,
+                SchoolClass.name.label("class_name"),
+            )
+            .outerjoin(SchoolClass, SchoolClass.id == Student.class_id)
+            .where(Student.id.in_(student_ids))
         )
-        students_map = {s.id: s for s in students_result.scalars().all()}
+        students_map = {s.id: s for s in students_result.all()}
 
         users_result = await db.execute(
-            select(User).where(User.id.in_(other_user_ids))
+            select(
+                User.id,
+                func.concat_ws(" ", User.first_name, User.last_name).label("name"),
+                User.role,
+            )
+            .where(User.id.in_(other_user_ids))
         )
-        users_map = {u.id: u for u in users_result.scalars().all()}
+        users_map = {u.id: u for u in users_result.all()}
 
         # Batch-fetch unread counts per thread
         unread_thread_expr = func.coalesce(Message.parent_message_id, Message.id)
@@ -250,9 +315,14 @@ class MessageService:
         unread_rows = (await db.execute(unread_q)).all()
         unread_map = {r.thread_id: r.cnt for r in unread_rows}
 
-        # Fetch last message per thread
+        # Last message per thread: DISTINCT ON keeps one row per thread
+        # instead of fetching every message of every thread on the page
         last_msg_q = (
-            select(Message)
+            select(
+                thread_id_expr.label("thread_id"),
+                func.substr(Message.body, 1, 100).label("body_preview"),
+                Message.sender_id,
+            )
             .where(
                 Message.tenant_id == tenant_id,
                 Message.deleted_at.is_(None),
@@ -261,16 +331,10 @@ class MessageService:
                     Message.parent_message_id.in_(thread_ids),
                 ),
             )
-            .order_by(Message.created_at.desc())
+            .distinct(thread_id_expr)
+            .order_by(thread_id_expr, Message.created_at.desc())
         )
-        last_msg_result = await db.execute(last_msg_q)
-        all_thread_msgs = last_msg_result.scalars().unique().all()
-
-        last_msg_map: dict[uuid.UUID, Message] = {}
-        for msg in all_thread_msgs:
-            tid = msg.parent_message_id if msg.parent_message_id else msg.id
-            if tid not in last_msg_map:
-                last_msg_map[tid] = msg
+        last_msg_map = {r.thread_id: r for r in (await db.execute(last_msg_q)).all()}
 
         # Build response
         conversations = []
@@ -290,21 +354,17 @@ class MessageService:
 
             last_msg = last_msg_map.get(tid)
 
-            class_name = None
-            if student.school_class:
-                class_name = student.school_class.name
-
             conversations.append({
                 "thread_id": tid,
                 "student_id": s_id,
-                "student_name": f"{student.first_name} {student.last_name}",
-                "student_photo_path": student.photo_path if hasattr(student, "photo_path") else None,
-                "class_name": class_name,
+                "student_name": student.name,
+                "student_photo_path": student.photo_path,
+                "class_name": student.class_name,
                 "other_user_id": o_id,
-                "other_user_name": f"{other_user.first_name} {other_user.last_name}",
+                "other_user_name": other_user.name,
                 "other_user_role": other_user.role,
                 "subject": root.subject,
-                "last_message_body": last_msg.body[:100] if last_msg else "",
+                "last_message_body": last_msg.body_preview if last_msg else "",
                 "last_message_at": row.last_message_at,
                 "last_message_sender_id": last_msg.sender_id if last_msg else None,
                 "unread_count": unread_map.get(tid, 0),
@@ -321,10 +381,14 @@ class MessageService:
     ) -> tuple[list[Message], int]:
         """Get all messages in a thread, ordered ASC (chat-style).
 
-        Also marks unread messages as read for the current user.
+        Also marks unread messages as read for the current user, before
+        loading, so the returned read state already reflects it.
         """
         tenant_id = get_tenant_id()
 
+        # Mark unread as read
+        await self.mark_conversation_read(db, thread_id)
+
         # All messages in this thread (root + replies)
         query = (
             select(Message)
@@ -338,26 +402,19 @@ class MessageService:
             )
         )
 
-        # Count
-        count_q = select(func.count()).select_from(query.subquery())
-        total = (await db.execute(count_q)).scalar() or 0
-
-        # Paginate (most recent messages last)
-        query = query.order_by(Message.created_at.asc())
-        # For chat, we want the latest page to show recent messages
-        if page == 1 and total > page_size:
-            offset = total - page_size
-            if offset < 0:
-                offset = 0
-        else:
-            offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
-
-        result = await db.execute(query)
-        messages = list(result.scalars().unique().all())
+        query = query.options(*_message_response_options())
 
-        # Mark unread as read
-        await self.mark_conversation_read(db, thread_id)
+        # For chat, the first page shows the most recent messages: take the
+        # newest page_size and flip them to oldest-first
+        if page == 1:
+            messages, total = await paginate(
+                db, query.order_by(Message.created_at.desc()), 1, page_size
+            )
+            messages.reverse()
+        else:
+            messages, total = await paginate(
+                db, query.order_by(Message.created_at.asc()), page, page_size
+            )
 
         return messages, total
 
@@ -392,9 +449,14 @@ class MessageService:
                 MessageRecipient.is_read == False,
                 MessageRecipient.message_id.in_(select(msg_ids_subq.c.id)),
             )
-            .values(is_read=True, read_at=datetime.now(timezone.utc))
+            .values(is_read=True, read_at=func.now())
+            # Nothing loaded needs syncing (threads mark read before loading);
+            # "auto" would fall back to fetching the matched rows first
+            .execution_options(synchronize_session=False)
         )
         result = await db.execute(stmt)
+        if result.rowcount:
+            await self._adjust_unread(db, user_id, -result.rowcount)
         await db.commit()
         return result.rowcount
 
@@ -402,22 +464,12 @@ class MessageService:
         self,
         db: AsyncSession,
     ) -> int:
-        """Get total unread message count for the current user."""
-        tenant_id = get_tenant_id()
-        user_id = get_current_user_id()
+        """Get total unread message count for the current user.
 
-        query = (
-            select(func.count(MessageRecipient.id))
-            .join(Message, Message.id == MessageRecipient.message_id)
-            .where(
-                MessageRecipient.user_id == user_id,
-                MessageRecipient.is_read == False,
-                Message.tenant_id == tenant_id,
-                Message.deleted_at.is_(None),
-            )
-        )
-        result = await db.execute(query)
-        return result.scalar() or 0
+        Clients poll this, so it reads the user's running counter (kept by
+        send, reply and mark-read) instead of counting recipient rows.
+        """
+        return await self._unread_count(db, get_current_user_id())
 
     async def get_compose_context(
         self,
@@ -617,6 +669,54 @@ class MessageService:
 
     # ============== Private Helpers ==============
 
+    async def _unread_count(self, db: AsyncSession, user_id: uuid.UUID) -> int:
+        """Read a user's unread message counter."""
+        count = await db.scalar(
+            select(UserInboxCounter.messages_unread).where(
+                UserInboxCounter.user_id == user_id
+            )
+        )
+        return count or 0
+
+    async def _adjust_unread(
+        self,
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        delta: int,
+    ) -> None:
+        """Add delta to a user's unread counter in the current transaction.
+
+        The upsert's row lock serializes concurrent sends and reads for the
+        same user, so the counter never drifts from the recipient rows.
+        """
+        stmt = pg_insert(UserInboxCounter).values(
+            user_id=user_id, messages_unread=max(delta, 0)
+        )
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[UserInboxCounter.user_id],
+                set_={
+                    "messages_unread": func.greatest(
+                        UserInboxCounter.messages_unread + delta, 0
+                    )
+                },
+            )
+        )
+
+    async def _load_message(
+        self,
+        db: AsyncSession,
+        message_id: uuid.UUID,
+    ) -> Message:
+        """Reload a just-written message with the response loader options."""
+        result = await db.execute(
+            select(Message)
+            .options(*_message_response_options())
+            .where(Message.id == message_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one()
+
     async def _get_student(
         self,
         db: AsyncSession,
@@ -707,13 +807,31 @@ class MessageService:
         else:
             raise ForbiddenException("You do not have permission to send messages")
 
-    async def _send_message_notifications(
+    async def send_message_notifications(
+        self,
+        message: Message,
+        recipient_id: uuid.UUID,
+    ) -> None:
+        """Send in-app notification, email, and WebSocket event.
+
+        Runs as a background task once the send/reply response has gone
+        out, so it opens its own session and never raises. message must
+        come from send_message or reply_to_thread (sender and student
+        loaded).
+        """
+        try:
+            async with get_db_context() as db:
+                await self._deliver_message_notifications(db, message, recipient_id)
+        except Exception as e:
+            logger.error(f"Failed to send message notifications: {e}")
+
+    async def _deliver_message_notifications(
         self,
         db: AsyncSession,
         message: Message,
         recipient_id: uuid.UUID,
     ) -> None:
-        """Send in-app notification, email, and WebSocket event."""
+        """Notify a message's recipient in-app, by email and over WebSocket."""
         from app.services.notification_service import get_notification_service
 
         notification_service = get_notification_service()
@@ -735,6 +853,7 @@ class MessageService:
             notification_type="MESSAGE_RECEIVED",
             reference_type="message",
             reference_id=message.id,
+            tenant_id=message.tenant_id,
         )
 
         # Email notification
@@ -744,21 +863,20 @@ class MessageService:
             email_service = get_email_service()
 
             # Get recipient email
-            recipient_result = await db.execute(
-                select(User).where(User.id == recipient_id)
+            recipient_email = await db.scalar(
+                select(User.email).where(User.id == recipient_id)
             )
-            recipient_user = recipient_result.scalar_one_or_none()
-            if recipient_user and recipient_user.email:
-                # Get tenant name
-                from app.models.tenant import Tenant
-                tenant = await db.get(Tenant, message.tenant_id)
-                tenant_name = tenant.name if tenant else "ClassUp"
+            if recipient_email:
+                tenant_name = (
+                    await get_tenant_service().get_tenant_name(db, message.tenant_id)
+                    or "ClassUp"
+                )
 
                 from app.config import get_settings
                 settings = get_settings()
 
                 await email_service.send(
-                    to=recipient_user.email,
+                    to=recipient_email,
                     subject=f"New message about {student_name}",
                     template_name="message_received.html",
                     context={
@@ -792,8 +910,8 @@ class MessageService:
                 },
             )
 
-            # Update unread count
-            unread = await self.get_unread_count(db)
+            # Update the recipient's unread badge
+            unread = await self._unread_count(db, recipient_id)
             await manager.send_unread_count(
                 user_id=str(recipient_id),
                 tenant_id=tenant_id,
@@ -72,9 +72,14 @@ class NotificationService:
         notification_type: str,
         reference_type: str | None = None,
         reference_id: uuid.UUID | None = None,
+        tenant_id: uuid.UUID | None = None,
     ) -> Notification:
-        """Create a new notification for a user."""
-        tenant_id = get_tenant_id()
+        """Create a new notification for a user.
+
+        tenant_id defaults to the request's tenant; background tasks, which
+        run outside the request context, pass it explicitly.
+        """
+        tenant_id = tenant_id or get_tenant_id()
 
         notification = Notification(
             tenant_id=tenant_id,
@@ -9,6 +9,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import SchoolClass, Tenant, User
+from app.services.tenant_service import invalidate_tenant_name
 from app.utils.tenant_context import get_tenant_id
 
 logger = logging.getLogger(__name__)
@@ -91,6 +92,7 @@ class OnboardingService:
 
         await db.commit()
         await db.refresh(tenant)
+        invalidate_tenant_name(tenant.id)
 
         return tenant
 
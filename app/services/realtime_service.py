@@ -1,11 +1,11 @@
 """Real-time WebSocket service with Redis pub/sub for multi-instance support."""
 
 import asyncio
-import json
 import logging
 import uuid
 from typing import Any
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 from app.config import get_settings
@@ -14,6 +14,15 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+def encode_event(event: dict[str, Any]) -> str:
+    """Encode an event as a JSON text frame.
+
+    Events are encoded once and the same string is sent to every socket
+    (and published as-is), rather than re-serialized per connection.
+    """
+    return orjson.dumps(event).decode()
+
+
 class ConnectionManager:
     """
     Manages WebSocket connections with optional Redis pub/sub for multi-instance deployment.
@@ -24,8 +33,9 @@ class ConnectionManager:
 
     def __init__(self):
         """Initialize the connection manager."""
-        # In-memory connection storage: {tenant_id:user_id: [websocket, ...]}
-        self.active_connections: dict[str, list[WebSocket]] = {}
+        # In-memory connection storage: {tenant_id: {user_id: {websocket, ...}}}
+        # so tenant broadcasts only touch that tenant's sockets
+        self.active_connections: dict[str, dict[str, set[WebSocket]]] = {}
         # Redis client for pub/sub (initialized lazily)
         self._redis = None
         self._pubsub_task = None
@@ -58,43 +68,53 @@ class ConnectionManager:
 
             async for message in pubsub.listen():
                 if message["type"] == "pmessage":
-                    channel = message["channel"]
-                    data = json.loads(message["data"])
-                    await self._deliver_local(channel, data)
+                    # Already an encoded event; forward it unparsed
+                    await self._deliver_local(message["channel"], message["data"])
         except Exception as e:
             logger.error(f"Pub/sub listener error: {e}")
         finally:
             await pubsub.close()
 
-    async def _deliver_local(self, channel: str, data: dict):
-        """Deliver a message to local connections matching the channel."""
+    async def _deliver_local(self, channel: str, text: str):
+        """Deliver an encoded event to local connections matching the channel."""
         # Parse channel format: ws:{tenant_id}:{user_id} or ws:tenant:{tenant_id}
         parts = channel.split(":")
 
         if len(parts) == 3 and parts[1] != "tenant":
             # User-specific: ws:{tenant_id}:{user_id}
-            key = f"{parts[1]}:{parts[2]}"
-            connections = self.active_connections.get(key, [])
+            connections = self._user_connections(parts[1], parts[2])
         elif len(parts) == 3 and parts[1] == "tenant":
             # Tenant-wide: ws:tenant:{tenant_id}
-            tenant_id = parts[2]
-            connections = []
-            for key, conns in self.active_connections.items():
-                if key.startswith(f"{tenant_id}:"):
-                    connections.extend(conns)
+            connections = self._tenant_connections(parts[2])
         else:
             return
 
+        await self._send_local(connections, text)
+
+    def _get_key(self, tenant_id: str, user_id: str) -> str:
+        """Generate a connection key (used for the user's pub/sub channel)."""
+        return f"{tenant_id}:{user_id}"
+
+    def _user_connections(self, tenant_id: str, user_id: str) -> list[WebSocket]:
+        """Snapshot of a user's local sockets (safe against disconnects mid-send)."""
+        return list(self.active_connections.get(tenant_id, {}).get(user_id, ()))
+
+    def _tenant_connections(self, tenant_id: str) -> list[WebSocket]:
+        """Snapshot of every local socket in a tenant."""
+        return [
+            ws
+            for sockets in self.active_connections.get(tenant_id, {}).values()
+            for ws in sockets
+        ]
+
+    async def _send_local(self, connections: list[WebSocket], text: str):
+        """Send an encoded event to local sockets, skipping broken ones."""
         for ws in connections:
             try:
-                await ws.send_json(data)
+                await ws.send_text(text)
             except Exception as e:
                 logger.debug(f"Failed to send to websocket: {e}")
 
-    def _get_key(self, tenant_id: str, user_id: str) -> str:
-        """Generate a connection key."""
-        return f"{tenant_id}:{user_id}"
-
     async def connect(
         self,
         websocket: WebSocket,
@@ -103,13 +123,10 @@ class ConnectionManager:
     ):
         """Accept and register a new WebSocket connection."""
         await websocket.accept()
-        key = self._get_key(tenant_id, user_id)
-
-        if key not in self.active_connections:
-            self.active_connections[key] = []
-        self.active_connections[key].append(websocket)
+        users = self.active_connections.setdefault(tenant_id, {})
+        users.setdefault(user_id, set()).add(websocket)
 
-        logger.info(f"WebSocket connected: {key}")
+        logger.info(f"WebSocket connected: {self._get_key(tenant_id, user_id)}")
 
         # Initialize Redis if available
         await self._get_redis()
@@ -121,17 +138,17 @@ class ConnectionManager:
         tenant_id: str,
     ):
         """Remove a WebSocket connection."""
-        key = self._get_key(tenant_id, user_id)
-
-        if key in self.active_connections:
-            try:
-                self.active_connections[key].remove(websocket)
-                if not self.active_connections[key]:
-                    del self.active_connections[key]
-            except ValueError:
-                pass
-
-        logger.info(f"WebSocket disconnected: {key}")
+        users = self.active_connections.get(tenant_id)
+        if users is not None:
+            sockets = users.get(user_id)
+            if sockets is not None:
+                sockets.discard(websocket)
+                if not sockets:
+                    del users[user_id]
+            if not users:
+                del self.active_connections[tenant_id]
+
+        logger.info(f"WebSocket disconnected: {self._get_key(tenant_id, user_id)}")
 
     async def send_to_user(
         self,
@@ -141,23 +158,19 @@ class ConnectionManager:
     ):
         """Send an event to a specific user (all their connected sessions)."""
         key = self._get_key(tenant_id, user_id)
+        text = encode_event(event)
 
         # Try Redis pub/sub first for multi-instance support
         redis = await self._get_redis()
         if redis:
             try:
-                await redis.publish(f"ws:{key}", json.dumps(event))
+                await redis.publish(f"ws:{key}", text)
                 return
             except Exception as e:
                 logger.warning(f"Redis publish failed, falling back to local: {e}")
 
         # Fallback to local delivery
-        connections = self.active_connections.get(key, [])
-        for ws in connections:
-            try:
-                await ws.send_json(event)
-            except Exception as e:
-                logger.debug(f"Failed to send to websocket: {e}")
+        await self._send_local(self._user_connections(tenant_id, user_id), text)
 
     async def broadcast_to_tenant(
         self,
@@ -165,23 +178,19 @@ class ConnectionManager:
         event: dict[str, Any],
     ):
         """Send an event to all connected users in a tenant."""
+        text = encode_event(event)
+
         # Try Redis pub/sub first
         redis = await self._get_redis()
         if redis:
             try:
-                await redis.publish(f"ws:tenant:{tenant_id}", json.dumps(event))
+                await redis.publish(f"ws:tenant:{tenant_id}", text)
                 return
             except Exception as e:
                 logger.warning(f"Redis publish failed, falling back to local: {e}")
 
         # Fallback to local delivery
-        for key, connections in self.active_connections.items():
-            if key.startswith(f"{tenant_id}:"):
-                for ws in connections:
-                    try:
-                        await ws.send_json(event)
-                    except Exception as e:
-                        logger.debug(f"Failed to send to websocket: {e}")
+        await self._send_local(self._tenant_connections(tenant_id), text)
 
     async def broadcast_to_users(
         self,
@@ -4,7 +4,8 @@ import logging
 import uuid
 from datetime import date, datetime, timezone
 
-from sqlalchemy import and_, delete, func, or_, select
+from cachetools import TTLCache
+from sqlalchemy import and_, delete, func, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -23,10 +24,40 @@ from app.schemas.report import (
 )
 from app.utils.default_templates import get_default_templates_for_education_type
 from app.exceptions import ValidationException
+from app.utils.pagination import paginate
 from app.utils.tenant_context import get_current_user_id, get_current_user_role, get_tenant_id
 
 logger = logging.getLogger(__name__)
 
+# Template detail responses are fetched by every report form but edited
+# rarely. Entries are dropped when a template changes in this process; the
+# TTL bounds staleness across workers (and after grade level renames).
+TEMPLATE_CACHE_SIZE = 1024
+TEMPLATE_CACHE_TTL = 300  # seconds
+
+_template_response_cache: TTLCache = TTLCache(
+    maxsize=TEMPLATE_CACHE_SIZE, ttl=TEMPLATE_CACHE_TTL
+)
+
+
+def get_cached_template_response(
+    tenant_id: uuid.UUID, template_id: uuid.UUID
+) -> dict | None:
+    """Get a template's cached response dict, or None on a miss."""
+    return _template_response_cache.get((tenant_id, template_id))
+
+
+def cache_template_response(
+    tenant_id: uuid.UUID, template_id: uuid.UUID, response: dict
+) -> None:
+    """Cache a template's response dict."""
+    _template_response_cache[(tenant_id, template_id)] = response
+
+
+def invalidate_template(tenant_id: uuid.UUID, template_id: uuid.UUID) -> None:
+    """Drop a template's cached response after it has been changed."""
+    _template_response_cache.pop((tenant_id, template_id), None)
+
 
 class ReportService:
     """Service for managing reports and templates."""
@@ -67,21 +98,12 @@ class ReportService:
                 ReportTemplateGradeLevel.grade_level_id == grade_level_id
             )
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await db.execute(count_query)).scalar() or 0
-
         # Apply pagination and ordering
         query = query.order_by(
             ReportTemplate.display_order,
             ReportTemplate.name,
         )
-        query = query.offset((page - 1) * page_size).limit(page_size)
-
-        result = await db.execute(query)
-        templates = list(result.scalars().all())
-
-        return templates, total
+        return await paginate(db, query, page, page_size)
 
     async def get_template(
         self,
@@ -200,9 +222,9 @@ class ReportService:
             await self._set_template_grade_levels(db, template.id, data.grade_level_ids, tenant_id)
 
         await db.commit()
-        await db.refresh(template)
 
-        # Reload with grade_levels relationship
+        # Reload with grade_levels relationship (a refresh first would only
+        # repeat the same SELECT)
         return await self.get_template(db, template.id)
 
     async def update_template(
@@ -239,6 +261,7 @@ class ReportService:
             await self._set_template_grade_levels(db, template_id, data.grade_level_ids, tenant_id)
 
         await db.commit()
+        invalidate_template(tenant_id, template_id)
 
         # Reload with grade_levels relationship
         return await self.get_template(db, template_id)
@@ -256,6 +279,7 @@ class ReportService:
         template.deleted_at = datetime.now(timezone.utc)
         template.is_active = False
         await db.commit()
+        invalidate_template(template.tenant_id, template_id)
 
         return True
 
@@ -367,6 +391,7 @@ class ReportService:
                 template.sections = new_sections
                 from sqlalchemy.orm.attributes import flag_modified
                 flag_modified(template, "sections")
+                invalidate_template(tenant_id, template.id)
                 logger.info("Repaired ACADEMIC_GRADES section in template %s", template.id)
 
         await db.flush()
@@ -462,19 +487,39 @@ class ReportService:
         status: str | None = None,
         page: int = 1,
         page_size: int = 20,
-    ) -> tuple[list[dict], int]:
-        """Get reports with optional filters."""
+        after: tuple[date, datetime, uuid.UUID] | None = None,
+    ) -> tuple[list[dict], int | None]:
+        """Get reports with optional filters, newest report date first.
+
+        Args:
+            after: (report_date, created_at, id) of the last report already
+                seen. Fetches the next page by keyset instead of OFFSET; page
+                is ignored, the total is skipped (None) and up to
+                page_size + 1 reports are returned
+        """
         tenant_id = get_tenant_id()
 
-        # Build query with joins
+        # Select just the list columns. Loading DailyReport entities would
+        # pull every report_data blob plus the selectin cascade under each
+        # student, class and template, none of which the list shows.
         query = (
-            select(DailyReport)
-            .options(
-                selectinload(DailyReport.student),
-                selectinload(DailyReport.school_class),
-                selectinload(DailyReport.template),
-                selectinload(DailyReport.created_by_user),
+            select(
+                DailyReport.id,
+                DailyReport.student_id,
+                func.concat_ws(" ", Student.first_name, Student.last_name).label("student_name"),
+                DailyReport.class_id,
+                SchoolClass.name.label("class_name"),
+                DailyReport.template_id,
+                ReportTemplate.name.label("template_name"),
+                ReportTemplate.report_type,
+                DailyReport.report_date,
+                DailyReport.status,
+                DailyReport.finalized_at,
+                DailyReport.created_at,
             )
+            .join(Student, Student.id == DailyReport.student_id)
+            .join(SchoolClass, SchoolClass.id == DailyReport.class_id)
+            .join(ReportTemplate, ReportTemplate.id == DailyReport.template_id)
             .where(
                 DailyReport.tenant_id == tenant_id,
                 DailyReport.deleted_at.is_(None),
@@ -501,61 +546,38 @@ class ReportService:
         if status:
             query = query.where(DailyReport.status == status)
 
-        # Get total count
-        count_query = select(func.count()).select_from(
-            select(DailyReport.id)
-            .where(
-                DailyReport.tenant_id == tenant_id,
-                DailyReport.deleted_at.is_(None),
-            )
-            .subquery()
-        )
-
-        # Re-apply filters for count
-        count_base = select(DailyReport.id).where(
-            DailyReport.tenant_id == tenant_id,
-            DailyReport.deleted_at.is_(None),
-        )
-        if role == Role.TEACHER.value:
-            count_base = count_base.where(DailyReport.class_id.in_(teacher_classes_subquery))
-        if class_id:
-            count_base = count_base.where(DailyReport.class_id == class_id)
-        if student_id:
-            count_base = count_base.where(DailyReport.student_id == student_id)
-        if template_id:
-            count_base = count_base.where(DailyReport.template_id == template_id)
-        if report_date:
-            count_base = count_base.where(DailyReport.report_date == report_date)
-        if status:
-            count_base = count_base.where(DailyReport.status == status)
-
-        count_query = select(func.count()).select_from(count_base.subquery())
-        total = (await db.execute(count_query)).scalar() or 0
-
         # Apply pagination and ordering
-        query = query.order_by(DailyReport.report_date.desc(), DailyReport.created_at.desc())
-        query = query.offset((page - 1) * page_size).limit(page_size)
-
-        result = await db.execute(query)
-        reports = list(result.scalars().all())
+        query = query.order_by(
+            DailyReport.report_date.desc(),
+            DailyReport.created_at.desc(),
+            DailyReport.id.desc(),
+        )
+        if after is not None:
+            query = query.where(
+                tuple_(DailyReport.report_date, DailyReport.created_at, DailyReport.id) < after
+            )
+            rows, total = await paginate(db, query, 1, page_size, count=False, scalars=False)
+        else:
+            rows, total = await paginate(db, query, page, page_size, scalars=False)
 
         # Format response
-        report_list = []
-        for report in reports:
-            report_list.append({
-                "id": report.id,
-                "student_id": report.student_id,
-                "student_name": f"{report.student.first_name} {report.student.last_name}" if report.student else None,
-                "class_id": report.class_id,
-                "class_name": report.school_class.name if report.school_class else None,
-                "template_id": report.template_id,
-                "template_name": report.template.name if report.template else None,
-                "report_type": report.template.report_type if report.template else None,
-                "report_date": report.report_date,
-                "status": report.status,
-                "finalized_at": report.finalized_at,
-                "created_at": report.created_at,
-            })
+        report_list = [
+            {
+                "id": row.id,
+                "student_id": row.student_id,
+                "student_name": row.student_name,
+                "class_id": row.class_id,
+                "class_name": row.class_name,
+                "template_id": row.template_id,
+                "template_name": row.template_name,
+                "report_type": row.report_type,
+                "report_date": row.report_date,
+                "status": row.status,
+                "finalized_at": row.finalized_at,
+                "created_at": row.created_at,
+            }
+            for row in rows
+        ]
 
         return report_list, total
 
@@ -649,9 +671,9 @@ class ReportService:
 
         db.add(report)
         await db.commit()
-        await db.refresh(report)
 
-        # Reload with relationships
+        # Reload with relationships; get_report repopulates the expired
+        # instance, so no refresh (and its four selectin loads) beforehand
         return await self.get_report(db, report.id)
 
     async def update_report(
@@ -3,9 +3,9 @@
 import uuid
 from datetime import date
 
-from sqlalchemy import func, select
+from sqlalchemy import exists, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from app.exceptions import ConflictException, ForbiddenException, NotFoundException
 from app.models import ParentStudent, SchoolClass, Student, TeacherClass, User
@@ -15,8 +15,23 @@ from app.schemas.student import (
     StudentCreate,
     StudentUpdate,
 )
+from app.utils.pagination import paginate
 from app.utils.tenant_context import get_current_user_id, get_current_user_role, get_tenant_id
 
+# Loader options for student lists, which render the class and its grade
+# level only. The model's selectin defaults cascade much further (tenant,
+# parent links -> parents, class -> teachers, grade level -> every class and
+# template in it); join the two many-to-ones into the main query and raise
+# on anything else, so a new access shows up in development instead of as
+# extra queries per page.
+STUDENT_LIST_OPTIONS = (
+    joinedload(Student.school_class).options(
+        joinedload(SchoolClass.grade_level_rel).raiseload("*"),
+        raiseload("*"),
+    ),
+    raiseload("*"),
+)
+
 
 class StudentService:
     """Service for managing students."""
@@ -31,16 +46,22 @@ class StudentService:
         search: str | None = None,
         page: int = 1,
         page_size: int = 20,
-    ) -> tuple[list[Student], int]:
-        """Get list of students with optional filters."""
+        after: tuple[str, str, uuid.UUID] | None = None,
+    ) -> tuple[list[Student], int | None]:
+        """Get list of students with optional filters, ordered by name.
+
+        Args:
+            after: (first_name, last_name, id) of the last student already
+                seen. Fetches the next page by keyset instead of OFFSET; page
+                is ignored, the total is skipped (None) and up to
+                page_size + 1 students are returned
+        """
         tenant_id = get_tenant_id()
 
         query = (
             select(Student)
             .where(Student.tenant_id == tenant_id, Student.deleted_at.is_(None))
-            .options(
-                selectinload(Student.school_class).selectinload(SchoolClass.grade_level_rel)
-            )
+            .options(*STUDENT_LIST_OPTIONS)
         )
 
         # Teachers only see students from their assigned classes
@@ -73,18 +94,14 @@ class StudentService:
                 | (Student.last_name.ilike(search_term))
             )
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total = (await db.execute(count_query)).scalar() or 0
-
-        # Apply pagination
-        query = query.order_by(Student.first_name, Student.last_name)
-        query = query.offset((page - 1) * page_size).limit(page_size)
-
-        result = await db.execute(query)
-        students = list(result.scalars().unique().all())
-
-        return students, total
+        # Apply pagination (id breaks ties between students with equal names)
+        query = query.order_by(Student.first_name, Student.last_name, Student.id)
+        if after is not None:
+            query = query.where(
+                tuple_(Student.first_name, Student.last_name, Student.id) > after
+            )
+            return await paginate(db, query, 1, page_size, count=False)
+        return await paginate(db, query, page, page_size)
 
     async def get_student(
         self,
@@ -102,7 +119,7 @@ class StudentService:
                 Student.deleted_at.is_(None),
             )
             .options(
-                selectinload(Student.school_class).selectinload(SchoolClass.grade_level_rel),
+                joinedload(Student.school_class).joinedload(SchoolClass.grade_level_rel),
                 selectinload(Student.parent_students).selectinload(ParentStudent.parent),
             )
         )
@@ -214,6 +231,22 @@ class StudentService:
         result = await db.execute(query)
         return list(result.all())
 
+    async def is_child_of(
+        self,
+        db: AsyncSession,
+        student_id: uuid.UUID,
+        parent_id: uuid.UUID,
+    ) -> bool:
+        """Check whether a student is linked to a parent (an index-only EXISTS)."""
+        return await db.scalar(
+            select(
+                exists().where(
+                    ParentStudent.student_id == student_id,
+                    ParentStudent.parent_id == parent_id,
+                )
+            )
+        )
+
     async def link_parent(
         self,
         db: AsyncSession,
@@ -300,9 +333,7 @@ class StudentService:
                 Student.tenant_id == tenant_id,
                 Student.deleted_at.is_(None),
             )
-            .options(
-                selectinload(Student.school_class).selectinload(SchoolClass.grade_level_rel)
-            )
+            .options(*STUDENT_LIST_OPTIONS)
         )
 
         result = await db.execute(query)
@@ -344,6 +375,13 @@ class StudentService:
             link.is_primary = False
 
 
+# Singleton instance
+_student_service: StudentService | None = None
+
+
 def get_student_service() -> StudentService:
-    """Get student service instance."""
-    return StudentService()
+    """Get the student service singleton."""
+    global _student_service
+    if _student_service is None:
+        _student_service = StudentService()
+    return _student_service
@@ -4,6 +4,7 @@ import re
 import uuid
 from datetime import datetime
 
+from cachetools import TTLCache
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -14,6 +15,20 @@ from app.models.tenant import EducationType, get_default_tenant_settings
 from app.models.user import Role
 from app.utils.security import hash_password
 
+# Tenant names change rarely but are needed for every invitation email.
+# Entries are dropped on rename in this process; the TTL bounds staleness
+# for renames made by other workers.
+TENANT_NAME_CACHE_SIZE = 1024
+TENANT_NAME_CACHE_TTL = 300
+_tenant_name_cache: TTLCache = TTLCache(
+    maxsize=TENANT_NAME_CACHE_SIZE, ttl=TENANT_NAME_CACHE_TTL
+)
+
+
+def invalidate_tenant_name(tenant_id: uuid.UUID) -> None:
+    """Drop a tenant's cached name after it has been changed."""
+    _tenant_name_cache.pop(tenant_id, None)
+
 
 class TenantService:
     """Service for managing tenants (schools/organizations)."""
@@ -70,6 +85,17 @@ class TenantService:
 
         return tenant
 
+    async def get_tenant_name(
+        self, db: AsyncSession, tenant_id: uuid.UUID
+    ) -> str | None:
+        """Get a tenant's display name, cached in-process."""
+        name = _tenant_name_cache.get(tenant_id)
+        if name is None:
+            name = await db.scalar(select(Tenant.name).where(Tenant.id == tenant_id))
+            if name is not None:
+                _tenant_name_cache[tenant_id] = name
+        return name
+
     async def get_tenant_by_slug(self, db: AsyncSession, slug: str) -> Tenant | None:
         """Get a tenant by slug."""
         query = select(Tenant).where(
@@ -240,6 +266,7 @@ class TenantService:
 
         await db.commit()
         await db.refresh(tenant)
+        invalidate_tenant_name(tenant.id)
 
         return tenant
 
@@ -270,6 +270,13 @@ class UserService:
         return result.scalar() or 0
 
 
+# Singleton instance
+_user_service: UserService | None = None
+
+
 def get_user_service() -> UserService:
-    """Get user service instance."""
-    return UserService()
+    """Get the user service singleton."""
+    global _user_service
+    if _user_service is None:
+        _user_service = UserService()
+    return _user_service
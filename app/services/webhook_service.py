@@ -12,7 +12,7 @@ from urllib.parse import urlparse
 from uuid import UUID
 
 import httpx
-from sqlalchemy import and_, select
+from sqlalchemy import and_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import WebhookEndpoint, WebhookEvent
@@ -20,6 +20,18 @@ from app.utils.tenant_context import get_tenant_id
 
 logger = logging.getLogger(__name__)
 
+# Columns of WebhookEventBrief: event listings without the payload and
+# response body, which can be large
+EVENT_BRIEF_COLUMNS = (
+    WebhookEvent.id,
+    WebhookEvent.event_type,
+    WebhookEvent.status,
+    WebhookEvent.attempts,
+    WebhookEvent.last_attempt_at,
+    WebhookEvent.response_code,
+    WebhookEvent.created_at,
+)
+
 
 class WebhookService:
     """Service for managing webhooks and dispatching events."""
@@ -345,20 +357,37 @@ class WebhookService:
         db: AsyncSession,
         endpoint_id: UUID,
         limit: int = 50,
-    ) -> list[WebhookEvent]:
-        """Get recent events for a webhook endpoint."""
+        before: tuple[datetime, UUID] | None = None,
+        brief: bool = False,
+    ) -> list:
+        """Get recent events for a webhook endpoint, newest first.
+
+        Args:
+            before: (created_at, id) of the last event already shown; only
+                older events are returned (keyset pagination)
+            brief: Select just the WebhookEventBrief columns as rows, leaving
+                out the payload and response body
+
+        Returns:
+            WebhookEvent models, or rows of the brief columns
+        """
         # Verify endpoint belongs to tenant
         endpoint = await self.get_endpoint(db, endpoint_id)
         if not endpoint:
             return []
 
-        result = await db.execute(
-            select(WebhookEvent)
+        columns = EVENT_BRIEF_COLUMNS if brief else (WebhookEvent,)
+        query = (
+            select(*columns)
             .where(WebhookEvent.endpoint_id == endpoint_id)
-            .order_by(WebhookEvent.created_at.desc())
+            .order_by(WebhookEvent.created_at.desc(), WebhookEvent.id.desc())
             .limit(limit)
         )
-        return list(result.scalars().all())
+        if before:
+            query = query.where(tuple_(WebhookEvent.created_at, WebhookEvent.id) < before)
+
+        result = await db.execute(query)
+        return list(result.all() if brief else result.scalars().all())
 
     async def retry_failed_event(
         self,
@@ -0,0 +1,143 @@
+"""Pagination helpers for list queries."""
+
+import base64
+from datetime import date, datetime
+from typing import Any
+from urllib.parse import quote, unquote
+from uuid import UUID
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.common import PaginationMeta
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    page: int,
+    page_size: int,
+    *,
+    scalars: bool = True,
+    count: bool = True,
+) -> tuple[list[Any], int | None]:
+    """Run a paginated query and return (items, total) in one round-trip.
+
+    The total comes from a COUNT(*) OVER () window column added to the page
+    query. Window functions are evaluated before LIMIT/OFFSET, so every row
+    carries the full match count. Only a page past the end (no rows) falls
+    back to a separate COUNT query.
+
+    With count=False the total is skipped entirely (it forces Postgres to
+    visit every matching row): total is None and up to page_size + 1 items
+    are returned, the extra one signalling a next page. Pass the result to
+    pagination_meta, which trims it.
+
+    Args:
+        db: Database session
+        query: Filtered and ordered select
+        page: 1-based page number
+        page_size: Items per page
+        scalars: Return the first column of each row (the entity). When
+            False, return the rows themselves, for column-only selects
+        count: Compute the total number of matching items
+
+    Returns:
+        Tuple of (items on this page, total matching items)
+    """
+    if not count:
+        stmt = query.offset((page - 1) * page_size).limit(page_size + 1)
+        result = await db.execute(stmt)
+        return list(result.scalars() if scalars else result.all()), None
+
+    stmt = (
+        query.add_columns(func.count().over().label("total_count"))
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    )
+    rows = (await db.execute(stmt)).all()
+
+    if rows:
+        items = [row[0] for row in rows] if scalars else list(rows)
+        return items, rows[0].total_count
+
+    if page == 1:
+        return [], 0
+
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    total = (await db.execute(count_query)).scalar() or 0
+    return [], total
+
+
+def pagination_meta(
+    items: list[Any],
+    page: int,
+    page_size: int,
+    total: int | None,
+) -> tuple[list[Any], PaginationMeta]:
+    """Build pagination metadata for a page from paginate.
+
+    When total is None the look-ahead item is dropped and has_next comes
+    from whether it was there; total_items and total_pages are left unset.
+
+    Returns:
+        Tuple of (items on this page, pagination metadata)
+    """
+    if total is None:
+        return items[:page_size], PaginationMeta(
+            page=page,
+            page_size=page_size,
+            has_next=len(items) > page_size,
+            has_prev=page > 1,
+        )
+
+    total_pages = (total + page_size - 1) // page_size
+    return items, PaginationMeta(
+        page=page,
+        page_size=page_size,
+        total_items=total,
+        total_pages=total_pages,
+        has_next=page < total_pages,
+        has_prev=page > 1,
+    )
+
+
+CursorValue = date | datetime | UUID | str
+
+_CURSOR_PARSERS = {
+    date: date.fromisoformat,
+    datetime: datetime.fromisoformat,
+    UUID: UUID,
+    str: unquote,
+}
+
+
+def _encode_cursor_value(value: CursorValue) -> str:
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, str):
+        # Free text (e.g. names) may contain the separator
+        return quote(value, safe="")
+    return str(value)
+
+
+def encode_cursor(*values: CursorValue) -> str:
+    """Encode a keyset position, e.g. (created_at, id), as an opaque cursor."""
+    raw = "|".join(_encode_cursor_value(v) for v in values).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple[CursorValue, ...]:
+    """Decode a cursor from encode_cursor into values of the given types.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        parts = raw.split("|")
+        if len(parts) != len(types):
+            raise ValueError("Wrong number of cursor values")
+        return tuple(_CURSOR_PARSERS[t](part) for t, part in zip(types, parts))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
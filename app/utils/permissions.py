@@ -30,24 +30,17 @@ def require_role(*allowed_roles: Role | str) -> Callable:
     Returns:
         Decorator function
     """
-    # Convert Role enums to strings for comparison
-    role_values = set()
-    for role in allowed_roles:
-        if isinstance(role, Role):
-            role_values.add(role.value)
-        else:
-            role_values.add(role)
+    # Resolve the allowed set once at decoration time. Super admins can
+    # access everything, so fold them in and keep the per-request check to
+    # a single frozenset membership test.
+    role_values = frozenset(
+        role.value if isinstance(role, Role) else role for role in allowed_roles
+    ) | {Role.SUPER_ADMIN.value}
 
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            current_role = get_current_user_role()
-
-            # Super admins can access everything
-            if current_role == Role.SUPER_ADMIN.value:
-                return await func(*args, **kwargs)
-
-            if current_role not in role_values:
+            if get_current_user_role() not in role_values:
                 raise HTTPException(
                     status_code=403,
                     detail="You don't have permission to perform this action",
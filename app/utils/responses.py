@@ -0,0 +1,27 @@
+"""Response classes for JSON API endpoints.
+
+Hot list endpoints pair PydanticJSONResponse with ``_build_*`` helpers that
+create response schemas through ``model_construct``. Those helpers copy
+loaded database columns whose types already match the schema, so pydantic
+validation would only re-check values the database has already typed.
+Constructing the models directly skips that work; tests/test_api/
+test_response_builders.py checks each builder against model_validate.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSON response serialized directly by pydantic-core.
+
+    Returning one of these from an endpoint skips FastAPI's response_model
+    validation and jsonable_encoder pass; the envelope and its models go
+    straight through the Rust serializer. Use it for list endpoints whose
+    content is already built from response schemas.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -6,9 +6,18 @@ from typing import Any
 
 import bcrypt
 import jwt
+from starlette.responses import Response
 
 from app.config import settings
 
+# Attributes of the access_token cookie that never change between responses.
+# Together with the HttpOnly/Max-Age prefix this is byte-identical to what
+# Response.set_cookie(httponly=True, samesite="lax",
+# secure=settings.is_production) emits (Morsel sorts attributes by name).
+_ACCESS_COOKIE_SUFFIX = "; Path=/; SameSite=lax" + (
+    "; Secure" if settings.is_production else ""
+)
+
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt.
@@ -256,3 +265,19 @@ def get_tenant_id_from_token(token: str) -> uuid.UUID | None:
         except (ValueError, TypeError):
             return None
     return None
+
+
+def set_access_token_cookie(response: Response, token: str, max_age: int) -> None:
+    """Attach the HttpOnly access_token cookie to a response.
+
+    Appends a pre-built Set-Cookie header instead of going through
+    Response.set_cookie, which builds a SimpleCookie/Morsel per call.
+    JWTs are URL-safe base64 segments, so the value needs no quoting.
+
+    Args:
+        response: Response to attach the cookie to
+        token: Encoded access token
+        max_age: Cookie lifetime in seconds
+    """
+    cookie = f"access_token={token}; HttpOnly; Max-Age={max_age}{_ACCESS_COOKIE_SUFFIX}"
+    response.raw_headers.append((b"set-cookie", cookie.encode("latin-1")))
@@ -221,17 +221,16 @@ async def student_attendance_history(
     student_service = get_student_service()
     attendance_service = get_attendance_service()
 
-    # Get the student
-    student = await student_service.get_student(db, student_id)
-
     # Parents can only view their own children
     if user.role == Role.PARENT.value:
-        parent_ids = [ps.parent_id for ps in student.parent_students]
-        if user.id not in parent_ids:
+        if not await student_service.is_child_of(db, student_id, user.id):
             raise ForbiddenException("You can only view your own children's attendance")
     elif not permissions.can_view_attendance():
         raise ForbiddenException("You don't have permission to view attendance")
 
+    # Get the student
+    student = await student_service.get_student(db, student_id)
+
     # Get attendance history
     records, total, summary = await attendance_service.get_student_attendance_history(
         db,
@@ -9,6 +9,7 @@ from app.database import get_db
 from app.schemas.auth import LoginRequest, RegisterRequest
 from app.services.auth_service import get_auth_service
 from app.templates_config import templates
+from app.utils.security import set_access_token_cookie
 from app.utils.tenant_context import get_current_language
 
 router = APIRouter()
@@ -65,14 +66,7 @@ async def login_submit(
         if remember_me:
             cookie_max_age = settings.jwt_refresh_token_expire_days * 24 * 60 * 60
 
-        redirect.set_cookie(
-            key="access_token",
-            value=login_response.access_token,
-            httponly=True,
-            secure=settings.is_production,
-            samesite="lax",
-            max_age=cookie_max_age,
-        )
+        set_access_token_cookie(redirect, login_response.access_token, cookie_max_age)
 
         return redirect
 
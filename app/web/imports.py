@@ -181,21 +181,8 @@ async def imports_mapping(
     # Get available fields for this import type
     available_fields = IMPORT_FIELDS.get(job.import_type, {})
 
-    # Get CSV headers from stored content
-    headers = []
-    sample_rows = []
-    csv_content = job.column_mapping.get("_csv_content", "")
-    if csv_content:
-        import csv
-        import io
-
-        reader = csv.DictReader(io.StringIO(csv_content))
-        headers = reader.fieldnames or []
-        for i, row in enumerate(reader):
-            if i < 3:
-                sample_rows.append(dict(row))
-            else:
-                break
+    # Get CSV headers and a few sample rows from the stored upload
+    headers, sample_rows = await service.get_job_sample(db, job)
 
     return templates.TemplateResponse(
         "imports/mapping.html",
@@ -8,11 +8,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.exceptions import ForbiddenException
-from app.models import Student, User
+from app.models import User
 from app.models.user import Role
 from app.services.auth_service import get_auth_service
 from app.services.class_service import get_class_service
-from app.services.invitation_service import get_invitation_service
+from app.services.invitation_service import (
+    INVITATION_LIST_OPTIONS,
+    get_invitation_service,
+)
 from app.services.student_service import get_student_service
 from app.templates_config import templates
 from app.utils.permissions import PermissionChecker
@@ -78,13 +81,14 @@ async def invitations_list(
         student_id=student_id,
         page=page,
         page_size=20,
+        options=INVITATION_LIST_OPTIONS,
     )
 
-    # Enrich invitations with student and creator names
+    # Enrich invitations with student and creator names (eager-loaded)
     enriched_invitations = []
     for inv in invitations:
-        student = await db.get(Student, inv.student_id)
-        creator = await db.get(User, inv.created_by)
+        student = inv.student
+        creator = inv.created_by_user
         enriched_invitations.append({
             "id": inv.id,
             "email": inv.email,
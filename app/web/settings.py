@@ -10,6 +10,7 @@ from app.database import get_db
 from app.models import Tenant
 from app.services.auth_service import get_auth_service
 from app.services.grade_level_service import get_grade_level_service
+from app.services.tenant_service import invalidate_tenant_name
 from app.templates_config import templates
 from app.utils.tenant_context import (
     get_current_user_id_or_none,
@@ -103,6 +104,7 @@ async def settings_general_save(
         tenant.settings = settings
 
         await db.commit()
+        invalidate_tenant_name(tenant.id)
 
     return RedirectResponse(url="/settings/general?saved=1", status_code=302)
 
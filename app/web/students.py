@@ -366,14 +366,14 @@ async def student_detail(
     permissions = PermissionChecker(user.role)
 
     student_service = get_student_service()
-    student = await student_service.get_student(db, student_id)
 
     # Parents can only view their own children
     if user.role == Role.PARENT.value:
-        parent_ids = [ps.parent_id for ps in student.parent_students]
-        if user.id not in parent_ids:
+        if not await student_service.is_child_of(db, student_id, user.id):
             raise ForbiddenException("You can only view your own children")
 
+    student = await student_service.get_student(db, student_id)
+
     # Fetch pending invitations for this student (for staff)
     pending_invitations = []
     if permissions.can_invite_parents():
@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.exceptions import ForbiddenException
-from app.models import ClassSubject, ParentStudent, TeacherClass, Tenant
+from app.models import ClassSubject, TeacherClass, Tenant
 from app.models.user import Role, User
 from app.services.auth_service import get_auth_service
 from app.services.class_service import get_class_service
@@ -222,18 +222,13 @@ async def child_schedule(
 
     await _ensure_feature_enabled(db)
 
+    student_service = get_student_service()
+
     # Parent access check
     if user.role == Role.PARENT.value:
-        check = await db.execute(
-            select(ParentStudent).where(
-                ParentStudent.parent_id == user.id,
-                ParentStudent.student_id == student_id,
-            )
-        )
-        if not check.scalar_one_or_none():
+        if not await student_service.is_child_of(db, student_id, user.id):
             raise ForbiddenException("You can only view your own children")
 
-    student_service = get_student_service()
     student = await student_service.get_student(db, student_id)
 
     service = get_timetable_service()
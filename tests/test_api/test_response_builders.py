@@ -0,0 +1,195 @@
+"""Tests for the unvalidated response builders (see app.utils.responses)."""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.v1.messages import _build_message_response
+from app.api.v1.students import _build_student_list_response, _build_student_response
+from app.api.v1.webhooks import (
+    _build_endpoint_response,
+    _build_event_brief,
+    _build_event_response,
+)
+from app.models import GradeLevel, SchoolClass, Student
+from app.schemas.message import MessageResponse
+from app.schemas.student import StudentListResponse
+from app.schemas.webhook import (
+    WebhookEndpointResponse,
+    WebhookEventBrief,
+    WebhookEventResponse,
+)
+
+
+def _message():
+    # Distinct timestamps so a swapped mapping is caught
+    now = datetime.now(timezone.utc)
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        sender_id=uuid.uuid4(),
+        sender=SimpleNamespace(first_name="Ada", last_name="Moyo", role="TEACHER"),
+        message_type="CLASS",
+        subject="Trip",
+        body="Bring a hat.",
+        student_id=uuid.uuid4(),
+        student=SimpleNamespace(first_name="Tino", last_name="Moyo"),
+        school_class=SimpleNamespace(name="Grade 1A"),
+        parent_message_id=None,
+        status="SENT",
+        read_by_current_user=True,
+        created_at=now,
+        updated_at=now + timedelta(minutes=5),
+    )
+
+
+def _endpoint():
+    # Distinct timestamps so a swapped mapping is caught
+    now = datetime.now(timezone.utc)
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        tenant_id=uuid.uuid4(),
+        url="https://example.com/hook",
+        events=["student.created"],
+        is_active=True,
+        created_at=now,
+        updated_at=now + timedelta(minutes=5),
+    )
+
+
+def _event():
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        endpoint_id=uuid.uuid4(),
+        event_type="student.created",
+        payload={"id": "1"},
+        status="FAILED",
+        attempts=3,
+        last_attempt_at=None,
+        response_code=500,
+        response_body="error",
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def _event_brief_row():
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        event_type="student.created",
+        status="DELIVERED",
+        attempts=1,
+        last_attempt_at=datetime.now(timezone.utc),
+        response_code=200,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def _student(**overrides) -> Student:
+    grade_level = GradeLevel(id=uuid.uuid4(), name="Grade 1")
+    school_class = SchoolClass(
+        id=uuid.uuid4(),
+        name="Grade 1A",
+        grade_level_id=grade_level.id,
+        grade_level_rel=grade_level,
+    )
+    fields = dict(
+        id=uuid.uuid4(),
+        tenant_id=uuid.uuid4(),
+        first_name="Tino",
+        last_name="Moyo",
+        date_of_birth=date(2019, 1, 1),
+        class_id=school_class.id,
+        school_class=school_class,
+        photo_path=None,
+        emergency_contacts=[],
+        is_active=True,
+        enrollment_date=date(2024, 1, 10),
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+    fields.update(overrides)
+    return Student(**fields)
+
+
+@pytest.mark.parametrize(
+    ("build", "schema", "make_source"),
+    [
+        (_build_endpoint_response, WebhookEndpointResponse, _endpoint),
+        (_build_event_response, WebhookEventResponse, _event),
+        (_build_event_brief, WebhookEventBrief, _event_brief_row),
+        (_build_student_list_response, StudentListResponse, _student),
+    ],
+    ids=["webhook_endpoint", "webhook_event", "webhook_event_brief", "student_list"],
+)
+def test_builder_matches_validated_model(build, schema, make_source):
+    """model_construct yields the same payload validating the source would."""
+    source = make_source()
+
+    built = build(source)
+    validated = schema.model_validate(source)
+
+    assert built.model_dump_json() == validated.model_dump_json()
+
+
+def test_message_builder_matches_validated_model():
+    """The flattened sender, student and class names validate unchanged."""
+    message = _message()
+    expected = MessageResponse.model_validate({
+        "id": message.id,
+        "sender_id": message.sender_id,
+        "sender_name": "Ada Moyo",
+        "sender_role": "TEACHER",
+        "message_type": "CLASS",
+        "subject": "Trip",
+        "body": "Bring a hat.",
+        "student_id": message.student_id,
+        "student_name": "Tino Moyo",
+        "class_name": "Grade 1A",
+        "parent_message_id": None,
+        "status": "SENT",
+        "is_read": True,
+        "created_at": message.created_at,
+        "updated_at": message.updated_at,
+    })
+
+    built = _build_message_response(message)
+
+    assert built.model_dump() == expected.model_dump()
+    assert built.model_dump_json() == expected.model_dump_json()
+
+
+def test_event_brief_leaves_out_bodies():
+    """Brief rows carry only the delivery summary columns."""
+    assert "payload" not in _build_event_brief(_event_brief_row()).model_dump()
+
+
+def test_student_list_reads_computed_fields_from_model():
+    """full_name, class_name and the inherited grade level come from the ORM row."""
+    student = _student()
+
+    response = _build_student_list_response(student)
+
+    assert response.full_name == "Tino Moyo"
+    assert response.class_name == "Grade 1A"
+    assert response.effective_grade_level_id == student.school_class.grade_level_id
+    assert response.effective_grade_level_name == "Grade 1"
+
+
+def test_student_list_without_class():
+    """Students without a class have no class or grade level fields."""
+    response = _build_student_list_response(_student(class_id=None, school_class=None))
+
+    assert response.class_name is None
+    assert response.effective_grade_level_id is None
+    assert response.effective_grade_level_name is None
+
+
+def test_student_response_includes_age():
+    """The full response carries the age computed by the model."""
+    student = _student()
+
+    response = _build_student_response(student)
+
+    assert response.age == student.age
+    assert response.full_name == "Tino Moyo"
@@ -0,0 +1,16 @@
+"""Tests for the optional Redis cache."""
+
+from app.services import cache_service
+from app.services.cache_service import CacheService
+
+
+async def test_cache_is_a_no_op_without_redis(monkeypatch):
+    """Without REDIS_URL reads miss and writes are silently skipped."""
+    monkeypatch.setattr(cache_service.settings, "redis_url", None)
+    cache = CacheService()
+
+    await cache.set("unread:t:u", "3", ttl=30)
+    await cache.incr("ann_ver:t")
+    await cache.delete("unread:t:u")
+
+    assert await cache.get("unread:t:u") is None
@@ -0,0 +1,40 @@
+"""Tests for the byte-scan CSV row count used by the import preview."""
+
+import csv
+import io
+
+import pytest
+
+from app.services import import_service
+from app.services.import_service import _count_csv_rows
+
+
+def _reader_count(data: bytes) -> int:
+    text = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8-sig", newline="")
+    return sum(1 for _ in csv.DictReader(text))
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"a,b\n1,2\n3,4\n",
+        b"a,b\n1,2\n3,4",
+        b"a,b\n1,2\n\n3,4\n\n\n",
+        b"a,b\r\n1,2\r\n\r\n3,4\r\n\r\n",
+        b"a,b\r1,2\r\r3,4",
+        b"a,b\n",
+        b"",
+    ],
+    ids=["lf", "no_trailing_newline", "blank_lines", "crlf_blank_lines", "cr", "header_only", "empty"],
+)
+@pytest.mark.parametrize("chunk_size", [1, 2, 1024])
+def test_count_matches_dict_reader(monkeypatch, data, chunk_size):
+    """Blank lines are skipped exactly as csv.DictReader skips them."""
+    monkeypatch.setattr(import_service, "ROW_COUNT_CHUNK_SIZE", chunk_size)
+
+    assert _count_csv_rows(io.BytesIO(data)) == _reader_count(data)
+
+
+def test_quoted_file_falls_back_to_reader():
+    """A quote may hide an embedded newline, so the scan gives up."""
+    assert _count_csv_rows(io.BytesIO(b'a,b\n"x\ny",2\n')) is None
@@ -0,0 +1,30 @@
+"""Tests for keyset cursor encoding."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trips_names_containing_the_separator():
+    """Free-text values are escaped, so a '|' in a name can't split them."""
+    student_id = uuid.uuid4()
+    cursor = encode_cursor("Ann|e", "O'Neil 100%", student_id)
+
+    assert decode_cursor(cursor, str, str, uuid.UUID) == ("Ann|e", "O'Neil 100%", student_id)
+
+
+def test_cursor_round_trips_datetimes():
+    """Timestamps keep their timezone through the cursor."""
+    created_at = datetime(2026, 10, 17, 8, 30, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, row_id), datetime, uuid.UUID) == (created_at, row_id)
+
+
+def test_malformed_cursor_raises_value_error():
+    """Endpoints turn this into a 400."""
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor", str, str, uuid.UUID)
@@ -0,0 +1,49 @@
+"""Tests for the in-memory WebSocket connection registry."""
+
+from app.services.realtime_service import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        self.sent.append(text)
+
+
+async def _no_redis():
+    return None
+
+
+async def test_broadcast_reaches_only_the_tenants_sockets(monkeypatch):
+    """Tenant broadcasts and user sends stay within their tenant and user."""
+    manager = ConnectionManager()
+    monkeypatch.setattr(manager, "_get_redis", _no_redis)
+    alice, alice_tab, bob, other = (FakeWebSocket() for _ in range(4))
+    await manager.connect(alice, "alice", "t1")
+    await manager.connect(alice_tab, "alice", "t1")
+    await manager.connect(bob, "bob", "t1")
+    await manager.connect(other, "carol", "t2")
+
+    await manager.broadcast_to_tenant("t1", {"type": "ping"})
+    await manager.send_to_user("alice", "t1", {"type": "unread_count"})
+
+    assert alice.sent == alice_tab.sent == ['{"type":"ping"}', '{"type":"unread_count"}']
+    assert bob.sent == ['{"type":"ping"}']
+    assert other.sent == []
+
+
+async def test_disconnect_prunes_empty_entries(monkeypatch):
+    """Dropping the last socket removes the user and then the tenant."""
+    manager = ConnectionManager()
+    monkeypatch.setattr(manager, "_get_redis", _no_redis)
+    ws = FakeWebSocket()
+    await manager.connect(ws, "alice", "t1")
+
+    await manager.disconnect(ws, "alice", "t1")
+    await manager.disconnect(ws, "alice", "t1")
+
+    assert manager.active_connections == {}
@@ -0,0 +1,20 @@
+"""Tests that service factories hand out shared instances."""
+
+from app.services.file_service import get_file_service
+from app.services.grade_level_service import get_grade_level_service
+from app.services.import_service import get_import_service
+from app.services.message_service import get_message_service
+from app.services.report_service import get_report_service
+from app.services.student_service import get_student_service
+from app.services.user_service import get_user_service
+
+
+def test_service_factories_return_singletons():
+    """Repeated calls reuse one instance (and the file service's S3 client)."""
+    assert get_file_service() is get_file_service()
+    assert get_grade_level_service() is get_grade_level_service()
+    assert get_import_service() is get_import_service()
+    assert get_message_service() is get_message_service()
+    assert get_report_service() is get_report_service()
+    assert get_student_service() is get_student_service()
+    assert get_user_service() is get_user_service()